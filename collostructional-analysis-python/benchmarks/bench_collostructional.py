@@ -0,0 +1,301 @@
+"""
+Benchmarks for the Collostructional Analysis Methods
+
+Runs every analysis type on synthetic Zipfian data at several scales and
+reports wall time, peak memory and throughput (rows/sec). Results are
+stored as JSON so that runs from different commits can be compared.
+
+Cases:
+* simple      : Simple Collexeme Analysis on a frequency table
+* dca2        : Distinctive Collexeme Analysis, raw tokens, 2 constructions
+* mdca        : Multiple Distinctive Collexeme Analysis, raw tokens
+* covarying   : Co-varying Collexeme Analysis on slot pairs
+Each case except mdca (no Fisher test) runs with and without FYE.
+"Rows" are input rows: words for simple, tokens for the others.
+
+Usage:
+    python benchmarks/bench_collostructional.py --scales 3 4 5 6
+    python benchmarks/bench_collostructional.py --scales 7 --cases covarying
+    python benchmarks/bench_collostructional.py --compare old.json new.json
+
+Notes:
+* Timing is the best of --repeat runs. Peak memory is measured in a
+  separate run under tracemalloc (NumPy and pandas buffers included),
+  because tracing slows allocation-heavy code. Use --no-memory to skip it.
+* 10^7-row token cases need several GB of RAM.
+"""
+
+import sys
+import os
+import json
+import time
+import platform
+import argparse
+import subprocess
+import tracemalloc
+from datetime import datetime, timezone
+
+import numpy as np
+import pandas as pd
+import scipy
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+try:
+    # 1. repository structure with package
+    from core.collostructional_analysis import CollostructionalAnalysisMain
+except ImportError:
+    # 2. Loading in Colab or flat structure (when files are in the same location)
+    from collostructional_analysis import CollostructionalAnalysisMain
+
+
+CASES = ["simple", "dca2", "mdca", "covarying"]
+ZIPF_EXPONENT = 1.1
+# Ratio above which --compare reports a slowdown
+REGRESSION_RATIO = 1.2
+
+
+# ------------------------------------------------------------------
+# Synthetic data
+# ------------------------------------------------------------------
+
+def zipf_tokens(rng, n_rows: int, vocab_size: int, prefix: str,
+                exponent: float = ZIPF_EXPONENT) -> np.ndarray:
+    """Draw n_rows tokens from a finite Zipf distribution over vocab_size types"""
+    ranks = np.arange(1, vocab_size + 1)
+    p = ranks ** -exponent
+    p /= p.sum()
+    codes = rng.choice(vocab_size, size=n_rows, p=p)
+    vocab = np.array([f"{prefix}{i}" for i in range(vocab_size)], dtype=object)
+    return vocab[codes]
+
+
+def vocab_size_for(n_rows: int) -> int:
+    """Type count growing with corpus size (roughly Heaps' law)"""
+    return max(50, int(10 * n_rows ** 0.6))
+
+
+def make_simple_table(rng, n_rows: int) -> pd.DataFrame:
+    """Frequency table: WORD, FREQ_WORD_in_CORPUS, FREQ_WORD_in_CONSTRUCTION"""
+    ranks = np.arange(1, n_rows + 1)
+    freq_corpus = np.maximum(1, (1e6 * ranks ** -ZIPF_EXPONENT)).astype(np.int64)
+    freq_corpus += rng.integers(0, 3, n_rows)
+    share = rng.beta(0.5, 20, n_rows)
+    freq_const = rng.binomial(freq_corpus, share)
+    return pd.DataFrame({
+        "WORD": [f"w{i}" for i in range(n_rows)],
+        "FREQ_WORD_in_CORPUS": freq_corpus,
+        "FREQ_WORD_in_CONSTRUCTION": freq_const
+    })
+
+
+def make_token_list(rng, n_rows: int, n_constructions: int) -> pd.DataFrame:
+    """Raw token list: Verb, Construction"""
+    words = zipf_tokens(rng, n_rows, vocab_size_for(n_rows), "v")
+    const_p = rng.dirichlet(np.ones(n_constructions))
+    constructions = rng.choice(
+        [f"cx{i}" for i in range(n_constructions)], size=n_rows, p=const_p
+    )
+    return pd.DataFrame({"Verb": words, "Construction": constructions})
+
+
+def make_slot_pairs(rng, n_rows: int) -> pd.DataFrame:
+    """Slot pairs: WORD_SLOT1, WORD_SLOT2"""
+    vocab = vocab_size_for(n_rows)
+    return pd.DataFrame({
+        "WORD_SLOT1": zipf_tokens(rng, n_rows, vocab, "s"),
+        "WORD_SLOT2": zipf_tokens(rng, n_rows, vocab, "t")
+    })
+
+
+def make_case(case: str, n_rows: int, seed: int):
+    """Return (data, run kwargs) for a benchmark case"""
+    rng = np.random.default_rng(seed)
+    if case == "simple":
+        df = make_simple_table(rng, n_rows)
+        kwargs = dict(
+            analysis_type=1,
+            word_col="WORD",
+            freq_corpus_col="FREQ_WORD_in_CORPUS",
+            freq_const_col="FREQ_WORD_in_CONSTRUCTION",
+            total_corpus_size=int(df["FREQ_WORD_in_CORPUS"].sum() * 2)
+        )
+    elif case == "dca2":
+        df = make_token_list(rng, n_rows, 2)
+        kwargs = dict(analysis_type=2, word_col="Verb",
+                      construction_col="Construction")
+    elif case == "mdca":
+        df = make_token_list(rng, n_rows, 6)
+        kwargs = dict(analysis_type=2, word_col="Verb",
+                      construction_col="Construction")
+    elif case == "covarying":
+        df = make_slot_pairs(rng, n_rows)
+        kwargs = dict(analysis_type=3, slot1_col="WORD_SLOT1",
+                      slot2_col="WORD_SLOT2")
+    else:
+        raise ValueError(f"Unknown case: {case}")
+    return df, kwargs
+
+
+# ------------------------------------------------------------------
+# Measurement
+# ------------------------------------------------------------------
+
+def _run_quiet(df, kwargs, include_fisher: bool):
+    """Run one analysis with its progress prints suppressed"""
+    metrics = None
+    if not include_fisher:
+        metrics = ["PEARSONRESID", "LLR", "PMI", "LOGODDSRATIO",
+                   "DELTAP", "KLD"]
+    return CollostructionalAnalysisMain.run(
+        df, metrics=metrics, verbose=False, **kwargs
+    )
+
+
+def measure(df, kwargs, include_fisher: bool, repeat: int = 3,
+            memory: bool = True) -> dict:
+    """Wall time (best of repeat) and tracemalloc peak of one case"""
+    times = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        result = _run_quiet(df, kwargs, include_fisher)
+        times.append(time.perf_counter() - t0)
+
+    peak_mb = None
+    if memory:
+        tracemalloc.start()
+        try:
+            _run_quiet(df, kwargs, include_fisher)
+            peak_mb = tracemalloc.get_traced_memory()[1] / 2**20
+        finally:
+            tracemalloc.stop()
+
+    wall = min(times)
+    return {
+        "wall_s": wall,
+        "wall_s_all": times,
+        "peak_mb": peak_mb,
+        "rows_per_s": len(df) / wall if wall > 0 else None,
+        "output_rows": len(result)
+    }
+
+
+def environment_info() -> dict:
+    """Versions and commit, so results can be matched to a tree"""
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+            capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        "commit": commit,
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "numpy": np.__version__,
+        "pandas": pd.__version__,
+        "scipy": scipy.__version__
+    }
+
+
+def run_benchmarks(scales, cases, repeat: int = 3, memory: bool = True,
+                   seed: int = 0) -> dict:
+    """Run every (case, scale, fisher) combination"""
+    results = []
+    for exponent in scales:
+        n_rows = 10 ** exponent
+        for case in cases:
+            df, kwargs = make_case(case, n_rows, seed)
+            fisher_options = [False] if case == "mdca" else [True, False]
+            for include_fisher in fisher_options:
+                stats = measure(df, kwargs, include_fisher,
+                                repeat=repeat, memory=memory)
+                entry = {
+                    "case": case,
+                    "rows": n_rows,
+                    "fisher": include_fisher,
+                    **stats
+                }
+                results.append(entry)
+                peak = (f"{entry['peak_mb']:9.1f} MB"
+                        if entry["peak_mb"] is not None else "        - ")
+                print(f"  {case:<10} 10^{exponent:<2} "
+                      f"fisher={str(include_fisher):<5} "
+                      f"{entry['wall_s']:9.3f} s  {peak}  "
+                      f"{entry['rows_per_s']:12,.0f} rows/s")
+    return {"environment": environment_info(), "results": results}
+
+
+# ------------------------------------------------------------------
+# Regression comparison
+# ------------------------------------------------------------------
+
+def compare(old: dict, new: dict, threshold: float = REGRESSION_RATIO) -> int:
+    """Print new/old wall-time ratios; returns the number of regressions"""
+    def _key(entry):
+        return (entry["case"], entry["rows"], entry["fisher"])
+
+    old_by_key = {_key(e): e for e in old["results"]}
+    print(f"Comparing {old['environment'].get('commit')} -> "
+          f"{new['environment'].get('commit')}")
+    regressions = 0
+    for entry in new["results"]:
+        base = old_by_key.get(_key(entry))
+        if base is None:
+            continue
+        ratio = entry["wall_s"] / base["wall_s"]
+        flag = ""
+        if ratio > threshold:
+            flag = "  << SLOWER"
+            regressions += 1
+        mem = ""
+        if entry.get("peak_mb") and base.get("peak_mb"):
+            mem = f"  mem x{entry['peak_mb'] / base['peak_mb']:.2f}"
+        print(f"  {entry['case']:<10} rows={entry['rows']:<9} "
+              f"fisher={str(entry['fisher']):<5} "
+              f"{base['wall_s']:8.3f} s -> {entry['wall_s']:8.3f} s  "
+              f"x{ratio:.2f}{mem}{flag}")
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Benchmark the collostructional analysis kernels"
+    )
+    parser.add_argument("--scales", type=int, nargs="+", default=[3, 4, 5],
+                        help="Row counts as powers of ten (3..7)")
+    parser.add_argument("--cases", nargs="+", default=CASES, choices=CASES)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--no-memory", action="store_true",
+                        help="Skip the tracemalloc peak-memory run")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", default="bench_results.json",
+                        help="JSON file for the results")
+    parser.add_argument("--compare", nargs=2, metavar=("OLD", "NEW"),
+                        help="Compare two result files instead of running")
+    args = parser.parse_args(argv)
+
+    if args.compare:
+        with open(args.compare[0]) as f:
+            old = json.load(f)
+        with open(args.compare[1]) as f:
+            new = json.load(f)
+        return 1 if compare(old, new) else 0
+
+    print("=== Collostructional Analysis Benchmarks ===")
+    report = run_benchmarks(
+        args.scales, args.cases, repeat=args.repeat,
+        memory=not args.no_memory, seed=args.seed
+    )
+    with open(args.output, "w") as f:
+        json.dump(report, f, indent=2)
+    print(f"Results saved to {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
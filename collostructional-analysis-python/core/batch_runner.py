@@ -0,0 +1,267 @@
+"""
+Command-line batch runner for Collostructional Analysis jobs
+
+Runs CollostructionalAnalysisMain.run for one job given on the command
+line, or for many jobs listed in a JSON manifest, optionally in parallel
+worker processes. Every job reports its wall time and peak memory, and
+a failing job does not stop the others.
+
+Manifest format (relative paths are relative to the manifest file):
+    {
+      "defaults": {"signed_metrics": true, "p_adjust": ["BH"]},
+      "jobs": [
+        {"name": "ditransitive", "input": "ditr.csv", "analysis_type": 1,
+         "total_corpus_size": 138664, "output": "out/ditr.parquet"},
+        {"name": "dative", "input": "dative.parquet", "analysis_type": 2,
+         "word_col": "Verb", "construction_col": "Construction"}
+      ]
+    }
+Besides "name", "input" and "output", job keys are keyword arguments of
+CollostructionalAnalysisMain.run (defaults apply to every job).
+
+Usage:
+    python -m core.batch_runner jobs.json --workers 4 --report report.json
+    python -m core.batch_runner --input tokens.csv --type 2 \\
+        --word-col Verb --construction-col Construction --output dca.parquet
+
+Notes:
+* Peak memory is the tracemalloc peak of the job (NumPy and pandas
+  buffers included). Tracing slows allocation-heavy code; use
+  --no-memory to skip it.
+* Progress prints of the analyzers are suppressed unless --verbose.
+"""
+
+import sys
+import os
+import json
+import time
+import inspect
+import argparse
+import traceback
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+try:
+    # 1. repository structure with package
+    from core.collostructional_analysis import (
+        CollostructionalAnalysisMain, _resolve_n_jobs
+    )
+except ImportError:
+    # 2. Loading in Colab or flat structure (when files are in the same location)
+    from collostructional_analysis import (
+        CollostructionalAnalysisMain, _resolve_n_jobs
+    )
+
+
+# Job keys handled by the runner itself (not passed to run)
+_RUNNER_KEYS = ("name", "input", "output")
+_RUN_OPTIONS = set(
+    inspect.signature(CollostructionalAnalysisMain.run).parameters
+) - {"df", "output_path"}
+
+
+def load_manifest(path: str) -> list:
+    """
+    Job specs from a JSON manifest, with defaults applied.
+
+    The manifest is either a list of jobs or an object with "jobs" and
+    optional "defaults". Relative input / output paths are resolved
+    against the manifest directory.
+    """
+    with open(path) as f:
+        manifest = json.load(f)
+    if isinstance(manifest, list):
+        manifest = {"jobs": manifest}
+    defaults = manifest.get("defaults", {})
+    base_dir = os.path.dirname(os.path.abspath(path))
+
+    jobs = []
+    for i, spec in enumerate(manifest.get("jobs", [])):
+        job = {**defaults, **spec}
+        job.setdefault("name", f"job{i + 1}")
+        for key in ("input", "output", "cache_dir"):
+            if job.get(key) is not None:
+                job[key] = os.path.join(base_dir, job[key])
+        jobs.append(job)
+    return jobs
+
+
+def validate_job(job: dict):
+    """Raise ValueError for a job spec run() would not accept"""
+    name = job.get("name", "?")
+    for key in ("input", "analysis_type"):
+        if key not in job:
+            raise ValueError(f"Error: Job '{name}' has no '{key}'.")
+    unknown = set(job) - _RUN_OPTIONS - set(_RUNNER_KEYS)
+    if unknown:
+        raise ValueError(
+            f"Error: Job '{name}' has unknown options: "
+            f"{', '.join(sorted(unknown))}"
+        )
+
+
+def run_job(job: dict, memory: bool = True, verbose: bool = False) -> dict:
+    """
+    Run one job and return its report entry.
+
+    Returns:
+        dict with name, status ("ok" / "error"), wall_s, peak_mb,
+        output_rows, output and error (traceback text on failure)
+    """
+    options = {k: v for k, v in job.items() if k not in _RUNNER_KEYS}
+    entry = {"name": job["name"], "input": os.fspath(job["input"]),
+             "output": job.get("output"), "status": "ok", "wall_s": None,
+             "peak_mb": None, "output_rows": None, "error": None}
+
+    # A job's own "verbose" option wins over the runner-wide flag
+    options.setdefault("verbose", verbose)
+    if memory:
+        tracemalloc.start()
+    t0 = time.perf_counter()
+    try:
+        result = CollostructionalAnalysisMain.run(
+            job["input"], output_path=job.get("output"), **options
+        )
+        entry["output_rows"] = len(result)
+    except Exception:
+        entry["status"] = "error"
+        entry["error"] = traceback.format_exc()
+    finally:
+        entry["wall_s"] = time.perf_counter() - t0
+        if memory:
+            entry["peak_mb"] = tracemalloc.get_traced_memory()[1] / 2**20
+            tracemalloc.stop()
+    return entry
+
+
+def run_jobs(jobs: list, workers: int = 1, memory: bool = True,
+             verbose: bool = False) -> list:
+    """
+    Run jobs serially or in worker processes.
+
+    Args:
+        jobs: Job specs (see load_manifest)
+        workers: Worker processes (1: serial, -1: all cores)
+    Returns:
+        Report entries in job order
+    """
+    for job in jobs:
+        validate_job(job)
+    names = [job["name"] for job in jobs]
+    if len(set(names)) != len(names):
+        raise ValueError("Error: Job names must be unique.")
+
+    workers = min(_resolve_n_jobs(workers), max(len(jobs), 1))
+    entries = {}
+    if workers > 1:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = {pool.submit(run_job, job, memory, verbose): job["name"]
+                       for job in jobs}
+            for future in as_completed(futures):
+                entry = future.result()
+                entries[entry["name"]] = entry
+                _print_entry(entry)
+    else:
+        for job in jobs:
+            entry = run_job(job, memory, verbose)
+            entries[entry["name"]] = entry
+            _print_entry(entry)
+    return [entries[name] for name in names]
+
+
+def _print_entry(entry: dict):
+    peak = (f"{entry['peak_mb']:9.1f} MB" if entry["peak_mb"] is not None
+            else "        - ")
+    rows = (f"{entry['output_rows']:>10,} rows"
+            if entry["output_rows"] is not None else "")
+    print(f"  {entry['name']:<20} {entry['status']:<5} "
+          f"{entry['wall_s']:9.3f} s  {peak}  {rows}", flush=True)
+    if entry["error"]:
+        # Last line of the traceback: exception type and message
+        print(f"    {entry['error'].strip().splitlines()[-1]}", flush=True)
+
+
+def _job_from_args(args) -> dict:
+    """Single job spec from command-line options"""
+    job = {"name": args.name, "input": args.input,
+           "analysis_type": args.type, "output": args.output}
+    optional = {
+        "word_col": args.word_col,
+        "freq_corpus_col": args.freq_corpus_col,
+        "freq_const_col": args.freq_const_col,
+        "construction_col": args.construction_col,
+        "slot1_col": args.slot1_col,
+        "slot2_col": args.slot2_col,
+        "total_corpus_size": args.total_corpus_size,
+        "metrics": args.metrics,
+        "p_adjust": args.p_adjust,
+        "cache_dir": args.cache_dir
+    }
+    job.update({k: v for k, v in optional.items() if v is not None})
+    if args.signed_metrics:
+        job["signed_metrics"] = True
+    if args.n_jobs != 1:
+        job["n_jobs"] = args.n_jobs
+    return job
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Run collostructional analysis jobs from the command "
+                    "line or a JSON manifest"
+    )
+    parser.add_argument("manifest", nargs="?",
+                        help="JSON manifest of jobs (see module docstring)")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="Parallel jobs (-1: all cores)")
+    parser.add_argument("--report", help="JSON file for per-job results")
+    parser.add_argument("--no-memory", action="store_true",
+                        help="Skip tracemalloc peak-memory measurement")
+    parser.add_argument("--verbose", action="store_true",
+                        help="Show the analyzers' progress output")
+
+    single = parser.add_argument_group("single job (instead of a manifest)")
+    single.add_argument("--input", help="CSV/TSV, Parquet or Feather file")
+    single.add_argument("--type", type=int, choices=[1, 2, 3],
+                        help="1: Simple, 2: Distinctive, 3: Co-varying")
+    single.add_argument("--output", help="Result file (.parquet or .csv)")
+    single.add_argument("--name", default="job1")
+    single.add_argument("--word-col")
+    single.add_argument("--freq-corpus-col")
+    single.add_argument("--freq-const-col")
+    single.add_argument("--construction-col")
+    single.add_argument("--slot1-col")
+    single.add_argument("--slot2-col")
+    single.add_argument("--total-corpus-size", type=int)
+    single.add_argument("--signed-metrics", action="store_true")
+    single.add_argument("--metrics", nargs="+")
+    single.add_argument("--p-adjust", nargs="+")
+    single.add_argument("--cache-dir")
+    single.add_argument("--n-jobs", type=int, default=1,
+                        help="Worker processes inside the job's kernel")
+    args = parser.parse_args(argv)
+
+    if args.manifest:
+        jobs = load_manifest(args.manifest)
+    elif args.input and args.type:
+        jobs = [_job_from_args(args)]
+    else:
+        parser.error("give a manifest, or --input and --type")
+
+    print(f"=== Collostructional Analysis: {len(jobs)} job(s) ===")
+    t0 = time.perf_counter()
+    entries = run_jobs(jobs, workers=args.workers,
+                       memory=not args.no_memory, verbose=args.verbose)
+    failed = sum(entry["status"] != "ok" for entry in entries)
+    print(f"Done in {time.perf_counter() - t0:.3f} s: "
+          f"{len(entries) - failed} ok, {failed} failed")
+
+    if args.report:
+        with open(args.report, "w") as f:
+            json.dump({"jobs": entries}, f, indent=2)
+        print(f"Report saved to {args.report}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
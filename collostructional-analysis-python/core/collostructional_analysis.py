@@ -23,21 +23,370 @@ Reference:
 
 """
 
+import os
+import json
+import math
+import time
+import operator
+import warnings
+import importlib.util
+import hashlib
+import shutil
+import contextlib
+import contextvars
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
 import pandas as pd
+from pandas.api.types import union_categoricals
 import numpy as np
+from scipy import sparse
 from scipy.stats import hypergeom # we didn't use fisher_exact
-from scipy.special import logsumexp
+from scipy.special import gammaln, logsumexp
 from abc import ABC, abstractmethod
 
+try:
+    import fcntl
+except ImportError:  # Windows: no lock, growth is still atomic
+    fcntl = None
+
+
+@contextlib.contextmanager
+def _file_lock(path: str):
+    """Exclusive inter-process lock held on path (no-op without fcntl)"""
+    with open(path, "a") as fh:
+        if fcntl is not None:
+            fcntl.flock(fh, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(fh, fcntl.LOCK_UN)
+
+
+class LogFactorialTable:
+    """
+    Lazily grown lookup table of log(k!) values.
+
+    The Fisher engine evaluates hypergeometric log-PMFs as sums of
+    log-factorials. Since N and the margins are shared by many tables
+    (e.g. every row of a Simple collexeme run), the values are computed
+    once and looked up afterwards.
+
+    * Growth happens on demand, geometrically, up to max_entries.
+      Larger arguments are evaluated with gammaln directly.
+    * With mmap_path, the table lives in a float64 file on disk and is
+      memory-mapped, so it can cover corpora with hundreds of millions
+      of tokens and be reused across sessions. Several processes may
+      share the file: growth is serialized by a lock file and written
+      as a whole new file that atomically replaces the old one.
+    * hits / misses count lookups served from the table / by gammaln
+      (arguments beyond max_entries).
+    """
+
+    # Entries computed per gammaln call while growing
+    _CHUNK = 1 << 22
+
+    def __init__(self, max_entries: int = 10_000_000, mmap_path: str = None,
+                 read_only: bool = False):
+        """
+        Args:
+            max_entries: Upper bound on the number of table entries
+                (10M entries = 80 MB)
+            mmap_path: Optional file used as memory-mapped storage
+            read_only: Never grow the table (nor write mmap_path);
+                arguments beyond it are evaluated with gammaln
+        """
+        self.max_entries = max_entries
+        self.mmap_path = mmap_path
+        self.read_only = read_only
+        self.hits = 0
+        self.misses = 0
+        self._table = np.zeros(0)
+        if mmap_path and os.path.exists(mmap_path):
+            self._open_mmap()
+
+    def __len__(self):
+        return len(self._table)
+
+    def __call__(self, k) -> np.ndarray:
+        """Returns log(k!) for an array of non-negative integers"""
+        k = np.asarray(k)
+        if k.size == 0:
+            return np.zeros(k.shape)
+        self.ensure(int(k.max()))
+        size = len(self._table)
+
+        # Counted after growth: misses are arguments beyond the cap
+        n_hits = int(np.count_nonzero(k < size))
+        self.hits += n_hits
+        self.misses += k.size - n_hits
+
+        if k.max() < size:
+            return self._table[k]
+        in_table = k < size
+        out = np.empty(k.shape)
+        out[in_table] = self._table[k[in_table]]
+        out[~in_table] = gammaln(k[~in_table] + 1.0)
+        return out
+
+    def ensure(self, max_k: int):
+        """Grow the table to cover log(0!) .. log(max_k!) (up to the cap)"""
+        size = len(self._table)
+        if self.read_only or max_k < size or size >= self.max_entries:
+            return
+        # Geometric growth amortizes many small extensions
+        target = min(max(max_k + 1, 2 * size), self.max_entries)
+
+        if self.mmap_path:
+            self._grow_mmap(target)
+        else:
+            table = np.empty(target)
+            table[:size] = self._table
+            for start in range(size, target, self._CHUNK):
+                stop = min(start + self._CHUNK, target)
+                table[start:stop] = gammaln(np.arange(start, stop) + 1.0)
+            self._table = table
+
+    def _grow_mmap(self, target: int):
+        """
+        Grow the mmap file to at least target entries.
+
+        Under the lock, the file length is checked again (another process
+        may have grown it meanwhile) and the grown table is written to a
+        temporary file that replaces the old one with os.replace, so the
+        file never holds a partial or interleaved table.
+        """
+        self._table = np.zeros(0)  # release the current mapping
+        with _file_lock(self.mmap_path + ".lock"):
+            size = (os.path.getsize(self.mmap_path) // 8
+                    if os.path.exists(self.mmap_path) else 0)
+            if size < target:
+                tmp_path = f"{self.mmap_path}.{os.getpid()}.tmp"
+                try:
+                    with open(tmp_path, "wb") as fh:
+                        if size:
+                            with open(self.mmap_path, "rb") as src:
+                                shutil.copyfileobj(src, fh)
+                            fh.truncate(size * 8)
+                            fh.seek(size * 8)
+                        for start in range(size, target, self._CHUNK):
+                            stop = min(start + self._CHUNK, target)
+                            gammaln(np.arange(start, stop) + 1.0).tofile(fh)
+                    os.replace(tmp_path, self.mmap_path)
+                finally:
+                    if os.path.exists(tmp_path):
+                        os.remove(tmp_path)
+        self._open_mmap()
+
+    def stats(self) -> dict:
+        """Cache statistics for inspection"""
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._table),
+            "max_entries": self.max_entries,
+            "mmap_path": self.mmap_path,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else np.nan,
+        }
+
+    def reset_stats(self):
+        """Reset the hit/miss counters"""
+        self.hits = 0
+        self.misses = 0
+
+    def _open_mmap(self):
+        n_entries = os.path.getsize(self.mmap_path) // 8
+        self._table = (
+            np.memmap(self.mmap_path, dtype=np.float64, mode="r",
+                      shape=(n_entries,))
+            if n_entries else np.zeros(0)
+        )
+
+
+def _import_mpmath():
+    """Import mpmath with an informative error if it is missing"""
+    try:
+        import mpmath
+    except ImportError as e:
+        raise ImportError(
+            "The mpmath Fisher backend requires mpmath (pip install mpmath)."
+        ) from e
+    return mpmath
+
+
+def _mpmath_available() -> bool:
+    """True if mpmath can be imported (without importing it)"""
+    return importlib.util.find_spec("mpmath") is not None
+
+
+def _log10_ratio(num: int, den: int) -> float:
+    """log10(num / den) for positive integers of any size"""
+    # Keep ~64 significant bits of the quotient before taking the log
+    shift = max(den.bit_length() - num.bit_length() + 64, 0)
+    return math.log10((num << shift) // den) - shift * math.log10(2)
+
+
+def _compile_numba_fused_loop():
+    """
+    Compile the per-table loop of the fused LLR / PMI / KLD kernel.
+
+    Mirrors the branches of calc_llr, calc_pmi and calc_kld one table
+    at a time. Writes LLR, PMI, KLDC2W and KLDW2C into the rows of out.
+    """
+    try:
+        import numba
+    except ImportError as e:
+        raise ImportError(
+            "The numba backend requires numba (pip install numba)."
+        ) from e
+
+    # error_model="numpy": division by zero gives inf / nan, as in NumPy
+    jit = numba.njit(cache=True, error_model="numpy")
+
+    @jit
+    def _llr_term(observed, expected):
+        if observed > 0 and expected > 0:
+            return observed * np.log(observed / expected)
+        return 0.0
+
+    @jit
+    def _kld_sum(p1, p2, q1, q2):
+        val = 0.0
+        if p1 > 0:
+            if q1 > 0:
+                val += p1 * np.log2(p1 / q1)
+            else:
+                return np.inf
+        if p2 > 0:
+            if q2 > 0:
+                val += p2 * np.log2(p2 / q2)
+            else:
+                return np.inf
+        return val
+
+    @jit
+    def _loop(a, b, c, d, N, exp_a, out):
+        for i in range(a.shape[0]):
+            ai, bi, ci, di, n = a[i], b[i], c[i], d[i], N[i]
+            row1, row2 = ai + bi, ci + di
+            col1, col2 = ai + ci, bi + di
+
+            out[0, i] = 2 * (
+                _llr_term(ai, exp_a[i]) + _llr_term(bi, (col2 * row1) / n)
+                + _llr_term(ci, (col1 * row2) / n)
+                + _llr_term(di, (col2 * row2) / n)
+            )
+
+            p_w_c, p_w, p_c = ai / n, col1 / n, row1 / n
+            if p_w_c > 0 and p_w > 0 and p_c > 0:
+                out[1, i] = np.log2(p_w_c / (p_w * p_c))
+            else:
+                out[1, i] = -np.inf
+
+            if row1 > 0 and n > 0:
+                out[2, i] = _kld_sum(ai / row1, bi / row1, col1 / n, col2 / n)
+            else:
+                out[2, i] = np.nan
+            if col1 > 0 and n > 0:
+                out[3, i] = _kld_sum(ai / col1, ci / col1, row1 / n, row2 / n)
+            else:
+                out[3, i] = np.nan
+
+    return _loop
+
 
 class AssociationStatsKernel:
     """
     Statistics calculation kernel specialized for association measures.
-    
-    Functions as pure logic without state, returning metrics for 
+
+    Functions as pure logic without state (apart from the shared
+    log-factorial cache), returning metrics for
     contingency table input (a,b,c,d).
     """
 
+    # Shared by all Fisher computations; replace it to change the memory
+    # bound or to use a memory-mapped table, e.g.
+    # AssociationStatsKernel.log_factorial_table = LogFactorialTable(
+    #     max_entries=500_000_000, mmap_path="logfact.f64")
+    log_factorial_table = LogFactorialTable()
+
+    # Running totals of the table deduplication (see dedup_stats)
+    dedup_counts = {"tables": 0, "unique_tables": 0}
+
+    # Backend of the fused LLR / PMI / KLD kernel: "numpy" (default) or
+    # "numba" (compiled loop, requires numba; see calc_llr_pmi_kld_batch)
+    fused_backend = "numpy"
+    _numba_fused_loop = None
+
+    # Fisher p-value precision: "float" (float64 fast path only), or
+    # "precise" / "mpmath" / "exact" to recompute the tables flagged by
+    # fisher_risky_rows with calculate_fisher_p_precise ("precise":
+    # mpmath when importable, else exact)
+    fisher_precision = "float"
+    FISHER_PRECISIONS = ("float", "precise", "mpmath", "exact")
+    # Working digits of the "mpmath" backend
+    fisher_dps = 50
+    # Largest N for the "exact" backend (seconds per table beyond it);
+    # larger tables go to mpmath, with a warning
+    FISHER_EXACT_MAX_N = 100_000
+
+    # Class-level options that can change the results (see settings)
+    _SETTINGS = ("fused_backend", "fisher_precision", "fisher_dps",
+                 "FISHER_EXACT_MAX_N")
+
+    # Selectable metric groups for calculate_all_metrics_batch(metrics=...)
+    # and the output columns each one produces. Direction and the cell
+    # values a, b, c, d are always returned.
+    METRIC_GROUPS = {
+        "PEARSONRESID": ("PEARSONRESID",),
+        "LLR": ("LLR",),
+        "PMI": ("PMI",),
+        "LOGODDSRATIO": ("LOGODDSRATIO", "LogOdds_SE", "LogOdds_CI_Lower",
+                         "LogOdds_CI_Upper", "LogOdds_CrossesZero"),
+        "FYE": ("Fisher_p_value", "FYE"),
+        "DELTAP": ("DELTAPC2W", "DELTAPW2C"),
+        "KLD": ("KLDC2W", "KLDW2C"),
+    }
+    # Co-varying output names
+    _METRIC_ALIASES = {
+        "DELTAP1TO2": "DELTAP", "DELTAP2TO1": "DELTAP",
+        "KLD1TO2": "KLD", "KLD2TO1": "KLD",
+    }
+
+    @classmethod
+    def resolve_metrics(cls, metrics=None) -> set:
+        """
+        Resolve a metric selection to the set of METRIC_GROUPS keys.
+
+        Accepts group names or any output column name (case-insensitive),
+        e.g. ["PMI", "LLR"] or ["LogOdds_CI_Lower", "DELTAP1TO2"].
+        None selects every group.
+        """
+        if metrics is None:
+            return set(cls.METRIC_GROUPS)
+        if isinstance(metrics, str):
+            metrics = [metrics]
+
+        lookup = {alias: group
+                  for alias, group in cls._METRIC_ALIASES.items()}
+        for group, columns in cls.METRIC_GROUPS.items():
+            lookup[group.upper()] = group
+            for col in columns:
+                lookup[col.upper()] = group
+
+        groups = set()
+        for name in metrics:
+            group = lookup.get(str(name).upper())
+            if group is None:
+                raise ValueError(
+                    f"Error: Unknown metric '{name}'. "
+                    f"Choose from {list(cls.METRIC_GROUPS)}."
+                )
+            groups.add(group)
+        return groups
+
     @classmethod
     def calculate_all_metrics(
         cls, 
@@ -111,8 +460,224 @@ class AssociationStatsKernel:
 
         return pd.Series(results)
 
+    @classmethod
+    def calculate_all_metrics_batch(
+        cls,
+        a,
+        b,
+        c,
+        d,
+        total_corpus_size=None,
+        label_pos: str = "Attraction",
+        label_neg: str = "Repulsion",
+        signed_metrics: bool = False,
+        include_fisher: bool = True,
+        metrics=None,
+        deduplicate: bool = True
+    ) -> dict:
+        """
+        Vectorized counterpart of calculate_all_metrics.
+
+        Evaluates every metric over whole arrays of contingency tables in
+        one pass and returns the results column by column. Values agree
+        with calling calculate_all_metrics row by row to floating-point
+        tolerance (FYE differs by up to ~1e-12: the batched Fisher
+        engine sums the tails in another order).
+
+        Args:
+            a, b, c, d: Array-likes of contingency table cell values
+            total_corpus_size: Scalar or array of totals
+                (uses a+b+c+d per table if None)
+            label_pos, label_neg: Direction labels
+            signed_metrics: Whether to return signed metrics (default: False)
+            include_fisher: Whether to run the Fisher-Yates Exact test
+            metrics: Metric groups to compute (see resolve_metrics);
+                None computes all. Others are skipped entirely, and the
+                selected columns equal those of a full run.
+            deduplicate: Compute each distinct (a, b, c, d) table once and
+                broadcast the results back (see dedup_stats)
+        Returns:
+            dict mapping metric names to typed columns (same keys and
+            order as the Series returned by calculate_all_metrics):
+            categorical Direction, bool LogOdds_CrossesZero, float64
+            metrics and the input cell arrays
+        """
+        groups = cls.resolve_metrics(metrics)
+        a, b, c, d = (np.asarray(x) for x in (a, b, c, d))
+
+        if deduplicate:
+            with _stage("dedup", rows=len(a)):
+                unique = cls.unique_tables(a, b, c, d, total_corpus_size)
+            if unique is not None:
+                first, inverse = unique
+                columns = cls.calculate_all_metrics_batch(
+                    a[first], b[first], c[first], d[first],
+                    total_corpus_size=total_corpus_size,
+                    label_pos=label_pos,
+                    label_neg=label_neg,
+                    signed_metrics=signed_metrics,
+                    include_fisher=include_fisher,
+                    metrics=metrics,
+                    deduplicate=False
+                )
+                return cls.broadcast_tables(columns, inverse, a, b, c, d)
+        # Per-table totals (array) or one total (scalar; None / 0: a+b+c+d)
+        N = (np.asarray(total_corpus_size)
+             if np.ndim(total_corpus_size) > 0 or total_corpus_size
+             else (a + b + c + d))
+
+        with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+            # Basic Expectations & Direction
+            expected_a = ((a + c) * (a + b)) / N
+            attraction = a > expected_a
+            direction = cls._direction_batch(attraction, label_pos, label_neg)
+
+            results = {"Direction": direction}
+
+            # Pearson Residual
+            if "PEARSONRESID" in groups:
+                results["PEARSONRESID"] = np.where(
+                    expected_a > 0,
+                    (a - expected_a) / np.sqrt(expected_a),
+                    np.nan
+                )
+            # LLR, PMI and KLD share margins and expected frequencies
+            fused_groups = groups & {"LLR", "PMI", "KLD"}
+            fused = (
+                cls.calc_llr_pmi_kld_batch(
+                    a, b, c, d, N, expected_a, groups=fused_groups
+                )
+                if fused_groups else {}
+            )
+            if "LLR" in groups:
+                llr = fused["LLR"]
+                # --- Apply Sign Logic (same rule as the scalar path) ---
+                if include_fisher and signed_metrics:
+                    llr = np.where(attraction, llr, -llr)
+                results["LLR"] = llr
+            if "PMI" in groups:
+                results["PMI"] = fused["PMI"]
+
+            # Debug info
+            results.update({"a": a, "b": b, "c": c, "d": d})
+
+            if "LOGODDSRATIO" in groups:
+                results.update(cls.calc_log_odds_stats_batch(a, b, c, d))
+            if include_fisher and "FYE" in groups:
+                with _stage("fisher", rows=len(a)):
+                    fisher_stats = cls.calc_fisher_stats_batch(a, b, c, d, N)
+                if signed_metrics:
+                    fisher_stats["FYE"] = np.where(
+                        attraction, fisher_stats["FYE"], -fisher_stats["FYE"]
+                    )
+                results.update(fisher_stats)
+            if "DELTAP" in groups:
+                results.update(cls.calc_delta_p_batch(a, b, c, d))
+            if "KLD" in groups:
+                results["KLDC2W"] = fused["KLDC2W"]
+                results["KLDW2C"] = fused["KLDW2C"]
+
+        return results
+
+    @classmethod
+    def unique_tables(cls, a, b, c, d, total_corpus_size=None):
+        """
+        Distinct contingency tables among the rows of a, b, c, d.
+
+        Returns (first, inverse): positions of one representative per
+        distinct table and, per row, the index of its table, so that
+        column[first][inverse] == column. Returns None when every table
+        is distinct or the input is not integer-valued (or has per-table
+        totals). Updates the dedup_stats counters.
+        """
+        if np.ndim(total_corpus_size) > 0 or len(a) < 2:
+            return None
+        cells = [np.asarray(x) for x in (a, b, c, d)]
+        if not all(np.issubdtype(x.dtype, np.integer) for x in cells):
+            return None
+
+        # Pack the cells into one int64 key when their ranges allow it
+        mins = [int(x.min()) for x in cells]
+        spans = [int(x.max()) - lo + 1 for x, lo in zip(cells, mins)]
+        if np.prod(spans, dtype=object) < 2**63:
+            key = np.zeros(len(a), dtype=np.int64)
+            for x, lo, span in zip(cells, mins, spans):
+                key = key * span + (x - lo)
+            _, first, inverse = np.unique(
+                key, return_index=True, return_inverse=True
+            )
+        else:
+            _, first, inverse = np.unique(
+                np.stack(cells, axis=1), axis=0,
+                return_index=True, return_inverse=True
+            )
+
+        cls.dedup_counts["tables"] += len(a)
+        cls.dedup_counts["unique_tables"] += len(first)
+        if len(first) == len(a):
+            return None
+        return first, inverse.reshape(-1)
+
+    @staticmethod
+    def broadcast_tables(columns: dict, inverse, a, b, c, d) -> dict:
+        """Expand per-distinct-table columns back to one row per table"""
+        results = {key: value[inverse] for key, value in columns.items()}
+        results.update({"a": a, "b": b, "c": c, "d": d})
+        return results
+
+    @classmethod
+    def dedup_stats(cls) -> dict:
+        """Tables seen vs. distinct tables computed by the batch kernel"""
+        tables = cls.dedup_counts["tables"]
+        unique = cls.dedup_counts["unique_tables"]
+        return {
+            "tables": tables,
+            "unique_tables": unique,
+            "saved": tables - unique,
+            "saved_ratio": (tables - unique) / tables if tables else 0.0
+        }
+
+    @classmethod
+    def reset_dedup_stats(cls):
+        cls.dedup_counts = {"tables": 0, "unique_tables": 0}
+
+    @classmethod
+    def settings(cls) -> dict:
+        """
+        Current class-level options that can change the results
+        (fused_backend, fisher_precision, fisher_dps, FISHER_EXACT_MAX_N).
+        Worker processes apply them with apply_settings, and they are
+        part of the result cache key.
+        """
+        return {name: getattr(cls, name) for name in cls._SETTINGS}
+
+    @classmethod
+    def apply_settings(cls, settings: dict):
+        """Set class-level options returned by settings()"""
+        unknown = set(settings) - set(cls._SETTINGS)
+        if unknown:
+            raise ValueError(
+                f"Error: Unknown kernel settings: {sorted(unknown)}"
+            )
+        for name, value in settings.items():
+            setattr(cls, name, value)
+
+    @staticmethod
+    def _direction_batch(attraction, label_pos, label_neg) -> pd.Categorical:
+        """Direction labels as a categorical (1 byte per table)"""
+        if label_pos == label_neg:
+            return pd.Categorical.from_codes(
+                np.zeros(len(attraction), dtype=np.int8),
+                categories=[label_pos]
+            )
+        return pd.Categorical.from_codes(
+            np.where(attraction, 0, 1).astype(np.int8),
+            categories=[label_pos, label_neg]
+        )
+
     @staticmethod
-    def calculate_fisher_p_custom(a, b, c, d, mask_method="distance"):
+    def calculate_fisher_p_custom(a, b, c, d, mask_method="distance",
+                                  log10: bool = False):
         """
         Calculates Fisher's Exact Test p-value using a distance-from-expectation approach.
         
@@ -128,8 +693,10 @@ class AssociationStatsKernel:
                   This method aligns with Gries's R Script results in tests (1_out.csv).
                  - "probability":
                   Sums probabilities of all tables where P(table) <= P(observed).
+            log10 (bool): Return log10 of the p-value instead, taken directly
+                from the log-space sum (no underflow for extreme tables).
                Returns:
-            float: Two-sided p-value.
+            float: Two-sided p-value (or its log10).
         """
         # Calculate marginal sums and total
         n11, n12, n21, n22 = a, b, c, d
@@ -180,12 +747,481 @@ class AssociationStatsKernel:
         
         # Sum the probabilities in log-space to prevent underflow
         log_p_val = logsumexp(all_log_p[mask])
+        if log10:
+            return min(log_p_val, 0.0) / np.log(10)
         
         # Convert back to linear space and cap at 1.0
         p_val = min(np.exp(log_p_val), 1.0)
-        
+
         return p_val
-    
+
+    @classmethod
+    def calculate_fisher_p_batch(cls, a, b, c, d, mask_method="distance",
+                                 log10: bool = False, precision: str = None):
+        """
+        Vectorized counterpart of calculate_fisher_p_custom.
+
+        Computes the two-sided p-value for arrays of 2x2 tables at once.
+        Both mask methods define a rejection region made of two tails of
+        the hypergeometric distribution, so instead of evaluating the full
+        support, only the tail terms are summed, walking outward from the
+        tail boundaries until the remaining terms are negligible.
+        Log-factorials are looked up in the shared log_factorial_table.
+
+        Args:
+            a, b, c, d: Array-likes of cell counts.
+            mask_method (str): "distance" (default) or "probability",
+                with the same meaning as in calculate_fisher_p_custom.
+            log10 (bool): Return log10 p-values from the tail logsumexp
+                (finite even where the p-value underflows to 0).
+            precision (str): "float", "precise", "mpmath" or "exact"
+                (None: fisher_precision). Except for "float", the tables
+                flagged by fisher_risky_rows are recomputed with
+                calculate_fisher_p_precise (backend=precision).
+        Returns:
+            np.ndarray: Two-sided p-values or their log10
+                (NaN for invalid tables).
+        """
+        precision = precision or cls.fisher_precision
+        if precision not in cls.FISHER_PRECISIONS:
+            raise ValueError(
+                f"Error: Unknown precision '{precision}'. "
+                f"Choose from {list(cls.FISHER_PRECISIONS)}."
+            )
+        log_p = np.minimum(cls._fisher_log_p_batch(a, b, c, d, mask_method), 0.0)
+        if precision != "float":
+            log_p = cls._refine_fisher_log_p(
+                log_p, a, b, c, d, mask_method, precision
+            )
+        if log10:
+            return log_p / np.log(10)
+        return np.exp(log_p)
+
+    # Stop walking a tail once the remaining terms are below
+    # exp(-40) (~4e-18) relative to the accumulated tail sum.
+    _FISHER_TAIL_LOG_TOL = -40.0
+    _FISHER_MAX_BLOCK = 4096
+
+    @classmethod
+    def _fisher_tables(cls, a, b, c, d):
+        """
+        Margins, support and log-PMF of the valid tables among arrays
+        of cell counts (flattened).
+
+        Returns:
+            (shape, valid, (a, r1, c1, n, low, high, mode), logpmf) where
+            the arrays hold the valid tables only and logpmf(x, idx)
+            evaluates the hypergeometric log-PMF of tables idx at x
+        """
+        a, b, c, d = np.broadcast_arrays(
+            *(np.asarray(x, dtype=np.int64) for x in (a, b, c, d))
+        )
+        shape = a.shape
+        a, b, c, d = (x.ravel() for x in (a, b, c, d))
+
+        r1 = a + b             # Row 1 sum
+        c1 = a + c             # Col 1 sum
+        n = r1 + (c + d)       # Total sum
+        valid = (a >= 0) & (b >= 0) & (c >= 0) & (d >= 0) & (n > 0)
+        a, r1, c1, n = (x[valid] for x in (a, r1, c1, n))
+        low = np.maximum(0, r1 + c1 - n)
+        high = np.minimum(r1, c1)
+
+        lf = cls.log_factorial_table
+        if valid.any():
+            lf.ensure(int(n.max()))
+        const = lf(r1) + lf(n - r1) + lf(c1) + lf(n - c1) - lf(n)
+
+        def _logpmf(x, idx=slice(None)):
+            return (const[idx] - lf(x) - lf(r1[idx] - x)
+                    - lf(c1[idx] - x) - lf(n[idx] - r1[idx] - c1[idx] + x))
+
+        mode = np.clip((r1 + 1) * (c1 + 1) // (n + 2), low, high)
+        return shape, valid, (a, r1, c1, n, low, high, mode), _logpmf
+
+    @classmethod
+    def _fisher_log_p_batch(cls, a, b, c, d, mask_method="distance"):
+        """Natural log of the two-sided Fisher p-value for arrays of tables"""
+        shape, valid, tables, _logpmf = cls._fisher_tables(a, b, c, d)
+        log_p = np.full(valid.shape, np.nan)
+        if not valid.any():
+            return log_p.reshape(shape)
+        a, r1, c1, n, low, high, mode = tables
+
+        if mask_method == "distance":
+            lower_end, upper_start = cls._fisher_distance_bounds(
+                a, r1, c1, n
+            )
+        elif mask_method == "probability":
+            threshold = _logpmf(a) + np.log(1 + 1e-7)
+            lower_end, upper_start = cls._fisher_probability_bounds(
+                threshold, low, high, mode, _logpmf
+            )
+        else:
+            raise ValueError(f"Unknown mask_method: {mask_method}")
+
+        lower_end = np.minimum(lower_end, high)
+        upper_start = np.maximum(upper_start, low)
+        # Tails that meet cover the whole support (p = 1)
+        full = lower_end >= upper_start - 1
+        lower_end[full] = low[full] - 1
+        upper_start[full] = high[full] + 1
+
+        log_lower = cls._fisher_tail_log_sum(
+            lower_end, low, -1, mode, _logpmf
+        )
+        log_upper = cls._fisher_tail_log_sum(
+            upper_start, high, +1, mode, _logpmf
+        )
+        result = np.logaddexp(log_lower, log_upper)
+        result[full] = 0.0
+
+        log_p[valid] = result
+        return log_p.reshape(shape)
+
+    @staticmethod
+    def _fisher_distance_bounds(a, r1, c1, n):
+        """
+        Tail boundaries for the distance mask:
+        x <= lower_end or x >= upper_start, using the exact float
+        comparison of calculate_fisher_p_custom.
+        """
+        expected = (r1 * c1) / n
+        threshold = np.abs(a - expected) - 1e-12
+
+        def _in_region(x):
+            return np.abs(x - expected) >= threshold
+
+        lower_end = np.floor(expected - threshold).astype(np.int64)
+        upper_start = np.ceil(expected + threshold).astype(np.int64)
+        # Correct off-by-one effects of floor/ceil rounding
+        for _ in range(2):
+            step = (_in_region(lower_end + 1)
+                    & (lower_end + 1 < expected))
+            lower_end = np.where(step, lower_end + 1, lower_end)
+            step = ~_in_region(lower_end) & (lower_end < expected)
+            lower_end = np.where(step, lower_end - 1, lower_end)
+
+            step = (_in_region(upper_start - 1)
+                    & (upper_start - 1 > expected))
+            upper_start = np.where(step, upper_start - 1, upper_start)
+            step = ~_in_region(upper_start) & (upper_start > expected)
+            upper_start = np.where(step, upper_start + 1, upper_start)
+
+        return lower_end, upper_start
+
+    @staticmethod
+    def _fisher_probability_bounds(threshold, low, high, mode, logpmf):
+        """
+        Tail boundaries for the probability mask.
+
+        The hypergeometric distribution is unimodal, so the tables with
+        P(table) <= P(observed) form two tails. Each boundary is found
+        by a vectorized binary search on one monotone side of the mode.
+        """
+        # Largest x in [low, mode] with logpmf(x) <= threshold
+        lo, hi = low - 1, mode + 1
+        while True:
+            todo = np.flatnonzero(hi - lo > 1)
+            if todo.size == 0:
+                break
+            mid = (lo[todo] + hi[todo]) // 2
+            hit = logpmf(mid, todo) <= threshold[todo]
+            lo[todo] = np.where(hit, mid, lo[todo])
+            hi[todo] = np.where(hit, hi[todo], mid)
+        lower_end = lo
+
+        # Smallest x in [mode, high] with logpmf(x) <= threshold
+        lo, hi = mode - 1, high + 1
+        while True:
+            todo = np.flatnonzero(hi - lo > 1)
+            if todo.size == 0:
+                break
+            mid = (lo[todo] + hi[todo]) // 2
+            hit = logpmf(mid, todo) <= threshold[todo]
+            lo[todo] = np.where(hit, lo[todo], mid)
+            hi[todo] = np.where(hit, mid, hi[todo])
+        upper_start = hi
+
+        return lower_end, upper_start
+
+    @classmethod
+    def _fisher_tail_log_sum(cls, start, end, direction, mode, logpmf):
+        """
+        Log of the summed probabilities from start to end (inclusive),
+        walking in the given direction (+1 / -1) in growing blocks.
+
+        Once a block ends beyond the mode, every remaining term is
+        smaller than the last one, so the walk stops when even
+        (remaining count x last term) is negligible.
+        """
+        total = np.full(start.shape, -np.inf)
+        pos = start.copy()
+        active = np.flatnonzero(direction * (end - start) >= 0)
+        width = 8
+        while active.size:
+            steps = direction * np.arange(width)
+            x = pos[active, None] + steps[None, :]
+            inside = direction * (end[active, None] - x) >= 0
+            x = np.where(inside, x, pos[active, None])
+            terms = np.where(
+                inside, logpmf(x, active[:, None]), -np.inf
+            )
+            total[active] = np.logaddexp(
+                total[active], logsumexp(terms, axis=1)
+            )
+
+            last_x = x[:, -1]
+            remaining = direction * (end[active] - last_x)
+            past_mode = direction * (last_x - mode[active]) >= 0
+            negligible = (
+                terms[:, -1] + np.log(np.maximum(remaining, 1))
+                < total[active] + cls._FISHER_TAIL_LOG_TOL
+            )
+            done = (remaining <= 0) | (past_mode & negligible)
+
+            pos[active] = last_x + direction
+            active = active[~done]
+            width = min(width * 2, cls._FISHER_MAX_BLOCK)
+        return total
+
+    # Rounding error allowance of the float64 region tests, in ulps of
+    # the largest operand (expected value / log-factorial of N)
+    _FISHER_RISK_ULPS = 64
+
+    @classmethod
+    def fisher_risky_rows(cls, a, b, c, d, mask_method="distance"):
+        """
+        Tables whose float64 rejection region may be off by a term.
+
+        Both mask methods decide inclusion with a float comparison
+        against a small tie tolerance (distance: |x - E| >= |a - E| -
+        1e-12; probability: P(x) <= P(a) (1 + 1e-7)). A table is flagged
+        when the support point next to a tail boundary lies within the
+        rounding error of that comparison, e.g. an exact distance tie
+        (2 R1 C1 / N - a is an integer) once E is large enough that
+        rounding exceeds 1e-12. The p-values of these tables can be
+        recomputed with calculate_fisher_p_precise (see
+        fisher_precision); other tables are decided unambiguously.
+
+        Returns:
+            np.ndarray of bool, broadcast shape of a, b, c, d
+        """
+        shape, valid, tables, _logpmf = cls._fisher_tables(a, b, c, d)
+        risky = np.zeros(valid.shape, dtype=bool)
+        if not valid.any():
+            return risky.reshape(shape)
+        a, r1, c1, n, low, high, mode = tables
+        eps = cls._FISHER_RISK_ULPS * np.finfo(float).eps
+
+        if mask_method == "distance":
+            expected = (r1 * c1) / n
+            # Support point at the observed distance on the other side
+            mirror = 2 * expected - a
+            nearest = np.round(mirror)
+            tol = 1e-12 + eps * np.maximum(np.maximum(expected, a), 1)
+            flagged = (
+                (np.abs(mirror - nearest) <= tol) & (nearest != a)
+                & (nearest >= low) & (nearest <= high)
+            )
+        elif mask_method == "probability":
+            threshold = _logpmf(a) + np.log(1 + 1e-7)
+            lower_end, upper_start = cls._fisher_probability_bounds(
+                threshold, low, high, mode, _logpmf
+            )
+            tol = 1e-12 + eps * cls.log_factorial_table(n)
+            flagged = np.zeros(len(a), dtype=bool)
+            # Last point inside / first point outside each tail
+            for x in (lower_end, lower_end + 1, upper_start - 1, upper_start):
+                inside = (x >= low) & (x <= high)
+                x = np.clip(x, low, high)
+                flagged |= inside & (np.abs(_logpmf(x) - threshold) <= tol)
+        else:
+            raise ValueError(f"Unknown mask_method: {mask_method}")
+
+        risky[valid] = flagged
+        return risky.reshape(shape)
+
+    @classmethod
+    def _refine_fisher_log_p(cls, log_p, a, b, c, d, mask_method,
+                             precision):
+        """Recompute the natural log p of the risky tables precisely"""
+        a, b, c, d = np.broadcast_arrays(*(np.asarray(x) for x in (a, b, c, d)))
+        with _stage("fisher_refine") as record:
+            risky = np.flatnonzero(
+                cls.fisher_risky_rows(a, b, c, d, mask_method)
+            )
+            record["rows"] = risky.size
+            if risky.size == 0:
+                return log_p
+            log_p = log_p.copy()
+            flat = log_p.reshape(-1)
+            for i in risky:
+                flat[i] = np.log(10) * cls.calculate_fisher_p_precise(
+                    a.flat[i], b.flat[i], c.flat[i], d.flat[i],
+                    mask_method=mask_method, backend=precision,
+                    dps=cls.fisher_dps
+                )
+        return log_p
+
+    @staticmethod
+    def calculate_fisher_p_precise(a, b, c, d, mask_method="distance",
+                                   backend="precise", dps: int = 50) -> float:
+        """
+        log10 of the two-sided Fisher p-value of one table, in exact or
+        high-precision arithmetic.
+
+        Reference counterpart of calculate_fisher_p_custom(log10=True)
+        with the same mask methods. The rejection region is decided
+        without float rounding (distance: |x N - R1 C1| compared in
+        integers; probability: terms compared exactly / at dps digits),
+        and its terms are summed without float64 loss.
+
+        Args:
+            a, b, c, d: Cell counts of the 2x2 contingency table.
+            mask_method (str): "distance" (default) or "probability".
+            backend (str):
+                - "precise" (default): "mpmath" when mpmath is
+                  importable, else "exact".
+                - "mpmath" (recommended): mpmath floats with dps
+                  significant digits; each tail is walked outward until
+                  the remaining terms are below 10^-dps of the sum.
+                  About 2 ms per table at any N.
+                - "exact": Python integers. Terms are the products
+                  C(R1, x) C(N - R1, C1 - x), summed exactly over the
+                  region or its complement, whichever is shorter. The
+                  numbers have about N bits, so cost grows quickly with
+                  N (~0.03 s per table at N = 1e5, ~3 s at 1e6). Above
+                  FISHER_EXACT_MAX_N, "mpmath" is used instead when
+                  importable; either way a warning is issued.
+            dps (int): Working precision of the "mpmath" backend.
+        Returns:
+            float: log10 p-value (NaN for invalid tables).
+        """
+        a, b, c, d = (int(x) for x in (a, b, c, d))
+        if min(a, b, c, d) < 0 or a + b + c + d == 0:
+            return np.nan
+        r1, c1 = a + b, a + c
+        n = r1 + c + d
+
+        if backend == "precise":
+            backend = "mpmath" if _mpmath_available() else "exact"
+        max_n = AssociationStatsKernel.FISHER_EXACT_MAX_N
+        if backend == "exact" and n > max_n:
+            fallback = _mpmath_available()
+            warnings.warn(
+                f"Exact Fisher arithmetic is slow for N = {n:,} "
+                f"(> FISHER_EXACT_MAX_N); "
+                + ("using the mpmath backend instead." if fallback
+                   else "install mpmath for the faster mpmath backend."),
+                RuntimeWarning, stacklevel=2
+            )
+            if fallback:
+                backend = "mpmath"
+
+        if backend == "exact":
+            return AssociationStatsKernel._fisher_precise_log10(
+                a, r1, c1, n, mask_method,
+                binomial=math.comb, divide=operator.floordiv, tol=None,
+                log10_ratio=_log10_ratio
+            )
+        if backend == "mpmath":
+            mpmath = _import_mpmath()
+            with mpmath.workdps(dps):
+                return AssociationStatsKernel._fisher_precise_log10(
+                    a, r1, c1, n, mask_method,
+                    binomial=mpmath.binomial, divide=operator.truediv,
+                    tol=mpmath.mpf(10) ** -dps,
+                    log10_ratio=lambda s, t: float(mpmath.log10(s / t))
+                )
+        raise ValueError(
+            f"Error: Unknown backend '{backend}'. "
+            f"Choose from ['precise', 'mpmath', 'exact']."
+        )
+
+    @staticmethod
+    def _fisher_precise_log10(a, r1, c1, n, mask_method, binomial, divide,
+                              tol, log10_ratio) -> float:
+        """
+        Shared logic of calculate_fisher_p_precise. Terms are the
+        unnormalized hypergeometric weights C(R1, x) C(N - R1, C1 - x)
+        (they sum to C(N, C1)); neighbouring terms follow from exact
+        ratios of small integers.
+        """
+        low, high = max(0, r1 + c1 - n), min(r1, c1)
+        rest = n - r1 - c1
+        mode = min(max((r1 + 1) * (c1 + 1) // (n + 2), low), high)
+
+        def _term(x):
+            return binomial(r1, x) * binomial(n - r1, c1 - x)
+
+        def _next(t, x, direction):
+            """Term at x + direction from the term t at x"""
+            if direction > 0:
+                return divide(t * (r1 - x) * (c1 - x),
+                              (x + 1) * (rest + x + 1))
+            return divide(t * x * (rest + x), (r1 - x + 1) * (c1 - x + 1))
+
+        def _sum(start, end, direction):
+            """Sum of the terms from start to end (inclusive)"""
+            if direction * (end - start) < 0:
+                return 0
+            t = total = _term(start)
+            x = start
+            while x != end:
+                t = _next(t, x, direction)
+                x += direction
+                total += t
+                # Past the mode every remaining term is smaller than t
+                if (tol is not None and direction * (x - mode) >= 0
+                        and t * (direction * (end - x)) <= total * tol):
+                    break
+            return total
+
+        if mask_method == "distance":
+            # N * expected, and the observed distance scaled by N
+            center = r1 * c1
+            dist = abs(a * n - center)
+            lower_end = (center - dist) // n
+            upper_start = -(-(center + dist) // n)
+        elif mask_method == "probability":
+            # P(x) <= P(a) (1 + 1e-7), as in the float path
+            limit = _term(a) * (10 ** 7 + 1)
+
+            def _in_region(x):
+                return _term(x) * 10 ** 7 <= limit
+
+            # Binary searches on the monotone sides of the mode
+            lo, hi = low - 1, mode + 1
+            while hi - lo > 1:
+                mid = (lo + hi) // 2
+                lo, hi = (mid, hi) if _in_region(mid) else (lo, mid)
+            lower_end = lo
+            lo, hi = mode - 1, high + 1
+            while hi - lo > 1:
+                mid = (lo + hi) // 2
+                lo, hi = (lo, mid) if _in_region(mid) else (mid, hi)
+            upper_start = hi
+        else:
+            raise ValueError(f"Unknown mask_method: {mask_method}")
+
+        # Clip to the support (an empty tail ends just outside it)
+        lower_end = max(min(lower_end, high), low - 1)
+        upper_start = min(max(upper_start, low), high + 1)
+        # Tails that meet cover the whole support (p = 1)
+        if lower_end >= upper_start - 1:
+            return 0.0
+
+        total = binomial(n, c1)
+        n_middle = upper_start - lower_end - 1
+        if tol is None and n_middle < (high - low + 1) - n_middle:
+            # Exact arithmetic: the complement is the shorter sum
+            region = total - _sum(lower_end + 1, upper_start - 1, +1)
+        else:
+            region = (_sum(lower_end, low, -1)
+                      + _sum(upper_start, high, +1))
+        return min(log10_ratio(region, total), 0.0)
+
     @staticmethod
     def calc_log_odds_stats(a, b, c, d):
         """Calculate Log Odds Ratio, Standard Error, and 95% Wald CI"""
@@ -240,16 +1276,25 @@ class AssociationStatsKernel:
             # Use R-compatible implementation to resolve discrepancies
             # print("new Fisher")  # Debug line - kept for reference
             # _, p_val = fisher_exact([[a, b], [c, d]])  # SciPy version
-            p_val = AssociationStatsKernel.calculate_fisher_p_custom(a, b, c, d)
-            if p_val > 0:
-                strength = -np.log10(p_val)
+            # log10 p straight from the tail logsumexp: exact FYE even
+            # when p itself underflows to 0
+            kernel = AssociationStatsKernel
+            if kernel.fisher_precision != "float" and kernel.fisher_risky_rows(
+                a, b, c, d
+            ):
+                log10_p = kernel.calculate_fisher_p_precise(
+                    a, b, c, d, backend=kernel.fisher_precision,
+                    dps=kernel.fisher_dps
+                )
             else:
-                if debug:
-                    print("Underflow in Fisher p-value calculation")
-                    print(f"p_val={p_val}, a={a}, b={b}, c={c}, d={d}, N={N}")
-                # Underflow rescue using direct log calculation
-                log_p = hypergeom.logpmf(a, N, a + c, a + b)
-                strength = -(log_p / np.log(10))
+                log10_p = kernel.calculate_fisher_p_custom(
+                    a, b, c, d, log10=True
+                )
+            p_val = 10.0 ** log10_p
+            strength = AssociationStatsKernel._fisher_strength(log10_p)
+            if debug and p_val == 0:
+                print("Underflow in Fisher p-value calculation")
+                print(f"log10_p={log10_p}, a={a}, b={b}, c={c}, d={d}, N={N}")
         except ValueError:
             p_val, strength = np.nan, np.nan
 
@@ -332,129 +1377,1011 @@ class AssociationStatsKernel:
 
         return {"KLDC2W": kld_c2w, "KLDW2C": kld_w2c}
 
+    # ------------------------------------------------------------------
+    # Batch (array) versions of the metrics above.
+    # Each one mirrors the branch logic of its scalar counterpart with
+    # masks, so results agree element by element (to floating-point
+    # tolerance for the Fisher p-values, see calculate_fisher_p_batch).
+    # Callers are expected to silence NumPy floating point warnings.
+    # ------------------------------------------------------------------
 
-class CollexemeAnalyzer(ABC):
-    """Base class for Collexeme Analysis orchestrators"""
-    
-    @abstractmethod
-    def run(self, df: pd.DataFrame, **kwargs) -> pd.DataFrame:
-        """Abstract method to execute analysis"""
-        pass
+    @staticmethod
+    def calc_log_odds_stats_batch(a, b, c, d):
+        """Array version of calc_log_odds_stats"""
+        numerator = a * d
+        denominator = b * c
+        log_odds = np.where(
+            denominator == 0,
+            np.where(numerator > 0, np.inf,
+                     np.where(numerator == 0, np.nan, -np.inf)),
+            np.where(numerator == 0, -np.inf,
+                     np.log(numerator / denominator))
+        )
 
-    def _apply_metrics(self, row, a, b, c, d, N, label_pos, label_neg,
-                       signed_metrics: bool = False,
-                       include_fisher: bool = True) -> pd.Series:
-        """Helper to call Statistics Kernel"""
-        return AssociationStatsKernel.calculate_all_metrics(
-            a, b, c, d, 
-            total_corpus_size=N, 
-            label_pos=label_pos, 
-            label_neg=label_neg,
-            signed_metrics=signed_metrics,
-            include_fisher=include_fisher
+        # Standard Error (Wald) with Haldane-Anscombe correction
+        all_positive = (a > 0) & (b > 0) & (c > 0) & (d > 0)
+        se = np.where(
+            all_positive,
+            np.sqrt(1/a + 1/b + 1/c + 1/d),
+            np.sqrt(1/(a+0.5) + 1/(b+0.5) + 1/(c+0.5) + 1/(d+0.5))
         )
 
+        # 95% CI (Z=1.96)
+        finite = np.isfinite(log_odds)
+        lower = np.where(finite, log_odds - 1.96 * se, np.nan)
+        upper = np.where(finite, log_odds + 1.96 * se, np.nan)
+        crosses_zero = finite & (lower <= 0) & (upper >= 0)
 
-class SimpleCollexemeAnalyzer(CollexemeAnalyzer):
-    """Simple Collexeme Analysis implementation"""
-    
-    def run(
-        self, 
-        df: pd.DataFrame, 
-        word_col: str, 
-        freq_corpus_col: str, 
-        freq_const_col: str, 
-        total_corpus_size: int = None,
-        signed_metrics: bool = False,
-        include_fisher: bool = True
-    ) -> pd.DataFrame:
-        """Execute Simple Collexeme Analysis"""
-        N = (total_corpus_size 
-             if total_corpus_size 
-             else df[freq_corpus_col].sum())
-        C_total = df[freq_const_col].sum()
-        print(f"  [Simple] N={N}, C_total={C_total}")
-
-        def _process_row(row):
-            a = row[freq_const_col]
-            b = C_total - a
-            c = row[freq_corpus_col] - a
-            d = N - C_total - c
-            return self._apply_metrics(
-                row, a, b, c, d, N, "Attraction", "Repulsion",
-                signed_metrics=signed_metrics,
-                include_fisher=include_fisher
-            )
+        return {
+            "LOGODDSRATIO": log_odds,
+            "LogOdds_SE": se,
+            "LogOdds_CI_Lower": lower,
+            "LogOdds_CI_Upper": upper,
+            "LogOdds_CrossesZero": crosses_zero
+        }
 
-        metrics = df.apply(_process_row, axis=1)
-        result = pd.concat([df[word_col], metrics], axis=1)
+    @staticmethod
+    def calc_fisher_stats_batch(a, b, c, d, N, mask_method="distance"):
+        """Array version of calc_fisher_stats (batched Fisher engine)"""
+        log10_p = AssociationStatsKernel.calculate_fisher_p_batch(
+            a, b, c, d, mask_method=mask_method, log10=True
+        )
+        # FYE comes from log10 p itself (no underflow rescue needed)
+        p_val = 10.0 ** log10_p
+        strength = AssociationStatsKernel._fisher_strength(log10_p)
+        return {"Fisher_p_value": p_val, "FYE": strength}
 
-        # Include CI in Simple analysis display
-        target_cols = [
-            word_col, "a", "c", "Direction", "LLR", "PEARSONRESID",
-            "LOGODDSRATIO", "LogOdds_CI_Lower", "LogOdds_CI_Upper",
-            "LogOdds_CrossesZero", "PMI", "DELTAPC2W", "DELTAPW2C", 
-            "KLDC2W", "KLDW2C", "FYE"
-        ]
-        
-        result_filtered = result[
-            [c for c in target_cols if c in result.columns]
-        ]
-        return result_filtered.sort_values("FYE", ascending=False, key=abs)
+    @staticmethod
+    def _fisher_strength(log10_p):
+        """FYE = -log10 p (0.0, not -0.0, for p == 1)"""
+        return 0.0 - log10_p
 
+    @staticmethod
+    def calc_delta_p_batch(a, b, c, d):
+        """Array version of calc_delta_p"""
+        dp_c2w = np.where(
+            ((a+b) > 0) & ((c+d) > 0),
+            (a / (a + b)) - (c / (c + d)),
+            np.nan
+        )
+        dp_w2c = np.where(
+            ((a+c) > 0) & ((b+d) > 0),
+            (a / (a + c)) - (b / (b + d)),
+            np.nan
+        )
 
-class DistinctiveCollexemeAnalyzer(CollexemeAnalyzer):
-    """Distinctive Collexeme Analysis implementation"""
+        return {"DELTAPC2W": dp_c2w, "DELTAPW2C": dp_w2c}
+
+    @staticmethod
+    def _masked_log(x, mask, log=np.log, fill=0.0):
+        """log(x) where mask is True, fill elsewhere. Masked-out entries
+        are replaced by 1 before the log, so zeros / NaN never reach it"""
+        out = log(np.where(mask, x, 1.0))
+        return out if fill == 0 else np.where(mask, out, fill)
+
+    @classmethod
+    def calc_llr_pmi_kld_batch(cls, a, b, c, d, N, exp_a,
+                               groups=("LLR", "PMI", "KLD"), backend=None):
+        """
+        Fused array version of calc_llr, calc_pmi and calc_kld.
+
+        The margins and expected frequencies are computed once for all
+        three measures. Entries the scalar code would not take the log
+        of are replaced by 1 with np.where before np.log (_masked_log)
+        and filled afterwards, so zero cells and infinities come out as
+        in the scalar branches. The "numpy" backend vectorizes the
+        branches; "numba" runs the scalar logic in a compiled loop.
+        Both agree with the scalar functions up to rounding (see
+        validate_fused).
+
+        Args:
+            a, b, c, d: Arrays of cell counts
+            N: Scalar or array of totals
+            exp_a: Expected frequency of cell a
+            groups: Measures to return ("LLR", "PMI", "KLD")
+            backend: "numpy" / "numba" (None: fused_backend)
+        Returns:
+            dict with LLR, PMI, KLDC2W and KLDW2C for the selected groups
+        """
+        backend = backend or cls.fused_backend
+        if backend == "numba":
+            return cls._llr_pmi_kld_numba(a, b, c, d, N, exp_a, groups)
+        if backend != "numpy":
+            raise ValueError(
+                f"Error: Unknown backend '{backend}'. "
+                f"Choose from ['numpy', 'numba']."
+            )
+
+        row1, row2 = a + b, c + d
+        col1, col2 = a + c, b + d
+        results = {}
+
+        if "LLR" in groups:
+            # Expected frequencies of b, c and d (a is given)
+            cells = ((a, exp_a), (b, (col2 * row1) / N),
+                     (c, (col1 * row2) / N), (d, (col2 * row2) / N))
+            terms = [
+                observed * cls._masked_log(
+                    observed / expected, (observed > 0) & (expected > 0)
+                )
+                for observed, expected in cells
+            ]
+            results["LLR"] = 2 * (terms[0] + terms[1] + terms[2] + terms[3])
+
+        if "PMI" in groups:
+            p_w_c, p_w, p_c = a / N, col1 / N, row1 / N
+            results["PMI"] = cls._masked_log(
+                p_w_c / (p_w * p_c), (p_w_c > 0) & (p_w > 0) & (p_c > 0),
+                log=np.log2, fill=-np.inf
+            )
+
+        if "KLD" in groups:
+            def _kld_sum(p1, p2, q1, q2):
+                term1 = p1 * cls._masked_log(
+                    p1 / q1, (p1 > 0) & (q1 > 0), log=np.log2
+                )
+                term2 = p2 * cls._masked_log(
+                    p2 / q2, (p2 > 0) & (q2 > 0), log=np.log2
+                )
+                diverges = ((p1 > 0) & ~(q1 > 0)) | ((p2 > 0) & ~(q2 > 0))
+                return np.where(diverges, np.inf, term1 + term2)
+
+            results["KLDC2W"] = np.where(
+                (row1 > 0) & (N > 0),
+                _kld_sum(a / row1, b / row1, col1 / N, col2 / N),
+                np.nan
+            )
+            results["KLDW2C"] = np.where(
+                (col1 > 0) & (N > 0),
+                _kld_sum(a / col1, c / col1, row1 / N, row2 / N),
+                np.nan
+            )
+
+        return results
+
+    @classmethod
+    def _llr_pmi_kld_numba(cls, a, b, c, d, N, exp_a, groups) -> dict:
+        """Compiled-loop backend of calc_llr_pmi_kld_batch"""
+        if cls._numba_fused_loop is None:
+            cls._numba_fused_loop = _compile_numba_fused_loop()
+        a, b, c, d, N, exp_a = (
+            np.ascontiguousarray(x, dtype=np.float64).ravel()
+            for x in np.broadcast_arrays(a, b, c, d, N, exp_a)
+        )
+        out = np.empty((4, len(a)))
+        cls._numba_fused_loop(a, b, c, d, N, exp_a, out)
+
+        results = {}
+        if "LLR" in groups:
+            results["LLR"] = out[0]
+        if "PMI" in groups:
+            results["PMI"] = out[1]
+        if "KLD" in groups:
+            results["KLDC2W"] = out[2]
+            results["KLDW2C"] = out[3]
+        return results
+
+    @classmethod
+    def validate_fused(cls, a, b, c, d, total_corpus_size=None,
+                       backend=None) -> dict:
+        """
+        Compare the fused kernel with the per-row calc_llr / calc_pmi /
+        calc_kld.
+
+        Returns:
+            dict mapping LLR, PMI, KLDC2W and KLDW2C to the largest
+            relative difference (inf if a zero / infinite / NaN case
+            disagrees)
+        """
+        a, b, c, d = (np.asarray(x) for x in (a, b, c, d))
+        N = (np.asarray(total_corpus_size) if total_corpus_size
+             else (a + b + c + d))
+        a, b, c, d, N = np.broadcast_arrays(a, b, c, d, N)
+        with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+            exp_a = ((a + c) * (a + b)) / N
+            fused = cls.calc_llr_pmi_kld_batch(
+                a, b, c, d, N, exp_a, backend=backend
+            )
+
+            expected = {key: np.empty(len(a)) for key in fused}
+            for i in range(len(a)):
+                args = (a[i], b[i], c[i], d[i], N[i])
+                expected["LLR"][i] = cls.calc_llr(*args, exp_a[i])
+                expected["PMI"][i] = cls.calc_pmi(*args)
+                kld = cls.calc_kld(*args)
+                expected["KLDC2W"][i] = kld["KLDC2W"]
+                expected["KLDW2C"][i] = kld["KLDW2C"]
+
+            differences = {}
+            for key, ref in expected.items():
+                got = np.asarray(fused[key], dtype=float)
+                same = (got == ref) | (np.isnan(got) & np.isnan(ref))
+                finite = np.isfinite(got) & np.isfinite(ref)
+                rel = np.abs(got - ref) / np.maximum(np.abs(ref), 1e-300)
+                rel = np.where(same, 0.0, np.where(finite, rel, np.inf))
+                differences[key] = float(rel.max()) if len(rel) else 0.0
+        return differences
+
+    # ------------------------------------------------------------------
+    # Multiple testing correction
+    # ------------------------------------------------------------------
+
+    P_ADJUST_METHODS = ("holm", "BH", "BY")
+
+    @classmethod
+    def adjust_log10_p(cls, log10_p, methods=P_ADJUST_METHODS) -> dict:
+        """
+        Holm / Benjamini-Hochberg / Benjamini-Yekutieli adjusted p-values.
+
+        Works on log10 p throughout, so p-values that underflow to 0 in
+        linear space (large FYE) keep their ranking and magnitude. One
+        argsort is shared by all methods (O(n log n)). NaN entries are
+        not counted as tests and stay NaN, as in R's p.adjust.
+
+        Args:
+            log10_p: Array of log10 p-values (e.g. -abs(FYE))
+            methods: Any of "holm", "BH", "BY" (case-insensitive)
+        Returns:
+            dict mapping method to log10 adjusted p-values (<= 0)
+        """
+        log10_p = np.asarray(log10_p, dtype=float)
+        if isinstance(methods, str):
+            methods = [methods]
+        known = {m.upper(): m for m in cls.P_ADJUST_METHODS}
+        for method in methods:
+            if method.upper() not in known:
+                raise ValueError(
+                    f"Error: Unknown p_adjust method '{method}'. "
+                    f"Choose from {list(cls.P_ADJUST_METHODS)}."
+                )
+
+        valid = np.flatnonzero(~np.isnan(log10_p))
+        order = valid[np.argsort(log10_p[valid], kind="stable")]
+        m = len(order)
+        sorted_p = log10_p[order]
+        rank = np.arange(1, m + 1)
+
+        adjusted = {}
+        for method in methods:
+            name = known[method.upper()]
+            with np.errstate(invalid='ignore'):
+                if name == "holm":
+                    # max_{j<=i} (m - j + 1) p_(j)
+                    adj = np.maximum.accumulate(
+                        sorted_p + np.log10(m - rank + 1)
+                    )
+                else:
+                    # min_{j>=i} m / j * p_(j)  (times H_m for BY)
+                    adj = sorted_p + np.log10(m) - np.log10(rank)
+                    if name == "BY":
+                        adj += np.log10(np.sum(1.0 / rank))
+                    adj = np.minimum.accumulate(adj[::-1])[::-1]
+            out = np.full(len(log10_p), np.nan)
+            out[order] = np.minimum(adj, 0.0)
+            adjusted[method] = out
+        return adjusted
+
+
+class Vocabulary:
+    """
+    Interned labels of a word, construction or slot column.
+
+    Each distinct value gets a compact int32 code; missing values get
+    -1. The analyzers count, look up and group on code arrays (np.bincount,
+    array indexing) and map codes back to labels only when the result
+    frame is built, so no per-row string objects are hashed or kept
+    after encoding. A vocabulary built with encode() grows chunk by
+    chunk, keeping labels in first-seen order until sorted().
+    """
+
+    CODE_DTYPE = np.int32
+
+    def __init__(self, labels=None):
+        self._labels = pd.Index([] if labels is None else labels)
+        # label -> code, built on the first encode()
+        self._lookup = None
+
+    @classmethod
+    def from_values(cls, values, sort: bool = True):
+        """
+        Encode one column at once (pd.factorize).
+
+        Returns:
+            (codes, vocabulary): int32 codes aligned with values and the
+            vocabulary of their labels (sorted if sort)
+        """
+        codes, uniques = pd.factorize(values, sort=sort)
+        vocab = cls(uniques)
+        return vocab._as_codes(codes), vocab
+
+    def __len__(self):
+        if self._lookup is not None:
+            return len(self._lookup)
+        return len(self._labels)
+
+    @property
+    def labels(self) -> pd.Index:
+        """Labels in code order"""
+        if self._labels is None:
+            self._labels = pd.Index(
+                np.array(list(self._lookup), dtype=object)
+            )
+        return self._labels
+
+    def encode(self, values) -> np.ndarray:
+        """int32 codes of values, adding unseen labels to the vocabulary"""
+        local_codes, uniques = pd.factorize(values)
+        if len(uniques) == 0:
+            return np.full(len(local_codes), -1, dtype=self.CODE_DTYPE)
+        if self._lookup is None:
+            self._lookup = {label: code
+                            for code, label in enumerate(self.labels)}
+        self._labels = None
+        ids = np.fromiter(
+            (self._lookup.setdefault(u, len(self._lookup)) for u in uniques),
+            dtype=np.int64, count=len(uniques)
+        )
+        return self._as_codes(
+            np.where(local_codes >= 0, ids[local_codes], -1)
+        )
+
+    def decode(self, codes) -> np.ndarray:
+        """Labels of codes (codes must be valid, i.e. >= 0)"""
+        return np.asarray(self.labels)[codes]
+
+    def counts(self, codes) -> np.ndarray:
+        """int64 occurrences of every code (missing values skipped)"""
+        codes = np.asarray(codes)
+        return np.bincount(codes[codes >= 0], minlength=len(self))
+
+    def sorted(self):
+        """
+        Vocabulary with sorted labels (pd.factorize(sort=True) order).
+
+        Returns:
+            (vocabulary, remap): remap[old_code] is the new code
+        """
+        order = self.labels.argsort()
+        remap = np.empty(len(order), dtype=self.CODE_DTYPE)
+        remap[order] = np.arange(len(order), dtype=self.CODE_DTYPE)
+        return Vocabulary(self.labels[order]), remap
+
+    def _as_codes(self, codes) -> np.ndarray:
+        if len(self) > np.iinfo(self.CODE_DTYPE).max:
+            raise OverflowError(
+                f"Error: {len(self)} distinct values exceed the int32 "
+                "code range."
+            )
+        return np.asarray(codes).astype(self.CODE_DTYPE, copy=False)
+
+
+# Above this many cells build_count_matrix counts via sparse COO
+_BINCOUNT_MAX_CELLS = 1 << 22
+
+
+def build_count_matrix(row_values, col_values, sort: bool = True):
+    """
+    Cross-tabulate two aligned columns into a sparse count matrix.
+
+    Replacement for df.pivot_table(aggfunc='size') and
+    df.groupby([...]).size(): both columns are interned to int32 codes
+    (Vocabulary) and counted with count_code_pairs. Rows with a missing
+    value in either column are dropped, as in pivot_table.
+
+    Args:
+        row_values, col_values: Aligned array-likes (e.g. word and
+            construction columns of a raw token list)
+        sort: Sort the labels (pivot_table / groupby order)
+    Returns:
+        (counts, row_labels, col_labels): scipy.sparse.csr_matrix of
+        int64 counts (rows x cols) and the pd.Index labels of each axis
+    """
+    row_values = pd.Series(row_values)
+    col_values = pd.Series(col_values, index=row_values.index)
+    keep = row_values.notna().to_numpy() & col_values.notna().to_numpy()
+    if not keep.all():
+        row_values, col_values = row_values[keep], col_values[keep]
+
+    row_codes, row_vocab = Vocabulary.from_values(row_values, sort=sort)
+    col_codes, col_vocab = Vocabulary.from_values(col_values, sort=sort)
+    counts = count_code_pairs(
+        row_codes, col_codes, (len(row_vocab), len(col_vocab))
+    )
+    return counts, row_vocab.labels, col_vocab.labels
+
+
+def count_code_pairs(row_codes, col_codes, shape):
+    """
+    Sparse (rows x cols) int64 count matrix of aligned code pairs.
+
+    Counted with np.bincount for small shapes and a sparse COO
+    construction otherwise; all codes must be valid (>= 0).
+    """
+    if shape[0] * shape[1] <= _BINCOUNT_MAX_CELLS:
+        flat = np.bincount(
+            np.asarray(row_codes, dtype=np.int64) * shape[1] + col_codes,
+            minlength=shape[0] * shape[1]
+        )
+        return sparse.csr_matrix(flat.reshape(shape))
+    counts = sparse.csr_matrix(
+        (np.ones(len(row_codes), dtype=np.int64), (row_codes, col_codes)),
+        shape=shape
+    )
+    counts.sum_duplicates()
+    return counts
+
+
+def _resolve_n_jobs(n_jobs) -> int:
+    """n_jobs convention: None/1 = serial, -1 = all cores"""
+    if n_jobs is None:
+        return 1
+    if n_jobs < 0:
+        return max(1, (os.cpu_count() or 1) + 1 + n_jobs)
+    return max(1, int(n_jobs))
+
+
+def _metrics_chunk_worker(shm_name, shape, dtype, start, stop, N,
+                          kernel_kwargs, settings, table_spec):
+    """Process-pool worker: kernel on one slice of the shared a/b/c/d"""
+    # Workers started by spawn / forkserver do not inherit class-level
+    # state: apply the parent's kernel options explicitly
+    AssociationStatsKernel.apply_settings(settings)
+    _use_worker_log_factorial_table(**table_spec)
+    shm = shared_memory.SharedMemory(name=shm_name)
+    try:
+        cells = np.ndarray(shape, dtype=dtype, buffer=shm.buf)
+        a, b, c, d = (cells[i, start:stop].copy() for i in range(4))
+    finally:
+        shm.close()
+    return AssociationStatsKernel.calculate_all_metrics_batch(
+        a, b, c, d, total_corpus_size=N, **kernel_kwargs
+    )
+
+
+def _use_worker_log_factorial_table(max_entries: int, mmap_path: str):
+    """
+    Log-factorial table of a worker process. A memory-mapped table is
+    opened read-only: the parent grows the file before dispatching, so
+    workers never write to it.
+    """
+    table = AssociationStatsKernel.log_factorial_table
+    if mmap_path is None:
+        if table.mmap_path is not None or table.max_entries != max_entries:
+            AssociationStatsKernel.log_factorial_table = LogFactorialTable(
+                max_entries
+            )
+        return
+    if table.mmap_path != mmap_path or table.max_entries != max_entries:
+        table = LogFactorialTable(max_entries, mmap_path)
+    table.read_only = True
+    AssociationStatsKernel.log_factorial_table = table
+
+
+def _calculate_all_metrics_parallel(a, b, c, d, N, n_jobs: int,
+                                    **kernel_kwargs) -> dict:
+    """
+    calculate_all_metrics_batch split into chunks over a process pool.
+
+    The contingency arrays are placed once in a shared memory block;
+    workers only receive its name and their slice bounds, together with
+    the kernel's class-level settings. The log-factorial table is grown
+    here first, so workers only read it. Chunks are reassembled in
+    order, so the output equals the serial run.
+    """
+    kernel = AssociationStatsKernel
+    table = kernel.log_factorial_table
+    groups = kernel.resolve_metrics(kernel_kwargs.get("metrics"))
+    if kernel_kwargs.get("include_fisher", True) and "FYE" in groups:
+        n_max = int(np.max(np.asarray(a) + b + c + d, initial=0))
+        table.ensure(max(n_max, int(N or 0)))
+    table_spec = {"max_entries": table.max_entries,
+                  "mmap_path": table.mmap_path}
+
+    cells = np.stack(np.broadcast_arrays(a, b, c, d))
+    n_rows = cells.shape[1]
+    # A few chunks per worker balances uneven Fisher tail lengths
+    n_chunks = min(n_rows, n_jobs * 4)
+    bounds = np.linspace(0, n_rows, n_chunks + 1).astype(int)
+
+    shm = shared_memory.SharedMemory(create=True, size=max(cells.nbytes, 1))
+    try:
+        shared = np.ndarray(cells.shape, dtype=cells.dtype, buffer=shm.buf)
+        shared[:] = cells
+        with ProcessPoolExecutor(max_workers=n_jobs) as pool:
+            futures = [
+                pool.submit(
+                    _metrics_chunk_worker, shm.name, cells.shape,
+                    cells.dtype, start, stop, N, kernel_kwargs,
+                    kernel.settings(), table_spec
+                )
+                for start, stop in zip(bounds[:-1], bounds[1:])
+            ]
+            parts = [f.result() for f in futures]
+        del shared
+    finally:
+        shm.close()
+        shm.unlink()
+
+    def _concat(chunks):
+        if isinstance(chunks[0], pd.Categorical):
+            return union_categoricals(chunks)
+        return np.concatenate(chunks)
+
+    return {key: _concat([part[key] for part in parts]) for key in parts[0]}
+
+
+class CollexemeAnalyzer(ABC):
+    """Base class for Collexeme Analysis orchestrators"""
+
+    # Below this many tables, n_jobs > 1 still runs serially
+    _PARALLEL_MIN_ROWS = 10_000
+    
+    @abstractmethod
+    def run(self, df: pd.DataFrame, **kwargs) -> pd.DataFrame:
+        """Abstract method to execute analysis"""
+        pass
+
+    def _apply_metrics(self, row, a, b, c, d, N, label_pos, label_neg,
+                       signed_metrics: bool = False,
+                       include_fisher: bool = True) -> pd.Series:
+        """Helper to call Statistics Kernel"""
+        return AssociationStatsKernel.calculate_all_metrics(
+            a, b, c, d, 
+            total_corpus_size=N, 
+            label_pos=label_pos, 
+            label_neg=label_neg,
+            signed_metrics=signed_metrics,
+            include_fisher=include_fisher
+        )
+
+    def _apply_metrics_batch(self, a, b, c, d, N, label_pos, label_neg,
+                             signed_metrics: bool = False,
+                             include_fisher: bool = True,
+                             n_jobs: int = 1,
+                             metrics=None) -> dict:
+        """
+        Helper to call the vectorized Statistics Kernel
+        (in a process pool when n_jobs > 1 and the table is large).
+        Returns the kernel's typed columns.
+        """
+        kernel_kwargs = dict(
+            label_pos=label_pos,
+            label_neg=label_neg,
+            signed_metrics=signed_metrics,
+            include_fisher=include_fisher,
+            metrics=metrics
+        )
+        kernel = AssociationStatsKernel
+        before = kernel.dedup_stats()
+        with _stage("kernel", rows=len(a)):
+            n_jobs = _resolve_n_jobs(n_jobs)
+            if (n_jobs > 1 and np.ndim(N) == 0
+                    and len(a) >= self._PARALLEL_MIN_ROWS):
+                # Deduplicate here so workers only see distinct tables
+                a, b, c, d = (np.asarray(x) for x in (a, b, c, d))
+                unique = kernel.unique_tables(a, b, c, d, N)
+                first = slice(None) if unique is None else unique[0]
+                _log(f"  [Parallel] n_jobs={n_jobs}, rows={len(a)}")
+                columns = _calculate_all_metrics_parallel(
+                    a[first], b[first], c[first], d[first], N, n_jobs,
+                    deduplicate=False, **kernel_kwargs
+                )
+                if unique is not None:
+                    columns = kernel.broadcast_tables(
+                        columns, unique[1], a, b, c, d
+                    )
+            else:
+                columns = kernel.calculate_all_metrics_batch(
+                    a, b, c, d, total_corpus_size=N, **kernel_kwargs
+                )
+
+        after = kernel.dedup_stats()
+        tables = after["tables"] - before["tables"]
+        saved = after["saved"] - before["saved"]
+        if saved > 0:
+            _log(f"  [Dedup] {tables} tables -> {tables - saved} distinct "
+                 f"({saved} computations saved)")
+        return columns
+
+    @staticmethod
+    def _build_result(columns: dict, order: list, index=None) -> pd.DataFrame:
+        """
+        Assemble the output frame in one step from typed columns,
+        keeping only the names in order that are present
+        """
+        with _stage("assembly") as record:
+            result = pd.DataFrame(
+                {col: columns[col] for col in order if col in columns},
+                index=index, copy=False
+            )
+            record["rows"] = len(result)
+        return result
+
+    @staticmethod
+    def _strength_key(values: pd.Series) -> pd.Series:
+        """
+        Sort key for signed strengths: the absolute value, except that
+        PMI = -inf (a = 0, the pair never occurs) ranks last
+        """
+        strength = values.abs()
+        if values.name == "PMI":
+            strength = strength.where(np.isfinite(values), -np.inf)
+        return strength
+
+    @staticmethod
+    def _sort_result(result, sort_cols, ascending=False, key=None):
+        """
+        Sort by the first of sort_cols present in result
+        (a metrics selection may have skipped the usual sort column)
+        """
+        for col in sort_cols:
+            if col in result.columns:
+                with _stage("sort", rows=len(result)):
+                    return result.sort_values(
+                        col, ascending=ascending, key=key, kind="stable"
+                    )
+        return result
+
+
+class SimpleCollexemeAnalyzer(CollexemeAnalyzer):
+    """Simple Collexeme Analysis implementation"""
     
     def run(
         self, 
         df: pd.DataFrame, 
         word_col: str, 
-        construction_col: str = None, 
-        count_cols: list = None, 
+        freq_corpus_col: str, 
+        freq_const_col: str, 
         total_corpus_size: int = None,
         signed_metrics: bool = False,
-        include_fisher: bool = False
+        include_fisher: bool = True,
+        n_jobs: int = 1,
+        metrics: list = None
     ) -> pd.DataFrame:
-        """Execute Distinctive Collexeme Analysis"""
-        # Preprocessing (Wide Format conversion)
-        if construction_col is not None and construction_col in df.columns:
-            counts = df.pivot_table(
-                index=word_col, 
-                columns=construction_col, 
-                aggfunc='size', 
-                fill_value=0
+        """Execute Simple Collexeme Analysis"""
+        with _stage("counting", rows=len(df)):
+            N = (total_corpus_size 
+                 if total_corpus_size 
+                 else df[freq_corpus_col].sum())
+            C_total = df[freq_const_col].sum()
+            a = df[freq_const_col].to_numpy()
+            b = C_total - a
+            c = df[freq_corpus_col].to_numpy() - a
+            d = N - C_total - c
+        _log(f"  [Simple] N={N}, C_total={C_total}")
+
+        stats = self._apply_metrics_batch(
+            a, b, c, d, N, "Attraction", "Repulsion",
+            signed_metrics=signed_metrics,
+            include_fisher=include_fisher,
+            n_jobs=n_jobs,
+            metrics=metrics
+        )
+        stats[word_col] = df[word_col].to_numpy()
+        return self._finalize(stats, word_col, index=df.index)
+
+    def _finalize(self, stats: dict, word_col: str, index=None):
+        """Select, order and sort the Simple analysis output columns"""
+        # Include CI in Simple analysis display
+        target_cols = [
+            word_col, "a", "c", "Direction", "LLR", "PEARSONRESID",
+            "LOGODDSRATIO", "LogOdds_CI_Lower", "LogOdds_CI_Upper",
+            "LogOdds_CrossesZero", "PMI", "DELTAPC2W", "DELTAPW2C", 
+            "KLDC2W", "KLDW2C", "FYE"
+        ]
+        
+        result = self._build_result(stats, target_cols, index=index)
+        return self._sort_result(
+            result, ["FYE", "LLR", "LOGODDSRATIO", "PMI"],
+            key=self._strength_key
+        )
+
+
+class IncrementalSimpleCollexemeAnalyzer(SimpleCollexemeAnalyzer):
+    """
+    Simple Collexeme Analysis over a growing corpus.
+
+    Holds the cumulative word counts (and corpus size). update() adds
+    delta count tables as new corpus batches arrive; results() returns
+    the same frame as SimpleCollexemeAnalyzer.run on the cumulative
+    table. Closed-form metrics are refreshed for all words. The Fisher
+    results are kept per word and reused when the word's table
+    (a, b, c, d) is unchanged; since b and d follow N and the
+    construction total, this only saves work for batches that leave
+    both totals unchanged (e.g. corrections moving counts between
+    words, or repeated results() calls). The state can be saved and
+    reloaded between runs.
+    """
+
+    _STATE_VERSION = 1
+
+    def __init__(
+        self,
+        word_col: str = "WORD",
+        freq_corpus_col: str = "FREQ_WORD_in_CORPUS",
+        freq_const_col: str = "FREQ_WORD_in_CONSTRUCTION",
+        signed_metrics: bool = False,
+        include_fisher: bool = True,
+        metrics: list = None,
+        verbose: bool = True
+    ):
+        self.word_col = word_col
+        self.freq_corpus_col = freq_corpus_col
+        self.freq_const_col = freq_const_col
+        self.signed_metrics = signed_metrics
+        self.include_fisher = include_fisher
+        self.metrics = metrics
+        self.verbose = verbose
+        # Cumulative counts, one row per word (in order of first arrival)
+        self.counts = pd.DataFrame(
+            {freq_corpus_col: pd.Series(dtype=np.int64),
+             freq_const_col: pd.Series(dtype=np.int64)},
+            index=pd.Index([], name=word_col)
+        )
+        # Explicit corpus size; None means the sum of corpus frequencies
+        self.total_corpus_size = None
+        # Unsigned Fisher results of the last results() call
+        self._fisher_cache = None
+
+    def run_batch(self, df: pd.DataFrame, corpus_size_delta: int = None,
+                  n_jobs: int = 1) -> pd.DataFrame:
+        """Add df as a batch (see update) and return the updated results"""
+        self.update(df, corpus_size_delta=corpus_size_delta)
+        return self.results(n_jobs=n_jobs)
+
+    def update(self, delta_df: pd.DataFrame, corpus_size_delta: int = None):
+        """
+        Add a delta count table (word, corpus freq, construction freq).
+
+        Words may repeat and counts may be negative (corrections), but
+        cumulative counts must stay non-negative. corpus_size_delta is
+        the number of corpus tokens in the batch; give it for every
+        batch when the corpus is larger than the table's words
+        (total_corpus_size of a full run), or never. A rejected batch
+        leaves the state unchanged.
+        """
+        count_cols = [self.freq_corpus_col, self.freq_const_col]
+        delta = (delta_df.groupby(self.word_col, sort=False)[count_cols]
+                 .sum().astype(np.int64))
+
+        total_corpus_size = self.total_corpus_size
+        if corpus_size_delta is not None:
+            if total_corpus_size is None and len(self.counts) > 0:
+                raise ValueError(
+                    "Error: corpus_size_delta given, but earlier batches "
+                    "were added without a corpus size."
+                )
+            total_corpus_size = (total_corpus_size or 0) + corpus_size_delta
+            if total_corpus_size < 0:
+                raise ValueError(
+                    "Error: corpus_size_delta makes the corpus size "
+                    "negative."
+                )
+        elif total_corpus_size is not None:
+            raise ValueError(
+                "Error: corpus_size_delta is required once the corpus "
+                "size is tracked explicitly."
+            )
+
+        new_words = delta.index.difference(self.counts.index, sort=False)
+        counts = self.counts.reindex(
+            self.counts.index.append(new_words), fill_value=0
+        )
+        counts.loc[delta.index, count_cols] += delta.to_numpy()
+        if (counts.to_numpy() < 0).any():
+            raise ValueError(
+                "Error: Delta counts make cumulative frequencies negative."
             )
+        # Both validated: commit the batch
+        self.counts = counts
+        self.total_corpus_size = total_corpus_size
+        with _verbosity(self.verbose):
+            _log(f"  [Incremental] +{len(delta)} words in batch "
+                 f"({len(new_words)} new), {len(counts)} total")
+
+    def results(self, n_jobs: int = 1) -> pd.DataFrame:
+        """Results for the cumulative counts (Fisher reused where possible)"""
+        with _verbosity(self.verbose):
+            return self._results(n_jobs)
+
+    def _results(self, n_jobs: int) -> pd.DataFrame:
+        counts = self.counts
+        N = (self.total_corpus_size
+             if self.total_corpus_size
+             else counts[self.freq_corpus_col].sum())
+        C_total = counts[self.freq_const_col].sum()
+        _log(f"  [Simple] N={N}, C_total={C_total}")
+
+        a = counts[self.freq_const_col].to_numpy()
+        b = C_total - a
+        c = counts[self.freq_corpus_col].to_numpy() - a
+        d = N - C_total - c
+
+        groups = AssociationStatsKernel.resolve_metrics(self.metrics)
+        with_fisher = self.include_fisher and "FYE" in groups
+        # Global refresh: every closed-form metric for every word
+        stats = self._apply_metrics_batch(
+            a, b, c, d, N, "Attraction", "Repulsion",
+            signed_metrics=self.signed_metrics,
+            include_fisher=self.include_fisher,
+            n_jobs=n_jobs,
+            metrics=sorted(groups - {"FYE"})
+        )
+        if with_fisher:
+            stats.update(self._refresh_fisher(a, b, c, d, N))
+
+        stats[self.word_col] = counts.index.to_numpy()
+        return self._finalize(stats, self.word_col)
+
+    def _refresh_fisher(self, a, b, c, d, N) -> dict:
+        """Fisher stats, recomputed only for changed tables"""
+        cells = np.stack([a, b, c, d], axis=1)
+        cache = self._fisher_cache
+        if cache is None:
+            changed = np.ones(len(a), dtype=bool)
+            p_val = np.full(len(a), np.nan)
+            fye = np.full(len(a), np.nan)
         else:
-            df_wide = df.copy().set_index(word_col)
-            cols_to_use = (
-                count_cols 
-                if count_cols 
-                else df_wide.select_dtypes(include=[np.number]).columns
+            cache = cache.reindex(self.counts.index)
+            cached_cells = cache[["a", "b", "c", "d"]].to_numpy()
+            changed = ~(cached_cells == cells).all(axis=1)
+            p_val = cache["Fisher_p_value"].to_numpy(dtype=float, copy=True)
+            fye = cache["FYE"].to_numpy(dtype=float, copy=True)
+
+        if changed.any():
+            with np.errstate(divide='ignore', invalid='ignore'):
+                fresh = AssociationStatsKernel.calc_fisher_stats_batch(
+                    a[changed], b[changed], c[changed], d[changed], N
+                )
+            p_val[changed] = fresh["Fisher_p_value"]
+            fye[changed] = fresh["FYE"]
+        _log(f"  [Incremental] Fisher recomputed for {changed.sum()} "
+             f"of {len(a)} words")
+
+        self._fisher_cache = pd.DataFrame(
+            {"a": a, "b": b, "c": c, "d": d,
+             "Fisher_p_value": p_val, "FYE": fye},
+            index=self.counts.index
+        )
+
+        if self.signed_metrics:
+            # Same sign rule as the kernel
+            with np.errstate(divide='ignore', invalid='ignore'):
+                attraction = a > ((a + c) * (a + b)) / N
+            fye = np.where(attraction, fye, -fye)
+        return {"Fisher_p_value": p_val.copy(), "FYE": fye}
+
+    def save(self, path: str):
+        """Persist counts, corpus size and the Fisher cache (pickle)"""
+        pd.to_pickle({
+            "version": self._STATE_VERSION,
+            "columns": (self.word_col, self.freq_corpus_col,
+                        self.freq_const_col),
+            "options": dict(signed_metrics=self.signed_metrics,
+                            include_fisher=self.include_fisher,
+                            metrics=self.metrics,
+                            verbose=self.verbose),
+            "counts": self.counts,
+            "total_corpus_size": self.total_corpus_size,
+            "fisher_cache": self._fisher_cache
+        }, path)
+
+    @classmethod
+    def load(cls, path: str) -> "IncrementalSimpleCollexemeAnalyzer":
+        """Restore an analyzer saved with save() (trusted files only)"""
+        state = pd.read_pickle(path)
+        if state.get("version") != cls._STATE_VERSION:
+            raise ValueError(
+                f"Error: Unsupported state version {state.get('version')}."
+            )
+        analyzer = cls(*state["columns"], **state["options"])
+        analyzer.counts = state["counts"]
+        analyzer.total_corpus_size = state["total_corpus_size"]
+        analyzer._fisher_cache = state["fisher_cache"]
+        return analyzer
+
+
+class DistinctiveCollexemeAnalyzer(CollexemeAnalyzer):
+    """Distinctive Collexeme Analysis implementation"""
+
+    # Multiple DCA tables with more cells than this use the sparse path
+    _DENSE_MAX_CELLS = 1_000_000
+
+    # Analysis modes (None: two-way DCA for 2 constructions, else multiple)
+    MODES = ("multiple", "one_vs_rest", "pairwise")
+    # Label of the merged other constructions in one-vs-rest mode
+    REST_LABEL = "(rest)"
+
+    def run(
+        self, 
+        df: pd.DataFrame, 
+        word_col: str, 
+        construction_col: str = None, 
+        count_cols: list = None, 
+        total_corpus_size: int = None,
+        signed_metrics: bool = False,
+        include_fisher: bool = True,
+        n_jobs: int = 1,
+        metrics: list = None,
+        mode: str = None
+    ) -> pd.DataFrame:
+        """
+        Execute Distinctive Collexeme Analysis
+
+        mode: None (two-way DCA for 2 constructions, multiple DCA
+              otherwise), "multiple" (Pearson residuals), or
+              "one_vs_rest" / "pairwise" (full 2x2 metrics for each
+              construction against the rest / for every construction
+              pair, in long format; see _handle_construction_pairs)
+        """
+        if mode is not None and mode not in self.MODES:
+            raise ValueError(
+                f"Error: Unknown mode '{mode}'. Choose from {list(self.MODES)}."
             )
-            counts = df_wide[cols_to_use].fillna(0).astype(int)
+        with _stage("counting", rows=len(df)):
+            # Preprocessing (Wide Format conversion)
+            if (construction_col is not None
+                    and construction_col in df.columns):
+                count_matrix, words, const_labels = build_count_matrix(
+                    df[word_col], df[construction_col]
+                )
+                words = words.rename(word_col)
+                const_labels = const_labels.rename(construction_col)
+                n_cells = count_matrix.shape[0] * count_matrix.shape[1]
+                if (len(const_labels) > 2
+                        and n_cells > self._DENSE_MAX_CELLS):
+                    counts = pd.DataFrame.sparse.from_spmatrix(
+                        count_matrix, index=words, columns=const_labels
+                    )
+                else:
+                    counts = pd.DataFrame(
+                        count_matrix.toarray(), index=words,
+                        columns=const_labels
+                    )
+            else:
+                df_wide = df.copy().set_index(word_col)
+                cols_to_use = (
+                    count_cols 
+                    if count_cols 
+                    else df_wide.select_dtypes(include=[np.number]).columns
+                )
+                counts = df_wide[cols_to_use].fillna(0).astype(int)
 
         constructions = counts.columns.tolist()
         n_const = len(constructions)
-        print(f"  [Distinctive] Constructions: {n_const} {constructions}")
+        _log(f"  [Distinctive] Constructions: {n_const} {constructions}")
 
-        if n_const == 2:
+        if mode in ("one_vs_rest", "pairwise"):
+            return self._handle_construction_pairs(
+                counts, constructions, word_col, mode,
+                total_corpus_size=total_corpus_size,
+                signed_metrics=signed_metrics,
+                include_fisher=include_fisher,
+                n_jobs=n_jobs,
+                metrics=metrics
+            )
+        if n_const == 2 and mode is None:
             return self._handle_two_constructions(
                 counts, constructions, word_col, total_corpus_size,
                 signed_metrics=signed_metrics,
-                include_fisher=include_fisher
+                include_fisher=include_fisher,
+                n_jobs=n_jobs,
+                metrics=metrics
             )
         else:
             # Provides	fast	quick	rapid	swift	SUMABSDEV	LARGESTPREF
             # signed_metrics is not needed for multiple constructions
-            return self._handle_multiple_constructions(
-                counts, word_col, constructions
-            )
+            with _stage("residuals", rows=len(counts)):
+                return self._handle_multiple_constructions(
+                    counts, word_col, constructions
+                )
 
     def _handle_two_constructions(
         self, counts, constructions, word_col, total_corpus_size=None,
         signed_metrics: bool = False,
-        include_fisher: bool = False
+        include_fisher: bool = True,
+        n_jobs: int = 1,
+        metrics: list = None
     ):
         """Handle standard 2-construction DCA"""
         const_A, const_B = constructions[0], constructions[1]
@@ -465,23 +2392,20 @@ class DistinctiveCollexemeAnalyzer(CollexemeAnalyzer):
             else (total_A + total_B)
         )
 
-        def _process_row(row):
-            a = row[const_A]
-            c = row[const_B]
-            b = total_A - a
-            d = total_B - c
-            return self._apply_metrics(
-                row, a, b, c, d, grand_total, const_A, const_B,
-                signed_metrics=signed_metrics,
-                include_fisher=include_fisher
-            )
+        a = counts[const_A].to_numpy()
+        c = counts[const_B].to_numpy()
+        b = total_A - a
+        d = total_B - c
 
-        metrics = counts.apply(_process_row, axis=1)
-        result = pd.concat([
-            counts.reset_index()[word_col], 
-            counts.reset_index(drop=True), 
-            metrics.reset_index(drop=True)
-        ], axis=1)
+        stats = self._apply_metrics_batch(
+            a, b, c, d, grand_total, const_A, const_B,
+            signed_metrics=signed_metrics,
+            include_fisher=include_fisher,
+            n_jobs=n_jobs,
+            metrics=metrics
+        )
+        stats.update({word_col: counts.index.to_numpy(), const_A: a,
+                      const_B: c})
 
         # CI typically not displayed in Distinctive analysis 
         # but included in data
@@ -491,15 +2415,158 @@ class DistinctiveCollexemeAnalyzer(CollexemeAnalyzer):
              "PMI", "DELTAPC2W", "DELTAPW2C", "KLDC2W", "KLDW2C", "FYE"]
         )
         
-        result_filtered = result[
-            [c for c in target_cols if c in result.columns]
-        ]
-        return result_filtered.sort_values(
-            "LOGODDSRATIO", ascending=False, key=abs
+        result = self._build_result(stats, target_cols)
+        return self._sort_result(
+            result, ["LOGODDSRATIO", "LLR", "FYE", "PMI"],
+            key=self._strength_key
         )
 
+    def _handle_construction_pairs(
+        self, counts, constructions, word_col, mode,
+        total_corpus_size=None,
+        signed_metrics: bool = False,
+        include_fisher: bool = True,
+        n_jobs: int = 1,
+        metrics: list = None
+    ):
+        """
+        Two-way DCA for many construction pairs in one kernel call.
+
+        "one_vs_rest" compares each construction with all others merged;
+        "pairwise" compares every pair (A, B) with A before B in column
+        order, over the words attested in A or B. Both reuse the one
+        count matrix and its column totals: the 2x2 tables of all
+        (word, pair) combinations are built as flat arrays and evaluated
+        by a single batched kernel call. Each pair gives the same values
+        as the two-way DCA on the data of that pair (for one-vs-rest,
+        with the other constructions relabelled as REST_LABEL).
+
+        Returns:
+            Long-format DataFrame: word, CONSTRUCTION, OTHER, the counts
+            FREQ_CONSTRUCTION / FREQ_OTHER, Direction (the preferred
+            construction) and the two-way DCA metrics, grouped by pair
+        """
+        is_sparse = all(
+            isinstance(dtype, pd.SparseDtype) for dtype in counts.dtypes
+        )
+        obs = (counts.sparse.to_coo().tocsc() if is_sparse
+               else counts.to_numpy())
+        n_words, n_const = obs.shape
+        col_totals = np.asarray(obs.sum(axis=0)).ravel()
+        row_totals = np.asarray(obs.sum(axis=1)).ravel()
+        grand_total = col_totals.sum()
+
+        if mode == "one_vs_rest":
+            first = np.arange(n_const)
+            second = np.full(n_const, n_const)  # REST_LABEL
+        else:
+            first, second = np.triu_indices(n_const, k=1)
+        n_pairs = len(first)
+
+        def _columns(cols):
+            block = obs[:, cols]
+            return block.toarray() if is_sparse else block
+
+        with _stage("counting") as record:
+            # Flat (word, pair) tables, built in blocks of pairs to bound
+            # the dense intermediate (n_words x pairs) arrays
+            per_block = max(1, self._DENSE_MAX_CELLS // max(n_words, 1))
+            words, pairs, freq_a, freq_c = [], [], [], []
+            for start in range(0, n_pairs, per_block):
+                stop = min(start + per_block, n_pairs)
+                a_block = _columns(first[start:stop])
+                if mode == "one_vs_rest":
+                    c_block = row_totals[:, None] - a_block
+                    keep = np.broadcast_to(
+                        row_totals[:, None] > 0, a_block.shape
+                    )
+                else:
+                    c_block = _columns(second[start:stop])
+                    keep = (a_block + c_block) > 0
+                word_idx, pair_idx = np.nonzero(keep)
+                words.append(word_idx)
+                pairs.append(pair_idx + start)
+                freq_a.append(a_block[word_idx, pair_idx])
+                freq_c.append(c_block[word_idx, pair_idx])
+            words, pairs = np.concatenate(words), np.concatenate(pairs)
+            a = np.concatenate(freq_a).astype(np.int64)
+            c = np.concatenate(freq_c).astype(np.int64)
+
+            # Order by pair, then by word (np.nonzero is row-major)
+            order = np.lexsort((words, pairs))
+            words, pairs = words[order], pairs[order]
+            a, c = a[order], c[order]
+
+            total_a = col_totals[first][pairs]
+            if mode == "one_vs_rest":
+                total_c = grand_total - total_a
+            else:
+                total_c = col_totals[second][pairs]
+            b = total_a - a
+            d = total_c - c
+            N = (total_corpus_size if total_corpus_size
+                 else (grand_total if mode == "one_vs_rest"
+                       else total_a + total_c))
+            record["rows"] = len(a)
+
+        _log(f"  [Distinctive] Mode: {mode}, {n_pairs} pairs, "
+             f"{len(a)} tables")
+        stats = self._apply_metrics_batch(
+            a, b, c, d, N, "A", "B",
+            signed_metrics=signed_metrics,
+            include_fisher=include_fisher,
+            n_jobs=n_jobs,
+            metrics=metrics
+        )
+
+        labels = list(constructions) + (
+            [self.REST_LABEL] if mode == "one_vs_rest" else []
+        )
+        const_codes = first[pairs]
+        other_codes = second[pairs]
+        attraction = np.asarray(stats["Direction"].codes) == 0
+        stats.update({
+            word_col: np.asarray(counts.index)[words],
+            "CONSTRUCTION": pd.Categorical.from_codes(
+                const_codes, categories=labels
+            ),
+            "OTHER": pd.Categorical.from_codes(other_codes, categories=labels),
+            "FREQ_CONSTRUCTION": a,
+            "FREQ_OTHER": c,
+            "Direction": pd.Categorical.from_codes(
+                np.where(attraction, const_codes, other_codes),
+                categories=labels
+            )
+        })
+
+        target_cols = (
+            [word_col, "CONSTRUCTION", "OTHER", "FREQ_CONSTRUCTION",
+             "FREQ_OTHER", "Direction", "LLR", "PEARSONRESID",
+             "LOGODDSRATIO", "PMI", "DELTAPC2W", "DELTAPW2C", "KLDC2W",
+             "KLDW2C", "FYE"]
+        )
+        result = self._build_result(stats, target_cols)
+        # Within each pair, same order as the two-way DCA
+        result = self._sort_result(
+            result, ["LOGODDSRATIO", "LLR", "FYE", "PMI"],
+            key=self._strength_key
+        )
+        pair_order = np.argsort(pairs[result.index], kind="stable")
+        return result.iloc[pair_order]
+
     def _handle_multiple_constructions(self, counts, word_col, constructions):
         """Handle multiple DCA using Pearson Residuals Logic (no Kernel)"""
+        if counts.shape[0] * counts.shape[1] > self._DENSE_MAX_CELLS:
+            is_sparse = all(
+                isinstance(dtype, pd.SparseDtype) for dtype in counts.dtypes
+            )
+            obs = (counts.sparse.to_coo() if is_sparse
+                   else counts.to_numpy())
+            return self._handle_multiple_constructions_sparse(
+                obs, counts.index, word_col, constructions,
+                columns_name=counts.columns.name
+            )
+
         obs = counts.values
         row_totals = obs.sum(axis=1)[:, None]
         col_totals = obs.sum(axis=0)[None, :]
@@ -514,12 +2581,368 @@ class DistinctiveCollexemeAnalyzer(CollexemeAnalyzer):
             residuals, index=counts.index, columns=counts.columns
         )
         res_df["SUMABSDEV"] = res_df.abs().sum(axis=1)
-        res_df["LARGESTPREF"] = res_df[constructions].idxmax(axis=1)
+        res_df["LARGESTPREF"] = pd.Categorical(
+            res_df[constructions].idxmax(axis=1), categories=constructions
+        )
         res_df.reset_index(inplace=True)
         res_df.rename(columns={word_col: "COLLOCATE"}, inplace=True)
         
         return res_df.sort_values("SUMABSDEV", ascending=False)
 
+    def _handle_multiple_constructions_sparse(
+        self, obs, words, word_col, constructions, columns_name=None
+    ):
+        """
+        Multiple DCA on a sparse count matrix (words x constructions).
+
+        Expected frequencies are never materialized. For a zero cell the
+        Pearson residual reduces to -sqrt(row_total * col_total / N), a
+        rank-1 term, so SUMABSDEV and LARGESTPREF are computed from the
+        observed (non-zero) cells plus closed-form zero-cell terms.
+        Only the residual columns of the output are dense.
+        """
+        obs = sparse.csr_matrix(obs)
+        obs.eliminate_zeros()
+        n_words, n_const = obs.shape
+        row_totals = np.asarray(obs.sum(axis=1)).ravel()
+        col_totals = np.asarray(obs.sum(axis=0)).ravel()
+        grand_total = row_totals.sum()
+
+        rows = np.repeat(np.arange(n_words), np.diff(obs.indptr))
+        cols = obs.indices
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            row_scale = np.sqrt(row_totals / grand_total)
+            sqrt_col = np.sqrt(col_totals)
+
+            # Residuals of the observed cells
+            exp_nz = row_totals[rows] * col_totals[cols] / grand_total
+            res_nz = (obs.data - exp_nz) / np.sqrt(exp_nz)
+            res_nz = np.nan_to_num(res_nz, nan=0.0)
+
+        # Output: zero-cell residuals everywhere, then the observed cells
+        residuals = np.outer(row_scale, sqrt_col)
+        np.negative(residuals, out=residuals)
+        residuals += 0.0  # -0.0 -> 0.0 for empty rows/columns
+        residuals[rows, cols] = res_nz
+
+        # SUMABSDEV = sum over zero cells + sum over observed cells
+        zero_abs = row_scale * (
+            sqrt_col.sum()
+            - np.bincount(rows, weights=sqrt_col[cols], minlength=n_words)
+        )
+        sum_abs_dev = zero_abs + np.bincount(
+            rows, weights=np.abs(res_nz), minlength=n_words
+        )
+
+        largest = self._largest_pref_sparse(
+            rows, cols, res_nz, row_scale, sqrt_col, row_totals,
+            col_totals, n_words, n_const
+        )
+
+        res_df = pd.DataFrame(residuals, columns=constructions)
+        res_df.columns.name = columns_name
+        res_df.insert(0, "COLLOCATE", np.asarray(words))
+        res_df["SUMABSDEV"] = sum_abs_dev
+        res_df["LARGESTPREF"] = pd.Categorical.from_codes(
+            largest, categories=constructions
+        )
+
+        return res_df.sort_values("SUMABSDEV", ascending=False)
+
+    @staticmethod
+    def _largest_pref_sparse(rows, cols, res_nz, row_scale, sqrt_col,
+                             row_totals, col_totals, n_words, n_const):
+        """
+        Column index of the largest residual per row (first one on ties,
+        like idxmax), comparing the best observed cell with the best
+        zero cell. The best zero cell is the one with the smallest
+        column total that is not observed in the row.
+        """
+        # Best observed cell per row: max residual, lowest column on ties
+        order = np.lexsort((cols, -res_nz, rows))
+        first = np.ones(len(order), dtype=bool)
+        first[1:] = rows[order][1:] != rows[order][:-1]
+        best_nz_col = np.full(n_words, -1)
+        best_nz_val = np.full(n_words, -np.inf)
+        best_nz_col[rows[order][first]] = cols[order][first]
+        best_nz_val[rows[order][first]] = res_nz[order][first]
+
+        # Best zero cell per row: the first column (in ascending
+        # column-total order) missing from the row, i.e. the "mex" of
+        # the ranks of the observed columns
+        col_order = np.argsort(col_totals, kind="stable")
+        rank = np.empty(n_const, dtype=np.int64)
+        rank[col_order] = np.arange(n_const)
+        keys = np.sort(rows * n_const + rank[cols])
+        sorted_rows = keys // n_const
+        row_start = np.searchsorted(sorted_rows, np.arange(n_words))
+        position = np.arange(len(keys)) - row_start[sorted_rows]
+        mex = np.bincount(
+            sorted_rows, weights=(keys % n_const) == position,
+            minlength=n_words
+        ).astype(np.int64)
+
+        has_zero = mex < n_const
+        best_zero_col = np.where(
+            has_zero, col_order[np.minimum(mex, n_const - 1)], -1
+        )
+        best_zero_val = np.where(
+            has_zero,
+            -(row_scale * sqrt_col[np.maximum(best_zero_col, 0)]) + 0.0,
+            -np.inf
+        )
+
+        take_nz = (
+            (best_nz_val > best_zero_val)
+            | ((best_nz_val == best_zero_val)
+               & (best_nz_col < best_zero_col))
+        )
+        largest = np.where(take_nz, best_nz_col, best_zero_col)
+        # Empty rows have all residuals 0 -> first column
+        largest[row_totals == 0] = 0
+        return largest
+
+
+def _iter_table_chunks(source, columns=None, chunksize: int = 1_000_000,
+                       **read_kwargs):
+    """
+    Yields DataFrame chunks from a file path or an iterable of chunks.
+
+    Args:
+        source: Path to a CSV/TSV file (read with pd.read_csv; pass sep
+            etc. via read_kwargs), a Parquet or Feather/Arrow IPC file
+            (see _table_format; requires pyarrow), a DataFrame, or an
+            iterable of DataFrames (pyarrow tables / record batches are
+            converted)
+        columns: Columns to read (None reads all columns)
+        chunksize: Rows per chunk when reading files
+    """
+    if isinstance(source, pd.DataFrame):
+        yield source if columns is None else source[columns]
+        return
+
+    if isinstance(source, (str, os.PathLike)):
+        path = os.fspath(source)
+        fmt = _table_format(path)
+        if fmt == "csv":
+            yield from pd.read_csv(
+                path, usecols=columns, chunksize=chunksize, **read_kwargs
+            )
+            return
+        pa = _import_pyarrow(f"Reading {fmt.capitalize()} files")
+        if fmt == "parquet":
+            batches = pa.parquet.ParquetFile(path).iter_batches(
+                batch_size=chunksize, columns=columns
+            )
+        else:
+            # Feather / Arrow IPC: the file's own record batches
+            reader = pa.ipc.open_file(path)
+            batches = (reader.get_batch(i)
+                       for i in range(reader.num_record_batches))
+        for batch in batches:
+            chunk = batch.to_pandas()
+            yield chunk if columns is None else chunk[columns]
+        return
+
+    for chunk in source:
+        if hasattr(chunk, "to_pandas"):
+            chunk = chunk.to_pandas()
+        yield chunk if columns is None else chunk[columns]
+
+
+def _import_pyarrow(purpose: str):
+    """Import pyarrow with an informative error if it is missing"""
+    try:
+        import pyarrow
+        import pyarrow.parquet  # noqa: F401 (registers pyarrow.parquet)
+    except ImportError as e:
+        raise ImportError(
+            f"{purpose} requires pyarrow (pip install pyarrow)."
+        ) from e
+    return pyarrow
+
+
+def _table_format(path: str) -> str:
+    """'parquet', 'feather' or 'csv' from the file extension"""
+    lower = path.lower()
+    if lower.endswith((".parquet", ".pq")):
+        return "parquet"
+    if lower.endswith((".feather", ".arrow", ".ipc")):
+        return "feather"
+    return "csv"
+
+
+def _table_schema(source, sample_rows: int = 1000,
+                  **read_kwargs) -> pd.DataFrame:
+    """
+    Column names and dtypes of a table source, without reading its data.
+
+    Returns an empty DataFrame for Parquet / Feather files and Arrow
+    tables (from the schema alone), and the first sample_rows rows for
+    CSV files (whose dtypes are inferred).
+    """
+    if isinstance(source, pd.DataFrame):
+        return source
+    if isinstance(source, (str, os.PathLike)):
+        path = os.fspath(source)
+        fmt = _table_format(path)
+        if fmt == "csv":
+            return pd.read_csv(path, nrows=sample_rows, **read_kwargs)
+        pa = _import_pyarrow(f"Reading {fmt.capitalize()} files")
+        if fmt == "parquet":
+            schema = pa.parquet.read_schema(path)
+        else:
+            schema = pa.ipc.open_file(path).schema
+        return schema.empty_table().to_pandas()
+    if hasattr(source, "schema") and hasattr(source, "to_pandas"):
+        return source.schema.empty_table().to_pandas()
+    raise TypeError(
+        f"Error: Unsupported input type {type(source).__name__}; expected "
+        f"a DataFrame, a pyarrow Table or a CSV/Parquet/Feather path."
+    )
+
+
+def _read_table(source, columns=None, **read_kwargs) -> pd.DataFrame:
+    """
+    Reads a table source into a DataFrame, loading only the given columns.
+
+    Args:
+        source: DataFrame, pyarrow Table, or path to a CSV/TSV file
+            (pd.read_csv; pass sep etc. via read_kwargs), a Parquet file
+            (.parquet / .pq) or a Feather/Arrow IPC file (.feather /
+            .arrow / .ipc); the last two require pyarrow
+        columns: Columns to read (None reads all columns)
+    """
+    if isinstance(source, pd.DataFrame):
+        return source if columns is None else source[columns]
+    if isinstance(source, (str, os.PathLike)):
+        path = os.fspath(source)
+        fmt = _table_format(path)
+        if fmt == "csv":
+            return pd.read_csv(path, usecols=columns, **read_kwargs)
+        _import_pyarrow(f"Reading {fmt.capitalize()} files")
+        if fmt == "parquet":
+            return pd.read_parquet(path, columns=columns)
+        return pd.read_feather(path, columns=columns)
+    if hasattr(source, "schema") and hasattr(source, "to_pandas"):
+        if columns is not None:
+            source = source.select(columns)
+        return source.to_pandas()
+    raise TypeError(
+        f"Error: Unsupported input type {type(source).__name__}; expected "
+        f"a DataFrame, a pyarrow Table or a CSV/Parquet/Feather path."
+    )
+
+
+def _write_table(result: pd.DataFrame, path):
+    """
+    Writes a result as Parquet (.parquet / .pq) or CSV (other paths),
+    creating missing parent directories
+    """
+    path = os.fspath(path)
+    fmt = _table_format(path)
+    if fmt == "feather":
+        raise ValueError(
+            "Error: Results can be written as Parquet (.parquet / .pq) "
+            "or CSV."
+        )
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    if fmt == "parquet":
+        _import_pyarrow("Writing Parquet files")
+        result.to_parquet(path, index=False)
+    else:
+        result.to_csv(path, index=False)
+
+
+class _PairCountAccumulator:
+    """
+    Incremental pair and marginal counts for Co-varying analysis.
+
+    Slot values are interned to int32 codes (Vocabulary) as chunks
+    arrive, so the running state is a few int arrays plus one
+    vocabulary per slot instead of string-keyed groupby results.
+    """
+
+    # Merge buffered per-chunk counts once they reach this many entries
+    _MIN_COMPACT = 1 << 20
+
+    def __init__(self):
+        self.vocab1, self.vocab2 = Vocabulary(), Vocabulary()
+        self.slot1_counts = np.zeros(0, dtype=np.int64)
+        self.slot2_counts = np.zeros(0, dtype=np.int64)
+        self.n_rows = 0
+        # Pair keys are (code1 << 32) | code2, kept sorted and unique
+        self._keys = np.zeros(0, dtype=np.int64)
+        self._counts = np.zeros(0, dtype=np.int64)
+        self._pending = []
+        self._pending_size = 0
+
+    @staticmethod
+    def _add_counts(totals, vocab, codes):
+        counts = vocab.counts(codes)
+        counts[:len(totals)] += totals
+        return counts
+
+    def add(self, slot1_values, slot2_values):
+        """Accumulate one chunk of slot-1 / slot-2 values"""
+        self.n_rows += len(slot1_values)
+        code1 = self.vocab1.encode(slot1_values)
+        code2 = self.vocab2.encode(slot2_values)
+
+        self.slot1_counts = self._add_counts(
+            self.slot1_counts, self.vocab1, code1
+        )
+        self.slot2_counts = self._add_counts(
+            self.slot2_counts, self.vocab2, code2
+        )
+
+        both = (code1 >= 0) & (code2 >= 0)
+        keys, counts = np.unique(
+            (code1[both].astype(np.int64) << 32) | code2[both],
+            return_counts=True
+        )
+        self._pending.append((keys, counts))
+        self._pending_size += len(keys)
+        if self._pending_size > max(len(self._keys), self._MIN_COMPACT):
+            self._compact()
+
+    def _compact(self):
+        if not self._pending:
+            return
+        keys = np.concatenate([self._keys] + [k for k, _ in self._pending])
+        counts = np.concatenate(
+            [self._counts] + [c for _, c in self._pending]
+        )
+        self._keys, inverse = np.unique(keys, return_inverse=True)
+        self._counts = np.bincount(
+            inverse, weights=counts
+        ).astype(np.int64)
+        self._pending = []
+        self._pending_size = 0
+
+    def result(self):
+        """
+        Returns (pair_counts, slot1_totals, slot2_totals, vocab1,
+        vocab2, n_rows) as taken by _analyze_pair_counts.
+        """
+        self._compact()
+        # Sorted vocabularies: pairs come out in groupby() order, so
+        # results match the in-memory run
+        vocab1, remap1 = self.vocab1.sorted()
+        vocab2, remap2 = self.vocab2.sorted()
+        code1 = remap1[self._keys >> 32]
+        code2 = remap2[self._keys & 0xFFFFFFFF]
+        order = np.lexsort((code2, code1))
+        pair_counts = (code1[order], code2[order], self._counts[order])
+
+        slot1_totals = np.zeros(len(vocab1), dtype=np.int64)
+        slot1_totals[remap1] = self.slot1_counts
+        slot2_totals = np.zeros(len(vocab2), dtype=np.int64)
+        slot2_totals[remap2] = self.slot2_counts
+        return (pair_counts, slot1_totals, slot2_totals, vocab1, vocab2,
+                self.n_rows)
+
 
 class CovaryingCollexemeAnalyzer(CollexemeAnalyzer):
     """Co-varying Collexeme Analysis implementation"""
@@ -531,39 +2954,209 @@ class CovaryingCollexemeAnalyzer(CollexemeAnalyzer):
         slot2_col: str, 
         total_corpus_size: int = None,
         signed_metrics: bool = False,
-        include_fisher: bool = False
+        include_fisher: bool = True,
+        n_jobs: int = 1,
+        metrics: list = None,
+        top_k: int = None,
+        min_freq: int = None,
+        min_llr: float = None,
+        item_based: bool = False
     ) -> pd.DataFrame:
-        """Execute Co-varying Collexeme Analysis"""
-        pair_counts = (
-            df.groupby([slot1_col, slot2_col])
-            .size()
-            .reset_index(name='a')
-        )
-        slot1_totals = df[slot1_col].value_counts()
-        slot2_totals = df[slot2_col].value_counts()
-        N = total_corpus_size if total_corpus_size else len(df)
-        print(f"  [Co-varying] N={N}, Pairs={len(pair_counts)}")
-
-        def _process_row(row):
-            w1, w2, a = row[slot1_col], row[slot2_col], row['a']
-            freq_w1 = slot1_totals.get(w1, 0)
-            freq_w2 = slot2_totals.get(w2, 0)
-            b = freq_w1 - a
-            c = freq_w2 - a
-            d = N - (a + b + c)
-            return self._apply_metrics(
-                row, a, b, c, d, N, "attraction", "repulsion",
-                signed_metrics=signed_metrics,
-                include_fisher=include_fisher
+        """
+        Execute Co-varying Collexeme Analysis
+
+        Args:
+            top_k: Return only the top_k pairs by LLR
+            min_freq: Drop pairs observed fewer than min_freq times
+            min_llr: Drop pairs with LLR below min_llr
+                (signed LLR if signed_metrics is in effect)
+            item_based: Give each slot-1 item its own contingency frame
+                instead of the global N (see _item_frame_sizes)
+        The returned rows are the same as the leading rows of the
+        unpruned result.
+        """
+        self._check_item_based(item_based, total_corpus_size)
+        with _stage("counting", rows=len(df)):
+            # Each slot is interned once; marginals and pair counts are
+            # then counted on the int32 codes
+            code1, vocab1 = Vocabulary.from_values(df[slot1_col])
+            code2, vocab2 = Vocabulary.from_values(df[slot2_col])
+            slot1_totals = vocab1.counts(code1)
+            slot2_totals = vocab2.counts(code2)
+            both = (code1 >= 0) & (code2 >= 0)
+            pairs = count_code_pairs(
+                code1[both], code2[both], (len(vocab1), len(vocab2))
+            ).tocoo()
+            pair_counts = (
+                pairs.row.astype(Vocabulary.CODE_DTYPE, copy=False),
+                pairs.col.astype(Vocabulary.CODE_DTYPE, copy=False),
+                pairs.data
             )
+        N = total_corpus_size if total_corpus_size else len(df)
+
+        return self._analyze_pair_counts(
+            pair_counts, slot1_totals, slot2_totals, vocab1, vocab2, N,
+            slot1_col, slot2_col,
+            signed_metrics=signed_metrics,
+            include_fisher=include_fisher,
+            n_jobs=n_jobs,
+            metrics=metrics,
+            top_k=top_k,
+            min_freq=min_freq,
+            min_llr=min_llr,
+            item_based=item_based
+        )
+
+    def run_streaming(
+        self,
+        source,
+        slot1_col: str = None,
+        slot2_col: str = None,
+        total_corpus_size: int = None,
+        signed_metrics: bool = False,
+        include_fisher: bool = True,
+        n_jobs: int = 1,
+        metrics: list = None,
+        top_k: int = None,
+        min_freq: int = None,
+        min_llr: float = None,
+        item_based: bool = False,
+        chunksize: int = 1_000_000,
+        **read_kwargs
+    ) -> pd.DataFrame:
+        """
+        Execute Co-varying Collexeme Analysis on token data larger than RAM.
+
+        Pair and marginal counts are accumulated chunk by chunk over
+        integer-coded vocabularies; only the aggregated pair table is
+        materialized before running the metric kernel. Results are the
+        same as run() on the concatenated data.
+
+        Args:
+            source: CSV/Parquet file path, or an iterable of DataFrame
+                chunks (see _iter_table_chunks)
+            slot1_col, slot2_col: Slot columns
+                (first / second column of the data if None)
+            top_k, min_freq, min_llr: Output pruning (see run)
+            item_based: Per-item contingency frames (see run)
+            chunksize: Rows per chunk when reading files
+            read_kwargs: Extra arguments for pd.read_csv (e.g. sep='\\t')
+        """
+        self._check_item_based(item_based, total_corpus_size)
+        columns = (
+            [slot1_col, slot2_col]
+            if slot1_col is not None and slot2_col is not None
+            else None
+        )
+        counter = _PairCountAccumulator()
+        with _stage("counting") as record:
+            for chunk in _iter_table_chunks(
+                source, columns=columns, chunksize=chunksize, **read_kwargs
+            ):
+                if slot1_col is None or slot2_col is None:
+                    slot1_col = slot1_col or chunk.columns[0]
+                    slot2_col = slot2_col or chunk.columns[1]
+                    _log(f"  [Info] Slot columns: Inferred "
+                         f"-> using '{slot1_col}', '{slot2_col}'")
+                counter.add(chunk[slot1_col], chunk[slot2_col])
+
+            (pair_counts, slot1_totals, slot2_totals,
+             vocab1, vocab2, n_rows) = counter.result()
+            record["rows"] = n_rows
+        N = total_corpus_size if total_corpus_size else n_rows
+
+        return self._analyze_pair_counts(
+            pair_counts, slot1_totals, slot2_totals, vocab1, vocab2, N,
+            slot1_col, slot2_col,
+            signed_metrics=signed_metrics,
+            include_fisher=include_fisher,
+            n_jobs=n_jobs,
+            metrics=metrics,
+            top_k=top_k,
+            min_freq=min_freq,
+            min_llr=min_llr,
+            item_based=item_based
+        )
 
-        metrics = pair_counts.apply(_process_row, axis=1)
-        if 'a' in metrics.columns:
-            metrics = metrics.drop(columns=['a'])
+    def _analyze_pair_counts(
+        self, pair_counts, slot1_totals, slot2_totals, vocab1, vocab2, N,
+        slot1_col, slot2_col,
+        signed_metrics: bool = False,
+        include_fisher: bool = True,
+        n_jobs: int = 1,
+        metrics: list = None,
+        top_k: int = None,
+        min_freq: int = None,
+        min_llr: float = None,
+        item_based: bool = False
+    ) -> pd.DataFrame:
+        """
+        Run the metric kernel on aggregated pair / slot counts.
 
-        result = pd.concat([pair_counts, metrics], axis=1)
-        result["FREQOFSLOT1"] = result["a"] + result["b"]
-        result["FREQOFSLOT2"] = result["a"] + result["c"]
+        pair_counts is (code1, code2, a): the slot codes of each pair in
+        vocab1 / vocab2 and its frequency, in (slot 1, slot 2) order.
+        slot1_totals / slot2_totals are frequencies indexed by code.
+        Labels are decoded only for the rows of the result.
+        """
+        code1, code2, a = pair_counts
+        freq_w1 = slot1_totals[code1]
+        freq_w2 = slot2_totals[code2]
+        index = pd.RangeIndex(len(a))
+        if item_based:
+            # Frames come from all pairs, before any pruning
+            N = self._item_frame_sizes(code1, freq_w2)
+            _log(f"  [Co-varying] Item-based frames, Pairs={len(a)}")
+        else:
+            _log(f"  [Co-varying] N={N}, Pairs={len(a)}")
+
+        # Frequency floor: pairs can be dropped before any metric is run
+        if min_freq is not None:
+            keep = a >= min_freq
+            code1, code2, a = code1[keep], code2[keep], a[keep]
+            freq_w1, freq_w2 = freq_w1[keep], freq_w2[keep]
+            index = index[keep]
+            if item_based:
+                N = N[keep]
+
+        b = freq_w1 - a
+        c = freq_w2 - a
+        d = N - (a + b + c)
+
+        # LLR-based pruning: screen with LLR alone, then compute the
+        # requested metrics only for the surviving pairs
+        if top_k is not None or min_llr is not None:
+            if metrics is not None:
+                metrics = list(metrics) + ["LLR"]
+            llr = self._apply_metrics_batch(
+                a, b, c, d, N, "attraction", "repulsion",
+                signed_metrics=signed_metrics,
+                include_fisher=include_fisher,
+                n_jobs=n_jobs,
+                metrics=["LLR"]
+            )["LLR"]
+            keep = self._select_pairs(llr, top_k, min_llr)
+            a, b, c, d = a[keep], b[keep], c[keep], d[keep]
+            code1, code2 = code1[keep], code2[keep]
+            index = index[keep]
+            if item_based:
+                N = N[keep]
+
+        if min_freq is not None or top_k is not None or min_llr is not None:
+            _log(f"  [Co-varying] Pruned to {len(a)} pairs")
+
+        stats = self._apply_metrics_batch(
+            a, b, c, d, N, "attraction", "repulsion",
+            signed_metrics=signed_metrics,
+            include_fisher=include_fisher,
+            n_jobs=n_jobs,
+            metrics=metrics
+        )
+        stats[slot1_col] = vocab1.decode(code1)
+        stats[slot2_col] = vocab2.decode(code2)
+        stats["FREQOFSLOT1"] = a + b
+        stats["FREQOFSLOT2"] = a + c
+        if item_based:
+            stats["FRAMESIZE"] = N
 
         rename_map = {
             "a": "Freq", 
@@ -573,18 +3166,312 @@ class CovaryingCollexemeAnalyzer(CollexemeAnalyzer):
             "KLDC2W": "KLD1TO2", 
             "KLDW2C": "KLD2TO1"
         }
-        result.rename(columns=rename_map, inplace=True)
+        stats = {rename_map.get(k, k): v for k, v in stats.items()}
 
         cols = [
             slot1_col, slot2_col, "Freq", "FREQOFSLOT1", "FREQOFSLOT2", 
-            "RELATION", "LLR", "LOGODDSRATIO", "PMI", "DELTAP1TO2", 
-            "DELTAP2TO1", "KLD1TO2", "KLD2TO1"
+            "FRAMESIZE", "RELATION", "LLR", "LOGODDSRATIO", "PMI", 
+            "DELTAP1TO2", "DELTAP2TO1", "KLD1TO2", "KLD2TO1", "FYE"
         ]
         
-        result_filtered = result[
-            [c for c in cols if c in result.columns]
-        ]
-        return result_filtered.sort_values("LLR", ascending=False)
+        result = self._build_result(stats, cols, index=index)
+        return self._sort_result(
+            result, ["LLR", "FYE", "PMI", "LOGODDSRATIO"]
+        )
+
+    @staticmethod
+    def _check_item_based(item_based: bool, total_corpus_size):
+        if item_based and total_corpus_size:
+            raise ValueError(
+                "Error: item_based uses per-item frames; it cannot be "
+                "combined with total_corpus_size."
+            )
+
+    @staticmethod
+    def _item_frame_sizes(codes, freq_w2) -> np.ndarray:
+        """
+        Per-pair size of the item-based frame of its slot-1 item.
+
+        The frame of a slot-1 item w1 is made of all tokens whose slot-2
+        item is attested with w1, i.e. the sum of FREQOFSLOT2 over the
+        pairs of w1. The 2x2 table of (w1, w2) then compares w2 with the
+        other slot-2 items w1 selects, among the slot-1 items that
+        compete for them (d = frame - a - b - c >= 0).
+        Computed with one sort of the slot-1 codes and np.add.reduceat
+        (no per-item grouping of DataFrames).
+        """
+        codes = np.asarray(codes)
+        if len(codes) == 0:
+            return np.zeros(0, dtype=np.int64)
+        order = np.argsort(codes, kind="stable")
+        sorted_codes = codes[order]
+        starts = np.flatnonzero(
+            np.r_[True, sorted_codes[1:] != sorted_codes[:-1]]
+        )
+        frame = np.add.reduceat(
+            np.asarray(freq_w2, dtype=np.int64)[order], starts
+        )
+        return frame[codes]
+
+    @staticmethod
+    def _select_pairs(llr, top_k=None, min_llr=None) -> np.ndarray:
+        """
+        Positions (ascending) of pairs passing min_llr and, among those,
+        the top_k by LLR via argpartition. Ties at the cut-off are
+        resolved by position, as in the stable sort of the full result.
+        """
+        # NaN sorts last, so it never outranks a finite LLR
+        keys = np.where(np.isnan(llr), -np.inf, llr)
+        positions = np.arange(len(keys))
+        if min_llr is not None:
+            positions = positions[keys >= min_llr]
+
+        if top_k is not None and top_k < len(positions):
+            if top_k <= 0:
+                return positions[:0]
+            sub = keys[positions]
+            part = np.argpartition(-sub, top_k - 1)[:top_k]
+            cutoff = sub[part].min()
+            above = positions[sub > cutoff]
+            ties = positions[sub == cutoff][:top_k - len(above)]
+            positions = np.sort(np.concatenate([above, ties]))
+        return positions
+
+
+class ResultCache:
+    """
+    On-disk cache of analysis results keyed by an input fingerprint.
+
+    The key hashes the input columns (values, dtypes and index) and the
+    options that affect the result. Entries are stored as Parquet when
+    pyarrow is available (pickle otherwise) and evicted least recently
+    used first once the directory exceeds max_bytes.
+    """
+
+    # Bump when result semantics change, to invalidate old entries
+    FORMAT_VERSION = 1
+
+    def __init__(self, cache_dir: str, max_bytes: int = 1 << 30):
+        self.cache_dir = os.fspath(cache_dir)
+        self.max_bytes = max_bytes
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+    def fingerprint(self, data: pd.DataFrame, **options) -> str:
+        """SHA-256 of the input columns plus the result-relevant options"""
+        digest = hashlib.sha256()
+        digest.update(json.dumps(
+            {"version": self.FORMAT_VERSION,
+             "columns": [str(col) for col in data.columns],
+             "dtypes": [str(dtype) for dtype in data.dtypes],
+             "options": options},
+            sort_keys=True, default=str
+        ).encode())
+        digest.update(
+            pd.util.hash_pandas_object(data, index=True).to_numpy().tobytes()
+        )
+        return digest.hexdigest()
+
+    def _entries(self):
+        """(path, size, last use) of every cache file"""
+        entries = []
+        for name in os.listdir(self.cache_dir):
+            if name.endswith((".parquet", ".pkl")):
+                path = os.path.join(self.cache_dir, name)
+                stat = os.stat(path)
+                entries.append((path, stat.st_size, stat.st_mtime))
+        return entries
+
+    def get(self, key: str):
+        """Cached result for key, or None (a hit refreshes its LRU time)"""
+        for ext, reader in ((".parquet", pd.read_parquet),
+                            (".pkl", pd.read_pickle)):
+            path = os.path.join(self.cache_dir, key + ext)
+            if os.path.exists(path):
+                os.utime(path)
+                return reader(path)
+        return None
+
+    def put(self, key: str, result: pd.DataFrame):
+        """Store result under key, then evict down to max_bytes"""
+        base = os.path.join(self.cache_dir, key)
+        tmp = f"{base}.{os.getpid()}.tmp"
+        try:
+            result.to_parquet(tmp)
+            path = base + ".parquet"
+        except (ImportError, ValueError, TypeError):
+            # No pyarrow, or column types Parquet cannot store
+            result.to_pickle(tmp)
+            path = base + ".pkl"
+        os.replace(tmp, path)
+        self.evict()
+
+    def evict(self):
+        """Delete least recently used entries beyond max_bytes"""
+        entries = sorted(self._entries(), key=lambda e: e[2], reverse=True)
+        total = 0
+        for path, size, _ in entries:
+            total += size
+            if total > self.max_bytes:
+                os.remove(path)
+
+    def clear(self):
+        """Delete every cache entry"""
+        for path, _, _ in self._entries():
+            os.remove(path)
+
+
+class RunProfiler:
+    """
+    Per-stage instrumentation of CollostructionalAnalysisMain.run.
+
+    Pass an instance (or just a callback) as run(profiler=...). Each
+    stage of the run (column resolution, input reading, counting, the
+    metric kernel, the Fisher test, result assembly, sorting, ...) adds
+    a record with its wall time, row count and, with track_memory, the
+    tracemalloc peak during the stage. Stages may nest (e.g. "fisher"
+    inside "kernel"); "total" spans the whole run.
+
+    Args:
+        callback: Called with each record dict as its stage finishes
+            (stage, parent, seconds, rows, peak_mb)
+        track_memory: Measure peak memory with tracemalloc (slows
+            allocation-heavy code)
+    """
+
+    def __init__(self, callback=None, track_memory: bool = False):
+        self.callback = callback
+        self.track_memory = track_memory
+        self.records = []
+        self._stack = []
+        self._pid = None
+
+    @contextlib.contextmanager
+    def stage(self, name: str, rows: int = None):
+        """
+        Time the enclosed block as stage name. Yields the record, so
+        rows can be filled in once known (record["rows"] = n).
+        """
+        record = {"stage": name, "parent": self._parent(),
+                  "seconds": None, "rows": rows, "peak_mb": None}
+        tracing = self.track_memory and tracemalloc.is_tracing()
+        if tracing:
+            # Keep the enclosing stage's peak before resetting it
+            if self._stack:
+                self._stack[-1]["_peak"] = max(
+                    self._stack[-1]["_peak"],
+                    tracemalloc.get_traced_memory()[1]
+                )
+            tracemalloc.reset_peak()
+            record["_peak"] = 0
+        self._stack.append(record)
+        t0 = time.perf_counter()
+        try:
+            yield record
+        finally:
+            record["seconds"] = time.perf_counter() - t0
+            self._stack.pop()
+            if tracing:
+                peak = max(record.pop("_peak"),
+                           tracemalloc.get_traced_memory()[1])
+                record["peak_mb"] = peak / 2**20
+                if self._stack:
+                    self._stack[-1]["_peak"] = max(
+                        self._stack[-1]["_peak"], peak
+                    )
+            self._emit(record)
+
+    def add(self, name: str, seconds: float, rows: int = None):
+        """Record a stage timed by the caller"""
+        self._emit({"stage": name, "parent": self._parent(),
+                    "seconds": seconds, "rows": rows, "peak_mb": None})
+
+    def _parent(self):
+        return self._stack[-1]["stage"] if self._stack else None
+
+    def _emit(self, record: dict):
+        self.records.append(record)
+        if self.callback is not None:
+            self.callback(record)
+
+    def report(self) -> pd.DataFrame:
+        """One row per recorded stage, in completion order"""
+        return pd.DataFrame(
+            self.records,
+            columns=["stage", "parent", "seconds", "rows", "peak_mb"]
+        )
+
+    def summary(self) -> pd.DataFrame:
+        """Stages aggregated by name, slowest first"""
+        report = self.report()
+        if report.empty:
+            return report
+        return report.groupby("stage", sort=False).agg(
+            calls=("seconds", "size"),
+            seconds=("seconds", "sum"),
+            rows=("rows", "max"),
+            peak_mb=("peak_mb", "max")
+        ).sort_values("seconds", ascending=False)
+
+    @contextlib.contextmanager
+    def session(self):
+        """Activate the profiler for one run (in the current context)"""
+        self._pid = os.getpid()
+        started = self.track_memory and not tracemalloc.is_tracing()
+        if started:
+            tracemalloc.start()
+        token = _ACTIVE_PROFILER.set(self)
+        try:
+            yield self
+        finally:
+            _ACTIVE_PROFILER.reset(token)
+            if started:
+                tracemalloc.stop()
+
+
+# Profiler of the run in progress (set by RunProfiler.session);
+# context-local like _VERBOSE, so concurrent runs in other threads are
+# not recorded. Stages of worker processes are not recorded either.
+_ACTIVE_PROFILER = contextvars.ContextVar("collostructional_profiler",
+                                          default=None)
+
+
+def _active_profiler():
+    """RunProfiler of the run in progress in this context, or None"""
+    profiler = _ACTIVE_PROFILER.get()
+    if profiler is None or profiler._pid != os.getpid():
+        return None
+    return profiler
+
+
+def _stage(name: str, rows: int = None):
+    """Stage of the active RunProfiler (no-op when not profiling)"""
+    profiler = _active_profiler()
+    if profiler is None:
+        return contextlib.nullcontext({})
+    return profiler.stage(name, rows)
+
+
+# Progress output switch (run(verbose=...)); context-local, so other
+# threads and the caller's own prints are never affected
+_VERBOSE = contextvars.ContextVar("collostructional_verbose", default=True)
+
+
+def _log(*args, **kwargs):
+    """print() for progress messages, unless silenced by _verbosity"""
+    if _VERBOSE.get():
+        print(*args, **kwargs)
+
+
+@contextlib.contextmanager
+def _verbosity(verbose: bool):
+    """Enable / silence the progress messages of the enclosed block"""
+    # Nested blocks can only silence: verbose=True keeps an outer
+    # verbose=False in effect
+    token = _VERBOSE.set(verbose and _VERBOSE.get())
+    try:
+        yield
+    finally:
+        _VERBOSE.reset(token)
 
 
 class CollostructionalAnalysisMain:
@@ -592,7 +3479,7 @@ class CollostructionalAnalysisMain:
     
     @staticmethod
     def run(
-        df: pd.DataFrame,
+        df,
         analysis_type: int,
         # Column specifications
         word_col: str = None,
@@ -604,16 +3491,58 @@ class CollostructionalAnalysisMain:
         slot2_col: str = None,
         # Options
         total_corpus_size: int = None,
-        signed_metrics: bool = False
+        signed_metrics: bool = False,
+        n_jobs: int = 1,
+        metrics: list = None,
+        top_k: int = None,
+        min_freq: int = None,
+        min_llr: float = None,
+        cache_dir: str = None,
+        cache_max_bytes: int = 1 << 30,
+        p_adjust: list = None,
+        output_path: str = None,
+        read_kwargs: dict = None,
+        dca_mode: str = None,
+        item_based: bool = False,
+        profiler=None,
+        verbose: bool = True
     ) -> pd.DataFrame:
         """
         Main entry point for Collostructional Analysis
         
         Args:
-            df: Target DataFrame for analysis
+            df: Target DataFrame for analysis, a pyarrow Table, or a path
+                to a CSV/TSV, Parquet or Feather file. Only the columns
+                the analysis uses are read (column projection)
             analysis_type: Analysis type (1: Simple, 2: Distinctive, 
                           3: Co-varying)
             Other parameters: Column specifications per analysis type
+            n_jobs: Worker processes for the metric kernel 
+                    (1: serial, -1: all cores)
+            metrics: Association measures to compute, e.g. ["PMI", "LLR"]
+                     (None: all; ignored by multiple DCA)
+            top_k, min_freq, min_llr: Co-varying only. Keep the top_k 
+                     pairs by LLR / pairs with Freq >= min_freq / 
+                     LLR >= min_llr
+            cache_dir: Opt-in result cache directory (see ResultCache);
+                     identical inputs and options return the stored result
+            cache_max_bytes: Cache size limit (LRU eviction)
+            p_adjust: Multiple testing corrections to add, e.g. 
+                     ["holm", "BH", "BY"] (see adjust_p_values)
+            output_path: Also write the result to this file (Parquet for
+                     .parquet / .pq, CSV otherwise)
+            read_kwargs: Extra arguments for pd.read_csv when df is a
+                     CSV path (e.g. {"sep": "\\t"})
+            dca_mode: Distinctive only. "one_vs_rest" / "pairwise" for
+                     full 2x2 metrics per construction pair in long 
+                     format, "multiple" for Pearson-residual multiple DCA
+                     (None: two-way DCA for 2 constructions, else multiple)
+            item_based: Co-varying only. Item-based analysis with one
+                     contingency frame per slot-1 item instead of the 
+                     global N
+            profiler: RunProfiler (or a callback receiving its records)
+                     for per-stage timings, row counts and peak memory
+            verbose: False silences the progress prints
             
         Returns:
             DataFrame containing analysis results
@@ -667,93 +3596,245 @@ class CollostructionalAnalysisMain:
 
             # 4. Log output (inform user of inference)
             if method.startswith("Inferred"):
-                print(f"  [Info] {description}: {method} "
-                      f"-> using column '{selected_col}'")
+                _log(f"  [Info] {description}: {method} "
+                     f"-> using column '{selected_col}'")
 
             return selected_col
 
-        print(f"\n>> CollostructionalAnalysisMain: Running Type "
-              f"{analysis_type}")
-
-        # Analysis Type 1: Simple
-        if analysis_type == 1:
-            # Word column accepts strings, Freq columns require numeric
-            w_col = _resolve_col(word_col, 0, "Word Column")
-            c_corp = _resolve_col(
-                freq_corpus_col, 1, "Freq in Corpus", expect_numeric=True
-            )
-            c_const = _resolve_col(
-                freq_const_col, 2, "Freq in Construction", 
-                expect_numeric=True
+        if p_adjust and any(
+            opt is not None for opt in (top_k, min_freq, min_llr)
+        ):
+            raise ValueError(
+                "Error: p_adjust needs every test; it cannot be combined "
+                "with top_k / min_freq / min_llr pruning."
             )
+        if profiler is not None and not isinstance(profiler, RunProfiler):
+            profiler = RunProfiler(callback=profiler)
+        session = (profiler.session() if profiler is not None
+                   else contextlib.nullcontext())
+
+        with _verbosity(verbose), session, _stage("total") as total:
+            t_resolve = time.perf_counter()
+            # Files / Arrow tables: resolve columns on the schema first,
+            # then read only the columns the analysis uses
+            source = df
+            read_kwargs = read_kwargs or {}
+            if not isinstance(source, pd.DataFrame):
+                df = _table_schema(source, **read_kwargs)
+            if (output_path is not None
+                    and _table_format(os.fspath(output_path)) == "parquet"):
+                # Fail before the analysis rather than after it
+                _import_pyarrow("Writing Parquet files")
+
+            _log(f"\n>> CollostructionalAnalysisMain: Running Type "
+                 f"{analysis_type}")
+
+            # Analysis Type 1: Simple
+            if analysis_type == 1:
+                # Word column accepts strings, Freq columns require numeric
+                w_col = _resolve_col(word_col, 0, "Word Column")
+                c_corp = _resolve_col(
+                    freq_corpus_col, 1, "Freq in Corpus", expect_numeric=True
+                )
+                c_const = _resolve_col(
+                    freq_const_col, 2, "Freq in Construction", 
+                    expect_numeric=True
+                )
 
-            analyzer = SimpleCollexemeAnalyzer()
-            print("a: Freq in the Construction")
-            print("c: Freq not in the Construction")
-            
-            return analyzer.run(
-                df,
-                word_col=w_col,
-                freq_corpus_col=c_corp,
-                freq_const_col=c_const,
-                total_corpus_size=total_corpus_size,
-                signed_metrics=signed_metrics
-            )
+                analyzer = SimpleCollexemeAnalyzer()
+                _log("a: Freq in the Construction")
+                _log("c: Freq not in the Construction")
+
+                used_cols = [w_col, c_corp, c_const]
+
+                def analyze(data):
+                    return analyzer.run(
+                        data,
+                        word_col=w_col,
+                        freq_corpus_col=c_corp,
+                        freq_const_col=c_const,
+                        total_corpus_size=total_corpus_size,
+                        signed_metrics=signed_metrics,
+                        n_jobs=n_jobs,
+                        metrics=metrics
+                    )
 
-        # Analysis Type 2: Distinctive
-        elif analysis_type == 2:
-            analyzer = DistinctiveCollexemeAnalyzer()
+            # Analysis Type 2: Distinctive
+            elif analysis_type == 2:
+                analyzer = DistinctiveCollexemeAnalyzer()
 
-            # Mode determination
-            is_raw = False
-            if construction_col:
-                is_raw = True
-            elif count_cols is None:
-                # Heuristic: treat as raw if few numeric columns
-                if len(df.select_dtypes(include=[np.number]).columns) == 0:
+                # Mode determination
+                is_raw = False
+                if construction_col:
                     is_raw = True
+                elif count_cols is None:
+                    # Heuristic: treat as raw if few numeric columns
+                    if len(df.select_dtypes(include=[np.number]).columns) == 0:
+                        is_raw = True
+
+                target_word = _resolve_col(word_col, 0, "Word Column")
+
+                if is_raw:
+                    _log("  [Mode] Raw Token List detected.")
+                    # In raw mode, 2nd column should be Construction category
+                    target_const = _resolve_col(
+                        construction_col, 1, "Construction Category Column"
+                    )
 
-            target_word = _resolve_col(word_col, 0, "Word Column")
+                    used_cols = [target_word, target_const]
+
+                    def analyze(data):
+                        return analyzer.run(
+                            data, 
+                            word_col=target_word,
+                            construction_col=target_const,
+                            total_corpus_size=total_corpus_size,
+                            signed_metrics=signed_metrics,
+                            n_jobs=n_jobs,
+                            metrics=metrics,
+                            mode=dca_mode
+                        )
+                else:
+                    _log("  [Mode] Frequency Table detected.")
+                    # Count columns may be auto-detected: then use them all
+                    used_cols = (
+                        list(df.columns) if count_cols is None
+                        else [target_word, *count_cols]
+                    )
 
-            if is_raw:
-                print("  [Mode] Raw Token List detected.")
-                # In raw mode, 2nd column should be Construction category
-                target_const = _resolve_col(
-                    construction_col, 1, "Construction Category Column"
-                )
+                    def analyze(data):
+                        return analyzer.run(
+                            data, 
+                            word_col=target_word,
+                            # If count_cols is None, Analyzer will auto-detect 
+                            # numeric columns
+                            count_cols=count_cols,
+                            total_corpus_size=total_corpus_size,
+                            n_jobs=n_jobs,
+                            metrics=metrics,
+                            mode=dca_mode
+                        )
+
+            # Analysis Type 3: Co-varying
+            elif analysis_type == 3:
+                s1 = _resolve_col(slot1_col, 0, "Slot 1 Column")
+                s2 = _resolve_col(slot2_col, 1, "Slot 2 Column")
+
+                analyzer = CovaryingCollexemeAnalyzer()
+                used_cols = [s1, s2]
+
+                def analyze(data):
+                    return analyzer.run(
+                        data,
+                        slot1_col=s1,
+                        slot2_col=s2,
+                        total_corpus_size=total_corpus_size,
+                        signed_metrics=signed_metrics,
+                        n_jobs=n_jobs,
+                        metrics=metrics,
+                        top_k=top_k,
+                        min_freq=min_freq,
+                        min_llr=min_llr,
+                        item_based=item_based
+                    )
 
-                return analyzer.run(
-                    df, 
-                    word_col=target_word,
-                    construction_col=target_const,
-                    total_corpus_size=total_corpus_size,
-                    signed_metrics=signed_metrics
-                )
             else:
-                print("  [Mode] Frequency Table detected.")
-                return analyzer.run(
-                    df, 
-                    word_col=target_word,
-                    # If count_cols is None, Analyzer will auto-detect 
-                    # numeric columns
-                    count_cols=count_cols,
-                    total_corpus_size=total_corpus_size
+                raise ValueError(f"Invalid Analysis Type: {analysis_type}")
+
+            if profiler is not None:
+                profiler.add("resolve_columns",
+                             time.perf_counter() - t_resolve)
+            if df is not source:
+                df = CollostructionalAnalysisMain._read_input(
+                    source, used_cols, read_kwargs
                 )
-
-        # Analysis Type 3: Co-varying
-        elif analysis_type == 3:
-            s1 = _resolve_col(slot1_col, 0, "Slot 1 Column")
-            s2 = _resolve_col(slot2_col, 1, "Slot 2 Column")
-
-            analyzer = CovaryingCollexemeAnalyzer()
-            return analyzer.run(
-                df,
-                slot1_col=s1,
-                slot2_col=s2,
+            result = CollostructionalAnalysisMain._run_with_cache(
+                analyze, df[used_cols] if cache_dir else df, cache_dir,
+                cache_max_bytes,
+                analysis_type=analysis_type,
+                count_cols=count_cols,
                 total_corpus_size=total_corpus_size,
-                signed_metrics=signed_metrics
+                signed_metrics=signed_metrics,
+                metrics=metrics,
+                dca_mode=dca_mode,
+                item_based=item_based,
+                top_k=top_k,
+                min_freq=min_freq,
+                min_llr=min_llr,
+                # Kernel settings (backend, Fisher precision) change the
+                # numbers too
+                **AssociationStatsKernel.settings()
             )
+            if p_adjust:
+                with _stage("p_adjust", rows=len(result)):
+                    result = CollostructionalAnalysisMain.adjust_p_values(
+                        result, methods=p_adjust
+                    )
+            if output_path is not None:
+                with _stage("write_output", rows=len(result)):
+                    _write_table(result, output_path)
+                _log(f"  [Output] Saved to {os.fspath(output_path)}")
+            total["rows"] = len(result)
+        return result
 
-        else:
-            raise ValueError(f"Invalid Analysis Type: {analysis_type}")
+    @classmethod
+    def _read_input(cls, source, used_cols: list, read_kwargs: dict):
+        """Read only the used columns of a file / Arrow table input"""
+        with _stage("read_input") as record:
+            df = _read_table(source, columns=used_cols, **read_kwargs)
+            record["rows"] = len(df)
+        _log(f"  [Input] Read {len(df):,} rows, columns {used_cols}")
+        return df
 
+    @classmethod
+    def _run_with_cache(cls, analyze, df: pd.DataFrame, cache_dir,
+                        cache_max_bytes: int, **options) -> pd.DataFrame:
+        """
+        analyze(df), or its stored result when cache_dir holds one for
+        the same input columns and options (see ResultCache)
+        """
+        if cache_dir is None:
+            return analyze(df)
+        cache = ResultCache(cache_dir, max_bytes=cache_max_bytes)
+        with _stage("cache_lookup", rows=len(df)):
+            key = cache.fingerprint(df, **options)
+            cached = cache.get(key)
+        if cached is not None:
+            _log(f"  [Cache] Hit {key[:12]}")
+            return cached
+        result = analyze(df)
+        with _stage("cache_store", rows=len(result)):
+            cache.put(key, result)
+        _log(f"  [Cache] Stored {key[:12]}")
+        return result
+
+    @staticmethod
+    def adjust_p_values(
+        result: pd.DataFrame,
+        methods=("holm", "BH", "BY"),
+        fye_col: str = "FYE"
+    ) -> pd.DataFrame:
+        """
+        Add multiple-testing adjusted Fisher p-values to analyzer output.
+
+        The p-values are taken from FYE (-log10 p), so the correction
+        runs in log space (see AssociationStatsKernel.adjust_log10_p).
+        Adds one column per method, e.g. FYE_HOLM, FYE_BH, FYE_BY, on the
+        FYE scale (-log10 adjusted p; negative for repulsion if FYE is
+        signed). Significant at 5% means FYE_BH > -log10(0.05) = 1.30.
+        """
+        if fye_col not in result.columns:
+            raise ValueError(
+                f"Error: p_adjust requires the '{fye_col}' column "
+                f"(Fisher test results)."
+            )
+        fye = result[fye_col].to_numpy(dtype=float)
+        adjusted = AssociationStatsKernel.adjust_log10_p(
+            -np.abs(fye), methods=methods
+        )
+        result = result.copy()
+        # Keep the sign convention of signed FYE
+        sign = np.where(fye < 0, -1.0, 1.0)
+        for method, log10_adj in adjusted.items():
+            result[f"{fye_col}_{method.upper()}"] = -log10_adj * sign + 0.0
+        return result
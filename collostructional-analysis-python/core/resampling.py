@@ -0,0 +1,269 @@
+"""
+Resampling-based inference for the association measures
+
+Bootstrap confidence intervals and permutation tests for contingency
+table metrics (LLR, Delta P, PMI, ...), complementing the Wald CI of
+the log odds ratio. Replicates for many tables are drawn at once with
+NumPy's vectorized multinomial / hypergeometric samplers and evaluated
+with AssociationStatsKernel.calculate_all_metrics_batch, chunk by chunk
+to bound memory. Chunks can be spread over worker processes; results
+depend only on the seed, not on n_jobs.
+
+Usage:
+    from core.resampling import bootstrap_ci, permutation_test
+
+    ci = bootstrap_ci(a, b, c, d, metrics=["LLR", "DELTAP", "PMI"],
+                      n_boot=2000, seed=1)
+"""
+
+import warnings
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+try:
+    # 1. repository structure with package
+    from core.collostructional_analysis import (
+        AssociationStatsKernel, _resolve_n_jobs
+    )
+except ImportError:
+    # 2. Loading in Colab or flat structure (when files are in the same location)
+    from collostructional_analysis import (
+        AssociationStatsKernel, _resolve_n_jobs
+    )
+
+
+# Replicate tables evaluated per kernel call (bounds peak memory)
+_MAX_REPLICATES_PER_CHUNK = 1 << 21
+
+
+def _metric_columns(metrics) -> list:
+    """Kernel output columns for a metric selection (DELTAP/KLD expand)"""
+    if isinstance(metrics, str):
+        metrics = [metrics]
+    if "FYE" in AssociationStatsKernel.resolve_metrics(metrics):
+        raise ValueError(
+            "Error: Fisher p-values / FYE cannot be resampled; "
+            "choose from LLR, PMI, DELTAP, KLD, LOGODDSRATIO, PEARSONRESID."
+        )
+    lookup = {group: list(cols) for group, cols
+              in AssociationStatsKernel.METRIC_GROUPS.items()}
+    for cols in AssociationStatsKernel.METRIC_GROUPS.values():
+        lookup.update({col.upper(): [col] for col in cols})
+    # Co-varying output names
+    lookup.update({"DELTAP1TO2": ["DELTAPC2W"], "DELTAP2TO1": ["DELTAPW2C"],
+                   "KLD1TO2": ["KLDC2W"], "KLD2TO1": ["KLDW2C"]})
+
+    columns = []
+    for name in metrics:
+        for col in lookup[str(name).upper()]:
+            if col not in columns:
+                columns.append(col)
+    return columns
+
+
+def _evaluate(cells, total_corpus_size, columns, signed_metrics) -> dict:
+    """Metric arrays for replicate tables (cells: (..., 4) int array)"""
+    shape = cells.shape[:-1]
+    flat = cells.reshape(-1, 4)
+    stats = AssociationStatsKernel.calculate_all_metrics_batch(
+        flat[:, 0], flat[:, 1], flat[:, 2], flat[:, 3],
+        total_corpus_size=total_corpus_size,
+        signed_metrics=signed_metrics,
+        metrics=columns
+    )
+    return {col: np.asarray(stats[col], dtype=float).reshape(shape)
+            for col in columns}
+
+
+def _chunks(n_tables: int, n_reps: int):
+    """Table ranges so that each chunk holds a bounded number of replicates"""
+    if n_tables == 0:
+        # One empty chunk: the worker still returns every (empty) column
+        return [(0, 0)]
+    per_chunk = max(1, _MAX_REPLICATES_PER_CHUNK // max(n_reps, 1))
+    starts = range(0, n_tables, per_chunk)
+    return [(start, min(start + per_chunk, n_tables)) for start in starts]
+
+
+def _bootstrap_chunk(cells, n_boot, seed, total_corpus_size, columns,
+                     signed_metrics, lower_q, upper_q) -> dict:
+    """CI bounds for one chunk of tables (cells: (n, 4))"""
+    rng = np.random.default_rng(seed)
+    n = cells.sum(axis=1)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        pvals = np.where(n[:, None] > 0, cells / n[:, None], 0.25)
+    # (n_boot, n_tables, 4): every replicate of every table at once
+    replicates = rng.multinomial(n, pvals, size=(n_boot, len(n)))
+    values = _evaluate(
+        replicates.transpose(1, 0, 2), total_corpus_size, columns,
+        signed_metrics
+    )
+
+    bounds = {}
+    with np.errstate(invalid='ignore'), warnings.catch_warnings():
+        # Empty tables have all-NaN replicates -> NaN bounds
+        warnings.simplefilter("ignore", RuntimeWarning)
+        for col, reps in values.items():
+            # No interpolation: bounds stay exact replicate values
+            # (infinite PMI / log odds included)
+            bounds[f"{col}_CI_Lower"] = np.nanquantile(
+                reps, lower_q, axis=1, method="lower"
+            )
+            bounds[f"{col}_CI_Upper"] = np.nanquantile(
+                reps, upper_q, axis=1, method="higher"
+            )
+    return bounds
+
+
+def _permutation_chunk(cells, n_perm, seed, total_corpus_size, columns,
+                       signed_metrics) -> dict:
+    """Permutation p-values for one chunk of tables (cells: (n, 4))"""
+    rng = np.random.default_rng(seed)
+    a, b, c, d = cells.T
+    row1, col1 = a + b, a + c
+    n = cells.sum(axis=1)
+    # Fixed margins: a ~ Hypergeometric(good=col1, bad=n-col1, draws=row1)
+    a_perm = rng.hypergeometric(col1, n - col1, row1,
+                                size=(n_perm, len(n))).T
+    b_perm = row1[:, None] - a_perm
+    c_perm = col1[:, None] - a_perm
+    d_perm = n[:, None] - a_perm - b_perm - c_perm
+    null = _evaluate(
+        np.stack([a_perm, b_perm, c_perm, d_perm], axis=-1),
+        total_corpus_size, columns, signed_metrics
+    )
+    observed = _evaluate(cells, total_corpus_size, columns, signed_metrics)
+
+    p_values = {}
+    with np.errstate(invalid='ignore'):
+        for col in columns:
+            # Replicates at least as extreme in the observed direction
+            # (tolerance for ties lost to rounding; infinite observed
+            # values, e.g. PMI / log odds of zero-cell tables, are
+            # compared exactly)
+            obs = observed[col][:, None]
+            tol = np.where(np.isfinite(obs), 1e-12 * np.abs(obs), 0.0)
+            extreme = np.where(
+                obs >= 0, null[col] >= obs - tol, null[col] <= obs + tol
+            )
+            p_values[f"{col}_perm_p"] = (
+                (1 + extreme.sum(axis=1)) / (n_perm + 1)
+            )
+    return p_values
+
+
+def _run_chunks(worker, cells, n_reps, seed, n_jobs, args) -> dict:
+    """Apply worker to table chunks (optionally in a process pool)"""
+    bounds = _chunks(len(cells), n_reps)
+    # One independent stream per chunk, fixed by the seed alone
+    seeds = np.random.SeedSequence(seed).spawn(len(bounds))
+    tasks = [(cells[start:stop], n_reps, chunk_seed) + args
+             for (start, stop), chunk_seed in zip(bounds, seeds)]
+
+    n_jobs = _resolve_n_jobs(n_jobs)
+    if n_jobs > 1 and len(tasks) > 1:
+        with ProcessPoolExecutor(max_workers=n_jobs) as pool:
+            parts = list(pool.map(worker, *zip(*tasks)))
+    else:
+        parts = [worker(*task) for task in tasks]
+
+    return {key: np.concatenate([part[key] for part in parts])
+            for key in parts[0]}
+
+
+def _as_cells(a, b, c, d) -> np.ndarray:
+    cells = np.stack(
+        np.broadcast_arrays(*(np.asarray(x) for x in (a, b, c, d))), axis=1
+    )
+    if not np.issubdtype(cells.dtype, np.integer):
+        if not np.all(np.isfinite(cells)) or np.any(cells != np.round(cells)):
+            raise ValueError("Error: Cell values must be integer counts.")
+        cells = cells.astype(np.int64)
+    if np.any(cells < 0):
+        raise ValueError("Error: Cell values must be non-negative.")
+    return cells
+
+
+def bootstrap_ci(
+    a, b, c, d,
+    metrics=("LLR", "DELTAP", "PMI"),
+    n_boot: int = 2000,
+    ci: float = 0.95,
+    seed=None,
+    total_corpus_size: int = None,
+    signed_metrics: bool = False,
+    n_jobs: int = 1,
+    index=None
+) -> pd.DataFrame:
+    """
+    Percentile bootstrap confidence intervals for association measures.
+
+    Each table is resampled as a multinomial draw of its total with the
+    observed cell proportions; the metrics of n_boot replicates give
+    the CI bounds (nearest replicate values, no interpolation).
+
+    Args:
+        a, b, c, d: Array-likes of contingency table cell counts
+        metrics: Metric groups or output columns (see
+            AssociationStatsKernel.resolve_metrics); FYE is not supported
+        n_boot: Replicates per table
+        ci: Confidence level
+        seed: Seed for np.random.SeedSequence (reproducible results)
+        total_corpus_size: Passed to the kernel (None: a+b+c+d per table)
+        signed_metrics: Signed LLR, as in the analyzers
+        n_jobs: Worker processes (1: serial, -1: all cores)
+        index: Index of the returned frame
+    Returns:
+        DataFrame with the observed metric and <metric>_CI_Lower /
+        <metric>_CI_Upper columns
+    """
+    columns = _metric_columns(metrics)
+    cells = _as_cells(a, b, c, d)
+    alpha = (1 - ci) / 2
+
+    observed = _evaluate(cells, total_corpus_size, columns, signed_metrics)
+    bounds = _run_chunks(
+        _bootstrap_chunk, cells, n_boot, seed, n_jobs,
+        (total_corpus_size, columns, signed_metrics, alpha, 1 - alpha)
+    )
+
+    result = {}
+    for col in columns:
+        result[col] = observed[col]
+        result[f"{col}_CI_Lower"] = bounds[f"{col}_CI_Lower"]
+        result[f"{col}_CI_Upper"] = bounds[f"{col}_CI_Upper"]
+    return pd.DataFrame(result, index=index)
+
+
+def permutation_test(
+    a, b, c, d,
+    metrics=("LLR", "DELTAP", "PMI"),
+    n_perm: int = 2000,
+    seed=None,
+    total_corpus_size: int = None,
+    signed_metrics: bool = False,
+    n_jobs: int = 1,
+    index=None
+) -> pd.DataFrame:
+    """
+    Permutation p-values for association measures.
+
+    Under independence with fixed margins, cell a follows a
+    hypergeometric distribution; n_perm tables are drawn per row and
+    p = (1 + #{null at least as extreme}) / (n_perm + 1), where extreme
+    means >= observed for observed >= 0 (attraction; unsigned LLR)
+    and <= observed otherwise.
+
+    Args: see bootstrap_ci
+    Returns:
+        DataFrame with <metric>_perm_p columns
+    """
+    columns = _metric_columns(metrics)
+    cells = _as_cells(a, b, c, d)
+    p_values = _run_chunks(
+        _permutation_chunk, cells, n_perm, seed, n_jobs,
+        (total_corpus_size, columns, signed_metrics)
+    )
+    return pd.DataFrame(p_values, index=index)
@@ -0,0 +1,13 @@
+"""
+pytest configuration
+
+test_for_v4.1.py is a standalone validation script that needs Gries's
+sample files (see its docstring); run it directly with python.
+"""
+
+import sys
+import os
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+collect_ignore = ["test_for_v4.1.py"]
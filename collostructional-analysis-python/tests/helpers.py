@@ -0,0 +1,35 @@
+"""Synthetic inputs shared by the analyzer tests"""
+
+import numpy as np
+import pandas as pd
+
+
+def simple_df(n=300, seed=0):
+    """Simple collexeme frequency table (some perfect / zero attraction)"""
+    rng = np.random.default_rng(seed)
+    corp = (rng.zipf(1.6, n) * 3).clip(1, 50000)
+    const = np.minimum(corp, rng.binomial(corp, rng.uniform(0.0, 0.6, n)))
+    const[:5] = corp[:5]
+    const[5:10] = 0
+    return pd.DataFrame({"WORD": [f"w{i}" for i in range(n)],
+                         "FREQ_WORD_in_CORPUS": corp,
+                         "FREQ_WORD_in_CONSTRUCTION": const})
+
+
+def raw_tokens(n=5000, consts=("ditr", "prep"), seed=1):
+    """Distinctive raw token list (Verb, Construction)"""
+    rng = np.random.default_rng(seed)
+    words = rng.zipf(1.5, n) % 300
+    labels = rng.integers(0, len(consts), n)
+    labels[words % 7 == 0] = 0
+    return pd.DataFrame({"Verb": [f"v{w}" for w in words],
+                         "Construction": np.array(consts)[labels]})
+
+
+def slot_tokens(n=6000, seed=3):
+    """Co-varying token list (WORD_SLOT1, WORD_SLOT2)"""
+    rng = np.random.default_rng(seed)
+    s1 = rng.zipf(1.4, n) % 150
+    s2 = (s1 * 3 + rng.zipf(1.6, n)) % 200
+    return pd.DataFrame({"WORD_SLOT1": [f"x{x}" for x in s1],
+                         "WORD_SLOT2": [f"y{y}" for y in s2]})
@@ -0,0 +1,49 @@
+"""Tests for core.batch_runner"""
+
+import json
+
+import pandas as pd
+
+from core.batch_runner import load_manifest, main, run_job, run_jobs
+from tests.helpers import raw_tokens, simple_df
+
+
+def test_run_job_creates_output_directory(tmp_path):
+    source = tmp_path / "simple.csv"
+    simple_df().to_csv(source, index=False)
+    output = tmp_path / "out" / "x.csv"
+
+    entry = run_job({"name": "simple", "input": str(source),
+                     "analysis_type": 1, "output": str(output)},
+                    memory=False)
+    assert entry["status"] == "ok", entry["error"]
+    assert pd.read_csv(output).shape[0] == entry["output_rows"]
+
+
+def test_manifest_jobs_and_report(tmp_path):
+    raw_tokens().to_csv(tmp_path / "tokens.csv", index=False)
+    manifest = tmp_path / "jobs.json"
+    manifest.write_text(json.dumps({
+        "defaults": {"signed_metrics": True},
+        "jobs": [
+            {"name": "dca", "input": "tokens.csv", "analysis_type": 2,
+             "construction_col": "Construction",
+             "output": "out/dca.csv"},
+            {"name": "missing", "input": "missing.csv",
+             "analysis_type": 1},
+        ]
+    }))
+
+    jobs = load_manifest(str(manifest))
+    assert jobs[0]["output"] == str(tmp_path / "out" / "dca.csv")
+    entries = run_jobs(jobs)
+    assert [e["status"] for e in entries] == ["ok", "error"]
+    assert entries[0]["peak_mb"] > 0
+    assert "missing.csv" in entries[1]["error"]
+
+    report = tmp_path / "report.json"
+    assert main([str(manifest), "--no-memory", "--report",
+                 str(report)]) == 1
+    written = json.loads(report.read_text())["jobs"]
+    assert [e["name"] for e in written] == ["dca", "missing"]
+    assert (tmp_path / "out" / "dca.csv").exists()
@@ -0,0 +1,59 @@
+"""Tests for the opt-in result cache of CollostructionalAnalysisMain.run"""
+
+import os
+
+import pandas as pd
+import pytest
+
+from core.collostructional_analysis import (
+    AssociationStatsKernel,
+    CollostructionalAnalysisMain,
+)
+from tests.helpers import simple_df
+
+
+def _entries(cache_dir):
+    return sorted(name for name in os.listdir(cache_dir)
+                  if name.endswith((".parquet", ".pkl")))
+
+
+def _run(df, cache_dir, **kw):
+    return CollostructionalAnalysisMain.run(
+        df, analysis_type=1, cache_dir=cache_dir, verbose=False, **kw
+    )
+
+
+def test_cache_hit_returns_stored_result(tmp_path):
+    df = simple_df()
+    first = _run(df, tmp_path)
+    assert len(_entries(tmp_path)) == 1
+    second = _run(df, tmp_path)
+    assert len(_entries(tmp_path)) == 1
+    pd.testing.assert_frame_equal(second, first)
+
+    # A different option is a different entry
+    _run(df, tmp_path, signed_metrics=True)
+    assert len(_entries(tmp_path)) == 2
+
+
+def _numpy_as_numba(cls, a, b, c, d, N, exp_a, groups):
+    return cls.calc_llr_pmi_kld_batch(a, b, c, d, N, exp_a, groups,
+                                      backend="numpy")
+
+
+@pytest.mark.parametrize("setting, value", [
+    ("fused_backend", "numba"),
+    ("fisher_precision", "precise"),
+    ("fisher_dps", 80),
+    ("FISHER_EXACT_MAX_N", 1000),
+])
+def test_kernel_settings_are_part_of_the_key(tmp_path, monkeypatch,
+                                             setting, value):
+    df = simple_df()
+    _run(df, tmp_path)
+    # numba may not be installed: only the key matters here
+    monkeypatch.setattr(AssociationStatsKernel, "_llr_pmi_kld_numba",
+                        classmethod(_numpy_as_numba))
+    monkeypatch.setattr(AssociationStatsKernel, setting, value)
+    _run(df, tmp_path)
+    assert len(_entries(tmp_path)) == 2
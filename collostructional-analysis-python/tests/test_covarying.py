@@ -0,0 +1,110 @@
+"""Tests for CovaryingCollexemeAnalyzer (streaming, pruning, item-based)"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from core.collostructional_analysis import (
+    AssociationStatsKernel,
+    CovaryingCollexemeAnalyzer,
+)
+from tests.helpers import slot_tokens
+
+KEYS = ["WORD_SLOT1", "WORD_SLOT2"]
+
+
+def _sorted(frame):
+    return frame.sort_values(KEYS).reset_index(drop=True)
+
+
+@pytest.mark.parametrize("item_based", [False, True])
+def test_streaming_matches_in_memory(tmp_path, item_based):
+    df = slot_tokens()
+    analyzer = CovaryingCollexemeAnalyzer()
+    expected = _sorted(analyzer.run(df, *KEYS, item_based=item_based))
+
+    chunks = [df.iloc[:2500], df.iloc[2500:4000], df.iloc[4000:]]
+    path = tmp_path / "tokens.tsv"
+    df.to_csv(path, sep="\t", index=False)
+    for source, options in ((chunks, {}),
+                            (path, {"chunksize": 1000, "sep": "\t"})):
+        result = analyzer.run_streaming(source, *KEYS, item_based=item_based,
+                                        **options)
+        pd.testing.assert_frame_equal(_sorted(result), expected,
+                                      check_dtype=False,
+                                      check_categorical=False)
+
+
+def test_streaming_parquet_needs_pyarrow(tmp_path):
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        with pytest.raises(ImportError, match="pyarrow"):
+            CovaryingCollexemeAnalyzer().run_streaming(
+                tmp_path / "tokens.parquet", *KEYS
+            )
+        return
+    df = slot_tokens()
+    df.to_parquet(tmp_path / "tokens.parquet")
+    result = CovaryingCollexemeAnalyzer().run_streaming(
+        tmp_path / "tokens.parquet", *KEYS, chunksize=1000
+    )
+    expected = CovaryingCollexemeAnalyzer().run(df, *KEYS)
+    pd.testing.assert_frame_equal(_sorted(result), _sorted(expected),
+                                  check_dtype=False, check_categorical=False)
+
+
+@pytest.mark.parametrize("item_based", [False, True])
+@pytest.mark.parametrize("signed", [False, True])
+def test_pruning_matches_head_of_full_result(item_based, signed):
+    df = slot_tokens(20000, seed=1)
+    analyzer = CovaryingCollexemeAnalyzer()
+    options = {"item_based": item_based, "signed_metrics": signed}
+    full = analyzer.run(df, *KEYS, **options)
+    for k in (1, 10, 100, 10**6):
+        pd.testing.assert_frame_equal(
+            analyzer.run(df, *KEYS, top_k=k, **options), full.head(k)
+        )
+    pd.testing.assert_frame_equal(
+        analyzer.run(df, *KEYS, min_llr=5.0, min_freq=2, **options),
+        full[(full["LLR"] >= 5.0) & (full["Freq"] >= 2)]
+    )
+    pruned = analyzer.run(df, *KEYS, top_k=50, min_freq=3, metrics=["PMI"],
+                          **options)
+    pd.testing.assert_frame_equal(
+        pruned, full[full["Freq"] >= 3].head(50)[pruned.columns]
+    )
+
+
+def test_item_based_matches_per_item_frames():
+    df = slot_tokens(2000)
+    result = CovaryingCollexemeAnalyzer().run(df, *KEYS, item_based=True)
+
+    # Frame of a slot-1 item: all tokens of the slot-2 items it occurs with
+    pairs = df.groupby(KEYS).size().rename("Freq").reset_index()
+    freq1 = df["WORD_SLOT1"].value_counts()
+    freq2 = df["WORD_SLOT2"].value_counts()
+    pairs["FREQOFSLOT2"] = freq2[pairs["WORD_SLOT2"]].to_numpy()
+    frames = pairs.groupby("WORD_SLOT1")["FREQOFSLOT2"].sum()
+
+    merged = result.merge(pairs, on=KEYS, suffixes=("", "_ref"))
+    assert len(merged) == len(pairs) == len(result)
+    np.testing.assert_array_equal(merged["Freq"], merged["Freq_ref"])
+    np.testing.assert_array_equal(merged["FRAMESIZE"],
+                                  frames[merged["WORD_SLOT1"]])
+    for row in merged.head(200).itertuples():
+        a = row.Freq
+        b = freq1[row.WORD_SLOT1] - a
+        c = row.FREQOFSLOT2 - a
+        d = row.FRAMESIZE - (a + b + c)
+        ref = AssociationStatsKernel.calculate_all_metrics(a, b, c, d)
+        for col in ("LLR", "PMI", "LOGODDSRATIO", "FYE"):
+            np.testing.assert_allclose(getattr(row, col), ref[col],
+                                       rtol=1e-9, atol=1e-10, err_msg=col)
+
+
+def test_item_based_rejects_total_corpus_size():
+    with pytest.raises(ValueError, match="item_based"):
+        CovaryingCollexemeAnalyzer().run(slot_tokens(100), *KEYS,
+                                         item_based=True,
+                                         total_corpus_size=10**6)
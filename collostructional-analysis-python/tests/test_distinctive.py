@@ -0,0 +1,81 @@
+"""Tests for DistinctiveCollexemeAnalyzer (multiple DCA paths)"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from core.collostructional_analysis import (
+    CollostructionalAnalysisMain,
+    DistinctiveCollexemeAnalyzer,
+)
+from tests.helpers import raw_tokens
+
+
+def _run(df, **kwargs):
+    return CollostructionalAnalysisMain.run(
+        df, analysis_type=2, construction_col="Construction", verbose=False,
+        **kwargs
+    )
+
+
+def test_sparse_mdca_matches_dense(monkeypatch):
+    df = raw_tokens(20000, consts=("a", "b", "c", "d", "e"))
+    dense = _run(df)
+    monkeypatch.setattr(DistinctiveCollexemeAnalyzer, "_DENSE_MAX_CELLS", 0)
+    sparse = _run(df)
+    pd.testing.assert_frame_equal(sparse, dense, rtol=1e-12)
+
+
+METRIC_COLS = ["LLR", "PEARSONRESID", "LOGODDSRATIO", "PMI", "DELTAPC2W",
+               "DELTAPW2C", "KLDC2W", "KLDW2C", "FYE"]
+
+
+def _two_way(df, first, second, signed):
+    """Two-way DCA of first vs second (categories fix the order)"""
+    df = df.assign(Construction=pd.Categorical(
+        df["Construction"], categories=[first, second]
+    ))
+    return _run(df, signed_metrics=signed)
+
+
+@pytest.mark.parametrize("signed", [False, True])
+@pytest.mark.parametrize("dense_max_cells", [1_000_000, 10])
+def test_pairwise_matches_two_way(monkeypatch, dense_max_cells, signed):
+    monkeypatch.setattr(DistinctiveCollexemeAnalyzer, "_DENSE_MAX_CELLS",
+                        dense_max_cells)
+    consts = ("a", "b", "c", "d")
+    df = raw_tokens(consts=consts)
+    result = _run(df, dca_mode="pairwise", signed_metrics=signed)
+
+    for i, first in enumerate(consts):
+        for second in consts[i + 1:]:
+            pair = df[df["Construction"].isin([first, second])]
+            ref = _two_way(pair, first, second, signed)
+            got = result[(result["CONSTRUCTION"] == first)
+                         & (result["OTHER"] == second)]
+            assert list(got["Verb"]) == list(ref["Verb"])
+            np.testing.assert_array_equal(got["FREQ_CONSTRUCTION"],
+                                          ref[first])
+            for col in METRIC_COLS:
+                np.testing.assert_array_equal(got[col], ref[col],
+                                              err_msg=col)
+
+
+@pytest.mark.parametrize("signed", [False, True])
+@pytest.mark.parametrize("dense_max_cells", [1_000_000, 10])
+def test_one_vs_rest_matches_two_way(monkeypatch, dense_max_cells, signed):
+    monkeypatch.setattr(DistinctiveCollexemeAnalyzer, "_DENSE_MAX_CELLS",
+                        dense_max_cells)
+    consts = ("a", "b", "c", "d")
+    df = raw_tokens(consts=consts)
+    result = _run(df, dca_mode="one_vs_rest", signed_metrics=signed)
+
+    for const in consts:
+        rest = df.assign(Construction=np.where(
+            df["Construction"] == const, const, "(rest)"
+        ))
+        ref = _two_way(rest, const, "(rest)", signed)
+        got = result[result["CONSTRUCTION"] == const]
+        assert list(got["Verb"]) == list(ref["Verb"])
+        for col in METRIC_COLS:
+            np.testing.assert_array_equal(got[col], ref[col], err_msg=col)
@@ -0,0 +1,65 @@
+"""Tests for IncrementalSimpleCollexemeAnalyzer"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from core.collostructional_analysis import (
+    IncrementalSimpleCollexemeAnalyzer,
+    SimpleCollexemeAnalyzer,
+)
+from tests.helpers import simple_df
+
+COLS = ("WORD", "FREQ_WORD_in_CORPUS", "FREQ_WORD_in_CONSTRUCTION")
+
+
+@pytest.mark.parametrize("signed", [False, True])
+@pytest.mark.parametrize("explicit_size", [False, True])
+def test_incremental_matches_cumulative_run(tmp_path, signed, explicit_size):
+    full = simple_df(600)
+    correction = full[full["FREQ_WORD_in_CONSTRUCTION"] > 0].head(2).copy()
+    correction["FREQ_WORD_in_CORPUS"] = 0
+    correction["FREQ_WORD_in_CONSTRUCTION"] = [1, -1]
+    batches = [full.iloc[:400], full.iloc[300:500], full.iloc[450:],
+               correction]
+
+    inc = IncrementalSimpleCollexemeAnalyzer(signed_metrics=signed,
+                                             verbose=False)
+    seen, size = [], 0
+    for batch in batches:
+        seen.append(batch)
+        delta = None
+        if explicit_size:
+            delta = int(batch["FREQ_WORD_in_CORPUS"].sum()) * 3
+            size += delta
+        result = inc.run_batch(batch, corpus_size_delta=delta)
+
+        cum = (pd.concat(seen).groupby("WORD", sort=False).sum()
+               .reset_index())
+        ref = SimpleCollexemeAnalyzer().run(
+            cum, *COLS, total_corpus_size=size if explicit_size else None,
+            signed_metrics=signed
+        )
+        pd.testing.assert_frame_equal(result.reset_index(drop=True),
+                                      ref.reset_index(drop=True))
+
+    path = str(tmp_path / "state.pkl")
+    inc.save(path)
+    loaded = IncrementalSimpleCollexemeAnalyzer.load(path)
+    pd.testing.assert_frame_equal(loaded.results(), result)
+
+
+def test_rejected_batch_leaves_state_unchanged():
+    inc = IncrementalSimpleCollexemeAnalyzer(verbose=False)
+    inc.update(simple_df(50), corpus_size_delta=1000)
+    counts = inc.counts.copy()
+
+    bad = simple_df(50).head(1).copy()
+    bad["FREQ_WORD_in_CONSTRUCTION"] = -10**9
+    with pytest.raises(ValueError, match="negative"):
+        inc.update(bad, corpus_size_delta=500)
+    with pytest.raises(ValueError, match="negative"):
+        inc.update(simple_df(50).head(0), corpus_size_delta=-10**9)
+
+    assert inc.total_corpus_size == 1000
+    pd.testing.assert_frame_equal(inc.counts, counts)
@@ -0,0 +1,47 @@
+"""Tests for file inputs and outputs of CollostructionalAnalysisMain.run"""
+
+import pandas as pd
+import pytest
+
+from core.collostructional_analysis import CollostructionalAnalysisMain
+from tests.helpers import raw_tokens, simple_df, slot_tokens
+
+CASES = {
+    1: (simple_df, {}),
+    2: (raw_tokens, {"construction_col": "Construction"}),
+    3: (slot_tokens, {}),
+}
+
+
+@pytest.mark.parametrize("analysis_type", [1, 2, 3])
+def test_path_input_matches_dataframe(tmp_path, analysis_type):
+    make, kwargs = CASES[analysis_type]
+    df = make()
+    source = tmp_path / "input.tsv"
+    df.to_csv(source, sep="\t", index=False)
+    output = tmp_path / "result.csv"
+
+    expected = CollostructionalAnalysisMain.run(
+        df, analysis_type=analysis_type, verbose=False, **kwargs
+    )
+    result = CollostructionalAnalysisMain.run(
+        str(source), analysis_type=analysis_type, read_kwargs={"sep": "\t"},
+        output_path=output, verbose=False, **kwargs
+    )
+    pd.testing.assert_frame_equal(result, expected)
+
+    # Written without the index
+    written = pd.read_csv(output)
+    assert list(written.columns) == list(expected.columns)
+    pd.testing.assert_frame_equal(
+        written, expected.reset_index(drop=True), check_dtype=False,
+        check_categorical=False, rtol=1e-12
+    )
+
+
+def test_output_rejects_feather(tmp_path):
+    with pytest.raises(ValueError, match="Parquet"):
+        CollostructionalAnalysisMain.run(
+            simple_df(), analysis_type=1,
+            output_path=tmp_path / "result.feather", verbose=False
+        )
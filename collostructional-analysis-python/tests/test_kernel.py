@@ -0,0 +1,197 @@
+"""Tests for AssociationStatsKernel (batch engines vs scalar reference)"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from core.collostructional_analysis import (
+    AssociationStatsKernel,
+    CollostructionalAnalysisMain,
+)
+
+
+def _tables(n=1500, seed=7):
+    rng = np.random.default_rng(seed)
+    cells = rng.integers(0, 8, (n, 4)) * rng.choice([1, 3, 10, 100, 1000],
+                                                   (n, 4))
+    edge = [(0, 0, 0, 5), (3, 0, 0, 0), (0, 3, 0, 0), (2, 0, 0, 3),
+            (1, 1, 1, 1), (5, 5, 5, 5), (1, 0, 0, 1), (0, 1, 1, 0),
+            (1, 9, 9, 81), (3, 0, 4, 10**6), (10**4, 1, 1, 10**6),
+            (500, 20, 300, 138000), (1, 2000, 300, 138000)]
+    cells = np.vstack([cells, edge])
+    # Drop empty tables (the scalar path divides by N = 0)
+    return cells[cells.sum(axis=1) > 0].T
+
+
+@pytest.mark.parametrize("signed", [False, True])
+@pytest.mark.parametrize("total", [None, 5_000_000])
+def test_batch_matches_row_by_row(signed, total):
+    a, b, c, d = _tables(400)
+    batch = AssociationStatsKernel.calculate_all_metrics_batch(
+        a, b, c, d, total_corpus_size=total, signed_metrics=signed
+    )
+    with np.errstate(all='ignore'):
+        rows = pd.DataFrame([
+            AssociationStatsKernel.calculate_all_metrics(
+                *cells, total_corpus_size=total, signed_metrics=signed
+            )
+            for cells in zip(a, b, c, d)
+        ])
+
+    assert list(batch) == list(rows.columns)
+    for col in rows.columns:
+        got, ref = np.asarray(batch[col]), rows[col].to_numpy()
+        if col == "Direction":
+            assert (got.astype(str) == ref.astype(str)).all()
+        else:
+            # atol: FYE of tables with p ~ 1 (rounding noise vs 0.0)
+            np.testing.assert_allclose(
+                got.astype(float), ref.astype(float), rtol=1e-9, atol=1e-10,
+                err_msg=col
+            )
+
+
+@pytest.mark.parametrize("mask_method", ["distance", "probability"])
+def test_fisher_batch_matches_custom(mask_method):
+    a, b, c, d = _tables()
+    batch = AssociationStatsKernel.calculate_fisher_p_batch(
+        a, b, c, d, mask_method=mask_method
+    )
+    scalar = np.array([
+        AssociationStatsKernel.calculate_fisher_p_custom(
+            *cells, mask_method=mask_method
+        )
+        for cells in zip(a, b, c, d)
+    ])
+    np.testing.assert_allclose(batch, scalar, rtol=1e-9, atol=0)
+
+
+# R: p.adjust(c(0.01, 0.04, 0.03, 0.005, 0.2, NA, 0.04), method)
+_P = np.array([0.01, 0.04, 0.03, 0.005, 0.2, np.nan, 0.04])
+_P_ADJUSTED = {
+    "holm": [0.05, 0.12, 0.12, 0.03, 0.2, np.nan, 0.12],
+    "BH": [0.03, 0.048, 0.048, 0.03, 0.2, np.nan, 0.048],
+    "BY": [0.0735, 0.1176, 0.1176, 0.0735, 0.49, np.nan, 0.1176],
+}
+
+
+@pytest.mark.parametrize("method", ["holm", "BH", "BY"])
+def test_adjust_log10_p_matches_r(method):
+    adjusted = AssociationStatsKernel.adjust_log10_p(np.log10(_P),
+                                                     methods=[method])
+    np.testing.assert_allclose(10 ** adjusted[method], _P_ADJUSTED[method],
+                               rtol=1e-12)
+
+
+def test_adjust_log10_p_caps_at_one():
+    # R: p.adjust(c(0.5, 0.6), "holm") -> 1 1
+    adjusted = AssociationStatsKernel.adjust_log10_p(np.log10([0.5, 0.6]),
+                                                     methods="holm")
+    np.testing.assert_array_equal(adjusted["holm"], [0.0, 0.0])
+
+
+def test_adjust_log10_p_keeps_underflowing_p():
+    # 10**-400 is 0.0 in float64; the log-space correction keeps it
+    adjusted = AssociationStatsKernel.adjust_log10_p(
+        np.array([-400.0, -300.0]), methods="BH"
+    )
+    np.testing.assert_allclose(adjusted["BH"],
+                               [-400 + np.log10(2), -300.0], rtol=1e-12)
+
+
+def test_adjust_p_values_keeps_fye_sign():
+    result = pd.DataFrame({"FYE": [-np.log10(0.01), np.log10(0.04), 0.0]})
+    adjusted = CollostructionalAnalysisMain.adjust_p_values(result,
+                                                            methods=["BH"])
+    np.testing.assert_allclose(adjusted["FYE_BH"],
+                               [-np.log10(0.03), np.log10(0.06), 0.0],
+                               rtol=1e-12)
+    assert not np.signbit(adjusted["FYE_BH"].iloc[2])
+
+
+def test_fisher_p_one_gives_positive_zero_fye():
+    # (1, 9, 9, 81) is exactly independent: p = 1, FYE = 0.0 (not -0.0)
+    batch = AssociationStatsKernel.calculate_all_metrics_batch(
+        [1], [9], [9], [81]
+    )
+    row = AssociationStatsKernel.calculate_all_metrics(1, 9, 9, 81)
+    for fye in (np.asarray(batch["FYE"])[0], row["FYE"]):
+        assert fye == 0.0
+        assert not np.signbit(fye)
+
+
+@pytest.mark.parametrize("total", [None, 5_000_000])
+def test_validate_fused_numpy(total):
+    a, b, c, d = _tables()
+    differences = AssociationStatsKernel.validate_fused(
+        a, b, c, d, total_corpus_size=total, backend="numpy"
+    )
+    assert set(differences) == {"LLR", "PMI", "KLDC2W", "KLDW2C"}
+    for key, diff in differences.items():
+        assert diff < 1e-12, key
+
+
+def test_fused_unknown_backend():
+    a, b, c, d = _tables(10)
+    with pytest.raises(ValueError, match="Unknown backend"):
+        AssociationStatsKernel.validate_fused(a, b, c, d, backend="cuda")
+
+
+def _small_tables(n=200, seed=1):
+    rng = np.random.default_rng(seed)
+    return (rng.integers(0, 60, n), rng.integers(0, 300, n),
+            rng.integers(0, 300, n), rng.integers(0, 5000, n))
+
+
+@pytest.mark.parametrize("mask_method", ["distance", "probability"])
+def test_fisher_precise_backends_agree(mask_method):
+    a, b, c, d = _small_tables()
+    exact, mp = (np.array([
+        AssociationStatsKernel.calculate_fisher_p_precise(
+            *cells, mask_method=mask_method, backend=backend
+        )
+        for cells in zip(a, b, c, d)
+    ]) for backend in ("exact", "mpmath"))
+    np.testing.assert_allclose(mp, exact, rtol=1e-12, atol=1e-14)
+
+    # The float engine agrees wherever it does not flag a near-tie
+    fast = AssociationStatsKernel.calculate_fisher_p_batch(
+        a, b, c, d, mask_method, log10=True
+    )
+    risky = AssociationStatsKernel.fisher_risky_rows(a, b, c, d, mask_method)
+    np.testing.assert_allclose(fast[~risky], exact[~risky], rtol=1e-9,
+                               atol=1e-11)
+
+
+def test_fisher_exact_above_max_n_warns(monkeypatch):
+    monkeypatch.setattr(AssociationStatsKernel, "FISHER_EXACT_MAX_N", 100)
+    cells = (30, 20, 25, 400)
+    with pytest.warns(RuntimeWarning, match="FISHER_EXACT_MAX_N"):
+        got = AssociationStatsKernel.calculate_fisher_p_precise(
+            *cells, backend="exact"
+        )
+    # mpmath is installed here: the fallback gives its result
+    assert got == AssociationStatsKernel.calculate_fisher_p_precise(
+        *cells, backend="mpmath"
+    )
+
+
+def test_fisher_precise_batch_refines_risky_rows_only():
+    # (22, 186, 299, 2061) has a distance near-tie at the region edge
+    a, b, c, d = (np.append(x, extra) for x, extra in zip(
+        _small_tables(), (22, 186, 299, 2061)
+    ))
+    risky = AssociationStatsKernel.fisher_risky_rows(a, b, c, d)
+    assert risky[-1]
+    fast = AssociationStatsKernel.calculate_fisher_p_batch(a, b, c, d,
+                                                           log10=True)
+    precise = AssociationStatsKernel.calculate_fisher_p_batch(
+        a, b, c, d, log10=True, precision="precise"
+    )
+    np.testing.assert_array_equal(precise[~risky], fast[~risky])
+    for i in np.flatnonzero(risky):
+        assert precise[i] == pytest.approx(
+            AssociationStatsKernel.calculate_fisher_p_precise(
+                a[i], b[i], c[i], d[i]
+            ), rel=1e-12
+        )
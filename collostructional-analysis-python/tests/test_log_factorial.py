@@ -0,0 +1,45 @@
+"""Tests for LogFactorialTable (in-memory and memory-mapped)"""
+
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+from scipy.special import gammaln
+
+from core.collostructional_analysis import LogFactorialTable
+
+
+def _grow(path, max_k):
+    table = LogFactorialTable(mmap_path=path)
+    table.ensure(max_k)
+    return len(table)
+
+
+def test_values_and_hit_counts():
+    table = LogFactorialTable(max_entries=1000)
+    k = np.array([0, 1, 5, 999, 5000])
+    np.testing.assert_allclose(table(k), gammaln(k + 1.0), rtol=1e-14)
+    # Growth happens first: only the argument beyond the cap misses
+    assert (table.hits, table.misses) == (4, 1)
+    assert len(table) == 1000
+
+
+def test_mmap_table_reused_across_instances(tmp_path):
+    path = str(tmp_path / "logfact.bin")
+    first = LogFactorialTable(mmap_path=path)
+    first.ensure(5000)
+    second = LogFactorialTable(mmap_path=path)
+    assert len(second) == len(first) >= 5001
+    k = np.arange(5001)
+    np.testing.assert_array_equal(second(k), gammaln(k + 1.0))
+
+
+def test_mmap_concurrent_growth(tmp_path):
+    path = str(tmp_path / "logfact.bin")
+    sizes = [200_000, 900_000, 50_000, 600_000, 1_500_000, 300_000]
+    with ProcessPoolExecutor(max_workers=4) as pool:
+        list(pool.map(_grow, [path] * len(sizes), sizes))
+
+    table = LogFactorialTable(mmap_path=path)
+    assert len(table) >= max(sizes) + 1
+    k = np.arange(len(table))
+    np.testing.assert_array_equal(table(k), gammaln(k + 1.0))
@@ -0,0 +1,51 @@
+"""Tests for metrics=... (selected columns and fallback sort order)"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from core.collostructional_analysis import CollostructionalAnalysisMain
+from tests.helpers import raw_tokens, simple_df, slot_tokens
+
+
+def _run(df, analysis_type, **kwargs):
+    return CollostructionalAnalysisMain.run(
+        df, analysis_type=analysis_type, verbose=False, **kwargs
+    )
+
+
+@pytest.mark.parametrize("analysis_type, make_df, options", [
+    (1, simple_df, {"total_corpus_size": 10**6}),
+    (2, raw_tokens, {}),
+    (3, slot_tokens, {}),
+])
+@pytest.mark.parametrize("metrics", [["PMI", "LLR"], ["FYE"], ["DELTAP"]])
+def test_selected_columns_match_full_run(analysis_type, make_df, options,
+                                         metrics):
+    df = make_df()
+    full = _run(df, analysis_type, **options)
+    subset = _run(df, analysis_type, metrics=metrics, **options)
+    assert set(subset.columns) < set(full.columns)
+    # Compared by the leading (label) columns: the fallback sort column
+    # may differ
+    key = list(subset.columns[:2])
+    pd.testing.assert_frame_equal(
+        subset.sort_values(key).reset_index(drop=True),
+        full[subset.columns].sort_values(key).reset_index(drop=True)
+    )
+
+
+@pytest.mark.parametrize("analysis_type, make_df, options", [
+    (1, simple_df, {"total_corpus_size": 10**6}),
+    (2, raw_tokens, {}),
+])
+def test_pmi_only_ranks_never_occurring_pairs_last(analysis_type, make_df,
+                                                   options):
+    result = _run(make_df(), analysis_type, metrics=["PMI"],
+                  signed_metrics=True, **options)
+    pmi = result["PMI"].to_numpy()
+    finite = np.isfinite(pmi)
+    assert (~finite).any()
+    # All -inf rows after the finite ones, which are sorted by |PMI|
+    assert not finite[np.argmin(finite):].any()
+    assert (np.diff(np.abs(pmi[finite])) <= 0).all()
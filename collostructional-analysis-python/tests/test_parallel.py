@@ -0,0 +1,87 @@
+"""Tests for n_jobs > 1 (process-pool chunks vs the serial run)"""
+
+import functools
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+import pytest
+from scipy.special import gammaln
+
+import core.collostructional_analysis as ca
+from core.collostructional_analysis import (
+    AssociationStatsKernel,
+    CollexemeAnalyzer,
+    CollostructionalAnalysisMain,
+    LogFactorialTable,
+)
+from tests.helpers import raw_tokens, simple_df, slot_tokens
+
+
+def _run(df, analysis_type, **kwargs):
+    return CollostructionalAnalysisMain.run(
+        df, analysis_type=analysis_type, verbose=False, **kwargs
+    )
+
+
+@pytest.fixture(autouse=True)
+def small_parallel_threshold(monkeypatch):
+    monkeypatch.setattr(CollexemeAnalyzer, "_PARALLEL_MIN_ROWS", 10)
+
+
+@pytest.fixture
+def spawn_workers(monkeypatch):
+    """Workers that inherit no class-level state from the parent"""
+    monkeypatch.setattr(ca, "ProcessPoolExecutor", functools.partial(
+        ProcessPoolExecutor, mp_context=multiprocessing.get_context("spawn")
+    ))
+
+
+@pytest.mark.parametrize("analysis_type, make_df", [
+    (1, simple_df), (2, raw_tokens), (3, slot_tokens)
+])
+def test_parallel_matches_serial(analysis_type, make_df):
+    df = make_df()
+    pd.testing.assert_frame_equal(
+        _run(df, analysis_type, n_jobs=2), _run(df, analysis_type)
+    )
+
+
+def test_mmap_table_with_workers(tmp_path, monkeypatch):
+    # Workers used to grow the shared file concurrently and corrupt it
+    df = simple_df(3000, seed=5)
+    options = {"total_corpus_size": 3_000_000}
+    serial = _run(df, 1, **options)
+
+    path = str(tmp_path / "logfact.bin")
+    monkeypatch.setattr(AssociationStatsKernel, "log_factorial_table",
+                        LogFactorialTable(mmap_path=path))
+    parallel = _run(df, 1, n_jobs=4, **options)
+    pd.testing.assert_frame_equal(parallel, serial)
+
+    table = LogFactorialTable(mmap_path=path)
+    assert len(table) > options["total_corpus_size"]
+    k = np.arange(len(table))
+    np.testing.assert_array_equal(table(k), gammaln(k + 1.0))
+
+
+def test_spawned_workers_match_serial(spawn_workers, monkeypatch):
+    monkeypatch.setattr(AssociationStatsKernel, "fisher_precision",
+                        "precise")
+    df = simple_df()
+    pd.testing.assert_frame_equal(_run(df, 1, n_jobs=2), _run(df, 1))
+
+
+def test_spawned_workers_apply_kernel_settings(spawn_workers, monkeypatch):
+    try:
+        import numba  # noqa: F401
+    except ImportError:
+        pass
+    else:
+        pytest.skip("needs an environment without numba")
+    monkeypatch.setattr(AssociationStatsKernel, "fused_backend", "numba")
+    with pytest.raises(ImportError, match="numba"):
+        _run(simple_df(), 1)
+    with pytest.raises(ImportError, match="numba"):
+        _run(simple_df(), 1, n_jobs=2)
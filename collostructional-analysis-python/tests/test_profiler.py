@@ -0,0 +1,70 @@
+"""Tests for RunProfiler and the verbose switch of run"""
+
+import threading
+
+import pandas as pd
+
+from core.collostructional_analysis import (
+    CollostructionalAnalysisMain,
+    RunProfiler,
+)
+from tests.helpers import raw_tokens, simple_df
+
+
+def test_stage_records():
+    profiler = RunProfiler(track_memory=True)
+    result = CollostructionalAnalysisMain.run(
+        simple_df(), analysis_type=1, profiler=profiler, p_adjust=["BH"],
+        verbose=False
+    )
+    report = profiler.report()
+    assert list(report.columns) == ["stage", "parent", "seconds", "rows",
+                                    "peak_mb"]
+    stages = set(report["stage"])
+    assert {"total", "kernel", "fisher", "p_adjust"} <= stages
+    total = report[report["stage"] == "total"].iloc[0]
+    assert pd.isna(total["parent"]) and total["rows"] == len(result)
+    assert (report[report["stage"] == "fisher"]["parent"] == "kernel").all()
+    assert (report["peak_mb"].dropna() >= 0).all()
+    assert profiler.summary().index[0] == "total"
+
+
+def test_callback_receives_records(capsys):
+    seen = []
+    CollostructionalAnalysisMain.run(
+        raw_tokens(consts=("a", "b", "c")), analysis_type=2,
+        construction_col="Construction", dca_mode="pairwise",
+        profiler=seen.append, verbose=False
+    )
+    assert seen[-1]["stage"] == "total"
+    assert "kernel" in [record["stage"] for record in seen]
+    assert capsys.readouterr().out == ""
+
+
+def test_verbose_false_keeps_caller_output(capsys):
+    def callback(record):
+        print("stage", record["stage"])
+
+    print("before")
+    CollostructionalAnalysisMain.run(simple_df(), analysis_type=1,
+                                     profiler=callback, verbose=False)
+    lines = capsys.readouterr().out.splitlines()
+    assert lines[0] == "before"
+    assert all(line.startswith("stage ") for line in lines[1:])
+    assert lines[-1] == "stage total"
+
+    CollostructionalAnalysisMain.run(simple_df(), analysis_type=1)
+    assert "CollostructionalAnalysisMain" in capsys.readouterr().out
+
+
+def test_profiler_is_context_local():
+    # A run in another thread during a profiled session is not recorded
+    profiler = RunProfiler()
+    with profiler.session():
+        thread = threading.Thread(
+            target=CollostructionalAnalysisMain.run,
+            args=(simple_df(),), kwargs={"analysis_type": 1, "verbose": False}
+        )
+        thread.start()
+        thread.join()
+    assert profiler.records == []
@@ -0,0 +1,65 @@
+"""Tests for core.resampling (bootstrap CIs and permutation tests)"""
+
+import numpy as np
+from scipy.stats import hypergeom
+
+from core import resampling
+from core.resampling import bootstrap_ci, permutation_test
+
+
+def test_permutation_zero_cell_tables():
+    # Observed PMI / log odds are -inf (a = 0): nearly every null
+    # replicate is at least as extreme, so p is close to P(a = 0)
+    a, b, c, d = (np.array(x) for x in ([0, 0], [5, 50], [3, 30],
+                                        [1000, 1000]))
+    result = permutation_test(a, b, c, d, metrics=["PMI", "LOGODDSRATIO"],
+                              n_perm=999, seed=1)
+    expected = hypergeom.pmf(0, a + b + c + d, a + c, a + b)
+    for col in ("PMI_perm_p", "LOGODDSRATIO_perm_p"):
+        assert np.allclose(result[col], expected, atol=0.05)
+    assert result["PMI_perm_p"].iloc[0] > 0.9
+
+
+def test_permutation_perfect_separation():
+    # Log odds +inf for (5, 0, 0, 5); only a = 5 (p = 1/252) is as extreme
+    result = permutation_test([5], [0], [0], [5], metrics=["LOGODDSRATIO"],
+                              n_perm=9999, seed=1)
+    p = result["LOGODDSRATIO_perm_p"].iloc[0]
+    assert 0.002 < p < 0.008
+
+
+def test_permutation_seed_reproducible():
+    args = ([3, 10, 0], [20, 5, 7], [8, 2, 9], [500, 300, 40])
+    first = permutation_test(*args, n_perm=200, seed=7)
+    second = permutation_test(*args, n_perm=200, seed=7)
+    assert first.equals(second)
+
+
+def test_bootstrap_ci_contains_observed():
+    args = ([30, 5, 200], [70, 40, 100], [50, 3, 400], [10000, 900, 5000])
+    result = bootstrap_ci(*args, metrics=["LLR", "DELTAP"], n_boot=500,
+                          seed=3)
+    for col in ("LLR", "DELTAPC2W", "DELTAPW2C"):
+        assert (result[f"{col}_CI_Lower"] <= result[col]).all()
+        assert (result[col] <= result[f"{col}_CI_Upper"]).all()
+        assert (result[f"{col}_CI_Lower"] < result[f"{col}_CI_Upper"]).all()
+
+
+def test_bootstrap_ci_seed_reproducible(monkeypatch):
+    # Two tables per chunk: results depend on the seed, not on n_jobs
+    monkeypatch.setattr(resampling, "_MAX_REPLICATES_PER_CHUNK", 400)
+    args = ([3, 10, 0], [20, 5, 7], [8, 2, 9], [500, 300, 40])
+    first = bootstrap_ci(*args, n_boot=200, seed=7)
+    second = bootstrap_ci(*args, n_boot=200, seed=7, n_jobs=2)
+    assert first.equals(second)
+    assert not first.equals(bootstrap_ci(*args, n_boot=200, seed=8))
+
+
+def test_empty_input_returns_empty_frames():
+    ci = bootstrap_ci([], [], [], [], metrics=["LLR", "PMI"], seed=1)
+    assert list(ci.columns) == ["LLR", "LLR_CI_Lower", "LLR_CI_Upper",
+                                "PMI", "PMI_CI_Lower", "PMI_CI_Upper"]
+    assert len(ci) == 0
+    perm = permutation_test([], [], [], [], metrics=["LLR"], seed=1)
+    assert list(perm.columns) == ["LLR_perm_p"]
+    assert len(perm) == 0